@@ -1,6 +1,10 @@
+import argparse
 import gc
 import os
+import signal
 import sys
+import threading
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import Dict
@@ -9,18 +13,26 @@ from typing import Optional
 
 from yt_dlp.utils import sanitize_filename
 
+from ytdl_sub.cli.output_summary import SubscriptionSummary
 from ytdl_sub.cli.output_summary import output_summary
 from ytdl_sub.cli.output_transaction_log import _maybe_validate_transaction_log_file
+from ytdl_sub.cli.output_transaction_log import append_transaction_log
 from ytdl_sub.cli.output_transaction_log import output_transaction_log
 from ytdl_sub.cli.parsers.dl import DownloadArgsParser
 from ytdl_sub.cli.parsers.main import DEFAULT_CONFIG_FILE_NAME
 from ytdl_sub.cli.parsers.main import parser
 from ytdl_sub.config.config_file import ConfigFile
+from ytdl_sub.downloaders.parent_metadata_cache import ParentMetadataCache
 from ytdl_sub.subscriptions.subscription import Subscription
+from ytdl_sub.subscriptions.subscription_daemon import SubscriptionDaemon
+from ytdl_sub.subscriptions.subscription_scheduler import SubscriptionScheduler
 from ytdl_sub.utils.exceptions import ExperimentalFeatureNotEnabled
 from ytdl_sub.utils.exceptions import ValidationException
+from ytdl_sub.utils.ffmpeg import FFMPEG
 from ytdl_sub.utils.file_handler import FileHandler
 from ytdl_sub.utils.file_lock import working_directory_lock
+from ytdl_sub.utils.http_pool import HttpSessionPool
+from ytdl_sub.utils.lease import LeaseDirectory
 from ytdl_sub.utils.logger import Logger
 
 logger = Logger.get()
@@ -67,6 +79,95 @@ def _maybe_write_subscription_log_file(
     FileHandler.copy(Logger.debug_log_filename(), persist_log_path)
 
 
+def _filter_due_subscriptions(
+    scheduler: SubscriptionScheduler, subscriptions: List[Subscription]
+) -> List[Subscription]:
+    due_subscriptions: List[Subscription] = []
+    for subscription in subscriptions:
+        seconds_until_due = scheduler.seconds_until_due(
+            subscription_name=subscription.name, mapping=subscription.download_archive.mapping
+        )
+        if seconds_until_due > 0:
+            logger.info(
+                "Skipping subscription %s, next check is due in %s",
+                subscription.name,
+                SubscriptionScheduler.format_duration(seconds_until_due),
+            )
+            continue
+
+        due_subscriptions.append(subscription)
+
+    logger.info(
+        "%d of %d subscriptions are due to be checked", len(due_subscriptions), len(subscriptions)
+    )
+    return due_subscriptions
+
+
+def _lease_directory(config: ConfigFile) -> Optional[LeaseDirectory]:
+    if not (distributed := config.config_options.distributed):
+        return None
+
+    return LeaseDirectory(
+        directory=distributed.lease_directory,
+        lease_timeout_sec=distributed.lease_timeout,
+        worker_id=distributed.worker_id,
+    )
+
+
+def _run_subscription(
+    config: ConfigFile,
+    subscription: Subscription,
+    update_with_info_json: bool,
+    dry_run: bool,
+    leases: Optional[LeaseDirectory] = None,
+) -> bool:
+    """
+    Downloads a single subscription. Exceptions are stored in the subscription.
+
+    Returns
+    -------
+    False if the subscription was skipped because another worker holds its lease
+    """
+    # Leasing is part of the subscription's run, so a subscription whose lease keys can not be
+    # computed or claimed fails instead of running without them or aborting every subscription
+    with subscription.exception_handling():
+        # Dry runs do not write anything, so they do not need to keep other workers out
+        lease_keys: List[str] = []
+        if leases and not dry_run:
+            lease_keys = [
+                f"subscription:{subscription.name}",
+                f"output_directory:{os.path.realpath(subscription.output_directory)}",
+            ]
+
+        with leases.claim(lease_keys) if lease_keys else nullcontext(True) as is_claimed:
+            if not is_claimed:
+                return False
+
+            logger.info(
+                "Beginning subscription %s for %s",
+                ("dry run" if dry_run else "download"),
+                subscription.name,
+            )
+            # Only dump the subscription when asked for debug logs, it is slow for large presets
+            if Logger.is_debug():
+                logger.debug("Subscription full yaml:\n%s", subscription.as_yaml())
+
+            if update_with_info_json:
+                subscription.update_with_info_json(dry_run=dry_run)
+            else:
+                subscription.download(dry_run=dry_run)
+
+    _maybe_write_subscription_log_file(
+        config=config,
+        subscription=subscription,
+        dry_run=dry_run,
+        exception=subscription.exception,
+    )
+
+    Logger.cleanup(has_error=False)
+    return True
+
+
 def _download_subscriptions_from_yaml_files(
     config: ConfigFile,
     subscription_paths: List[str],
@@ -74,9 +175,16 @@ def _download_subscriptions_from_yaml_files(
     subscription_override_dict: Dict,
     update_with_info_json: bool,
     dry_run: bool,
-) -> List[Subscription]:
+    scheduled: bool = False,
+    transaction_log_file_path: Optional[str] = None,
+    suppress_transaction_log: bool = False,
+) -> List[SubscriptionSummary]:
     """
-    Downloads all subscriptions from one or many subscription yaml files.
+    Downloads all subscriptions from one or many subscription yaml files. Each subscription's
+    transaction log is output as soon as it finishes, and only its summary is kept so its state
+    can be garbage collected before the next subscription starts. Every subscription is still
+    built up front to validate them all before downloading, so memory at startup grows with the
+    number of subscriptions.
 
     Parameters
     ----------
@@ -90,52 +198,131 @@ def _download_subscriptions_from_yaml_files(
         Whether to actually download or update using existing info json
     dry_run
         Whether to dry run or not
+    scheduled
+        Optional. Only download subscriptions that are due to be checked
+    transaction_log_file_path
+        Optional. File to append the transaction logs to instead of printing them
+    suppress_transaction_log
+        Optional. Do not output the transaction logs
 
     Returns
     -------
-    List of subscriptions processed
+    Summaries of the subscriptions processed
 
     Raises
     ------
     Exception
         Any exception during download
     """
-    subscriptions: List[Subscription] = []
-
     # Load all the subscriptions first to perform all validation before downloading
-    for path in subscription_paths:
-        subscriptions += Subscription.from_file_path(
-            config=config,
-            subscription_path=path,
-            subscription_matches=subscription_matches,
-            subscription_override_dict=subscription_override_dict,
-        )
+    subscriptions: List[Subscription] = Subscription.from_file_paths(
+        config=config,
+        subscription_paths=subscription_paths,
+        subscription_matches=subscription_matches,
+        subscription_override_dict=subscription_override_dict,
+    )
 
-    for subscription in subscriptions:
-        with subscription.exception_handling():
-            logger.info(
-                "Beginning subscription %s for %s",
-                ("dry run" if dry_run else "download"),
-                subscription.name,
-            )
-            logger.debug("Subscription full yaml:\n%s", subscription.as_yaml())
+    scheduler: Optional[SubscriptionScheduler] = None
+    if scheduled:
+        scheduler = SubscriptionScheduler(
+            state_file_path=str(Path(config.config_options.cache_directory) / "schedule.json")
+        )
+        subscriptions = _filter_due_subscriptions(scheduler=scheduler, subscriptions=subscriptions)
 
-            if update_with_info_json:
-                subscription.update_with_info_json(dry_run=dry_run)
-            else:
-                subscription.download(dry_run=dry_run)
+    leases = _lease_directory(config)
+    summaries: List[SubscriptionSummary] = []
 
-        _maybe_write_subscription_log_file(
+    # Pop each subscription so the list does not keep it alive once it is processed
+    subscriptions.reverse()
+    while subscriptions:
+        subscription = subscriptions.pop()
+        if _run_subscription(
             config=config,
             subscription=subscription,
+            update_with_info_json=update_with_info_json,
             dry_run=dry_run,
-            exception=subscription.exception,
-        )
+            leases=leases,
+        ):
+            # Failed subscriptions stay due so they are retried on the next scheduled run
+            if scheduler and not dry_run and subscription.exception is None:
+                scheduler.mark_checked(subscription_name=subscription.name)
+
+            if not suppress_transaction_log:
+                append_transaction_log(
+                    subscription=subscription,
+                    transaction_log_file_path=transaction_log_file_path,
+                )
+            summaries.append(SubscriptionSummary.from_subscription(subscription))
 
-        Logger.cleanup(has_error=False)
+        del subscription
         gc.collect()  # Garbage collect after each subscription download
 
-    return subscriptions
+    return summaries
+
+
+def _run_daemon(
+    daemon: SubscriptionDaemon,
+    dry_run: bool,
+    transaction_log_file_path: Optional[str],
+    suppress_transaction_log: bool,
+) -> None:
+    """
+    Runs due and triggered subscriptions until receiving SIGINT or SIGTERM. The transaction log
+    and summary are output after each batch of subscriptions.
+    """
+    stop = threading.Event()
+
+    def _stop(signum: int, _) -> None:
+        logger.info("Received signal %d, stopping after the current subscription", signum)
+        stop.set()
+
+    previous_handlers = {sig: signal.signal(sig, _stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+    logger.info("Daemon started with %d subscriptions", len(daemon.subscriptions))
+
+    try:
+        while not stop.is_set():
+            daemon.reload()
+
+            subscriptions: List[Subscription] = []
+            leases = _lease_directory(daemon.config)
+            for subscription in daemon.due_subscriptions():
+                if stop.is_set():
+                    break
+
+                if not _run_subscription(
+                    config=daemon.config,
+                    subscription=subscription,
+                    update_with_info_json=False,
+                    dry_run=dry_run,
+                    leases=leases,
+                ):
+                    daemon.mark_skipped(subscription=subscription)
+                    continue
+
+                daemon.mark_run(subscription=subscription, dry_run=dry_run)
+                subscriptions.append(subscription)
+                gc.collect()  # Garbage collect after each subscription download
+
+            if subscriptions:
+                if not suppress_transaction_log:
+                    output_transaction_log(
+                        subscriptions=subscriptions,
+                        transaction_log_file_path=transaction_log_file_path,
+                    )
+                output_summary(subscriptions)
+
+                # Start the next batch with fresh per-run state
+                FFMPEG.log_timing_report()
+                FFMPEG.clear_run_timings()
+                ParentMetadataCache.reset()
+                HttpSessionPool.close()
+
+            stop.wait(daemon.POLL_INTERVAL_SEC)
+    finally:
+        for sig, previous_handler in previous_handlers.items():
+            signal.signal(sig, previous_handler)
+
+    logger.info("Daemon stopped")
 
 
 def _download_subscription_from_cli(
@@ -195,7 +382,95 @@ def _view_url_from_cli(config: ConfigFile, url: str, split_chapters: bool) -> Su
     return subscription
 
 
-def main() -> List[Subscription]:
+def _validate_from_cli(config: ConfigFile, args: argparse.Namespace) -> None:
+    logger.info("Validating subscriptions...")
+    subscriptions = Subscription.from_file_paths(
+        config=config,
+        subscription_paths=args.subscription_paths,
+        subscription_matches=args.match,
+    )
+    logger.info("Validated %d subscriptions", len(subscriptions))
+
+
+def _daemon_from_cli(config: ConfigFile, args: argparse.Namespace) -> None:
+    if not config.config_options.cache_directory:
+        raise ValidationException(
+            "daemon stores its schedule and triggers in configuration.cache_directory, which "
+            "must not be empty"
+        )
+
+    # Triggering a running daemon does not need the working directory lock it holds
+    if args.trigger:
+        for subscription_name in args.trigger:
+            SubscriptionDaemon.trigger(config=config, subscription_name=subscription_name)
+            logger.info("Triggered subscription %s", subscription_name)
+        return
+
+    # If transaction log file is specified, make sure we can open it
+    _maybe_validate_transaction_log_file(transaction_log_file_path=args.transaction_log)
+
+    with working_directory_lock(config=config):
+        config_path: Optional[str] = args.config
+        if not config_path and os.path.isfile(DEFAULT_CONFIG_FILE_NAME):
+            config_path = DEFAULT_CONFIG_FILE_NAME
+
+        logger.info("Validating subscriptions...")
+        daemon = SubscriptionDaemon(
+            config=config,
+            config_path=config_path,
+            subscription_paths=args.subscription_paths,
+            subscription_matches=args.match,
+        )
+        _run_daemon(
+            daemon=daemon,
+            dry_run=args.dry_run,
+            transaction_log_file_path=args.transaction_log,
+            suppress_transaction_log=args.suppress_transaction_log,
+        )
+
+
+def _sub_from_cli(
+    config: ConfigFile, args: argparse.Namespace
+) -> List[Subscription | SubscriptionSummary]:
+    if (
+        args.update_with_info_json
+        and not config.config_options.experimental.enable_update_with_info_json
+    ):
+        raise ExperimentalFeatureNotEnabled(
+            "--update-with-info-json requires setting"
+            " configuration.experimental.enable_update_with_info_json to True. This"
+            " feature is ",
+            "still being tested and has the ability to destroy files. Ensure you have a ",
+            "full backup before usage. You have been warned!",
+        )
+
+    if args.scheduled and not config.config_options.cache_directory:
+        raise ValidationException(
+            "--scheduled stores when subscriptions were last checked in"
+            " configuration.cache_directory, which must not be empty"
+        )
+
+    subscription_override_dict = {}
+    if args.dl_override:
+        subscription_override_dict = DownloadArgsParser.from_dl_override(
+            override=args.dl_override, config=config
+        ).to_subscription_dict()
+
+    logger.info("Validating subscriptions...")
+    return _download_subscriptions_from_yaml_files(
+        config=config,
+        subscription_paths=args.subscription_paths,
+        subscription_matches=args.match,
+        subscription_override_dict=subscription_override_dict,
+        update_with_info_json=args.update_with_info_json,
+        dry_run=args.dry_run,
+        scheduled=args.scheduled,
+        transaction_log_file_path=args.transaction_log,
+        suppress_transaction_log=args.suppress_transaction_log,
+    )
+
+
+def main() -> List[Subscription | SubscriptionSummary]:
     """
     Entrypoint for ytdl-sub, without the error handling
     """
@@ -215,62 +490,46 @@ def main() -> List[Subscription]:
         logger.info("No config specified, using defaults.")
         config = ConfigFile.default()
 
-    subscriptions: List[Subscription] = []
+    # Validating does not download or write anything, so it does not need the lock
+    if args.subparser == "validate":
+        _validate_from_cli(config=config, args=args)
+        return []
+
+    if args.subparser == "daemon":
+        _daemon_from_cli(config=config, args=args)
+        return []
 
     # If transaction log file is specified, make sure we can open it
     _maybe_validate_transaction_log_file(transaction_log_file_path=args.transaction_log)
 
     with working_directory_lock(config=config):
         if args.subparser == "sub":
-            if (
-                args.update_with_info_json
-                and not config.config_options.experimental.enable_update_with_info_json
-            ):
-                raise ExperimentalFeatureNotEnabled(
-                    "--update-with-info-json requires setting"
-                    " configuration.experimental.enable_update_with_info_json to True. This"
-                    " feature is ",
-                    "still being tested and has the ability to destroy files. Ensure you have a ",
-                    "full backup before usage. You have been warned!",
-                )
-
-            subscription_override_dict = {}
-            if args.dl_override:
-                subscription_override_dict = DownloadArgsParser.from_dl_override(
-                    override=args.dl_override, config=config
-                ).to_subscription_dict()
-
-            logger.info("Validating subscriptions...")
-            subscriptions = _download_subscriptions_from_yaml_files(
-                config=config,
-                subscription_paths=args.subscription_paths,
-                subscription_matches=args.match,
-                subscription_override_dict=subscription_override_dict,
-                update_with_info_json=args.update_with_info_json,
-                dry_run=args.dry_run,
-            )
-
+            subscriptions = _sub_from_cli(config=config, args=args)
         # One-off download
         elif args.subparser == "dl":
             logger.info("Validating presets...")
-            subscriptions.append(
+            subscriptions = [
                 _download_subscription_from_cli(
                     config=config, dry_run=args.dry_run, extra_args=extra_args
                 )
-            )
+            ]
         elif args.subparser == "view":
-            subscriptions.append(
+            subscriptions = [
                 _view_url_from_cli(config=config, url=args.url, split_chapters=args.split_chapters)
-            )
+            ]
         else:
-            raise ValidationException("Must provide one of the commands: sub, dl, view")
+            raise ValidationException(
+                "Must provide one of the commands: sub, dl, view, daemon, validate"
+            )
 
-    if not args.suppress_transaction_log:
+    # sub outputs each subscription's transaction log as soon as it finishes
+    if not args.suppress_transaction_log and args.subparser != "sub":
         output_transaction_log(
             subscriptions=subscriptions,
             transaction_log_file_path=args.transaction_log,
         )
 
     output_summary(subscriptions)
+    FFMPEG.log_timing_report()
 
     return subscriptions
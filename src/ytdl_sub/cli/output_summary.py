@@ -1,4 +1,7 @@
+from dataclasses import dataclass
 from typing import List
+from typing import Optional
+from typing import Sequence
 
 from colorama import Fore
 
@@ -8,6 +11,42 @@ from ytdl_sub.utils.logger import Logger
 logger = Logger.get()
 
 
+@dataclass(frozen=True)
+class SubscriptionSummary:
+    """
+    The outcome of a processed subscription, kept instead of the subscription itself so its
+    state can be released once it is done
+    """
+
+    name: str
+    num_entries_added: int
+    num_entries_modified: int
+    num_entries_removed: int
+    num_entries: int
+    exception: Optional[Exception]
+
+    @classmethod
+    def from_subscription(cls, subscription: Subscription) -> "SubscriptionSummary":
+        """
+        Returns
+        -------
+        Summary of the processed subscription
+        """
+        exception = subscription.exception
+        if exception is not None:
+            # Already logged, and the traceback would keep the subscription's frames alive
+            exception = exception.with_traceback(None)
+
+        return cls(
+            name=subscription.name,
+            num_entries_added=subscription.num_entries_added,
+            num_entries_modified=subscription.num_entries_modified,
+            num_entries_removed=subscription.num_entries_removed,
+            num_entries=subscription.num_entries,
+            exception=exception,
+        )
+
+
 def _green(value: str) -> str:
     return Fore.GREEN + value + Fore.RESET
 
@@ -35,12 +74,12 @@ def _color_int(value: int) -> str:
     return _no_color(str_int)
 
 
-def output_summary(subscriptions: List[Subscription]) -> None:
+def output_summary(subscriptions: Sequence[Subscription | SubscriptionSummary]) -> None:
     """
     Parameters
     ----------
     subscriptions
-        Processed subscriptions
+        Processed subscriptions, or their summaries
 
     Returns
     -------
@@ -20,6 +20,39 @@ def _maybe_validate_transaction_log_file(transaction_log_file_path: Optional[str
             ) from exc
 
 
+def _transaction_log_contents(subscription: Subscription) -> str:
+    if subscription.transaction_log.is_empty:
+        return f"\nNo files changed for {subscription.name}"
+
+    return (
+        f"Transaction log for {subscription.name}:\n"
+        f"{subscription.transaction_log.to_output_message(subscription.output_directory)}"
+    )
+
+
+def append_transaction_log(
+    subscription: Subscription,
+    transaction_log_file_path: Optional[str],
+) -> None:
+    """
+    Print or append the transaction log of a single subscription to the file as soon as it is
+    processed. The file is emptied when it is validated at startup.
+
+    Parameters
+    ----------
+    subscription
+        Processed subscription
+    transaction_log_file_path
+        Optional file path to append to
+    """
+    transaction_log_contents = _transaction_log_contents(subscription)
+    if transaction_log_file_path:
+        with open(transaction_log_file_path, "a", encoding="utf-8") as transaction_log_file:
+            transaction_log_file.write(transaction_log_contents)
+    else:
+        logger.info(transaction_log_contents)
+
+
 def output_transaction_log(
     subscriptions: List[Subscription],
     transaction_log_file_path: Optional[str],
@@ -36,13 +69,7 @@ def output_transaction_log(
     """
     transaction_log_file_contents = ""
     for subscription in subscriptions:
-        if subscription.transaction_log.is_empty:
-            transaction_log_contents = f"\nNo files changed for {subscription.name}"
-        else:
-            transaction_log_contents = (
-                f"Transaction log for {subscription.name}:\n"
-                f"{subscription.transaction_log.to_output_message(subscription.output_directory)}"
-            )
+        transaction_log_contents = _transaction_log_contents(subscription)
 
         if transaction_log_file_path:
             transaction_log_file_contents += transaction_log_contents
@@ -163,6 +163,10 @@ class SubArguments:
         short="-o",
         long="--dl-override",
     )
+    SCHEDULED = CLIArgument(
+        short="-s",
+        long="--scheduled",
+    )
 
 
 subscription_parser = subparsers.add_parser("sub")
@@ -188,6 +192,57 @@ subscription_parser.add_argument(
     help="override all subscription config values using `dl` syntax, "
     "i.e. --dl-override='--ytdl_options.max_downloads 3'",
 )
+subscription_parser.add_argument(
+    SubArguments.SCHEDULED.short,
+    SubArguments.SCHEDULED.long,
+    action="store_true",
+    help="only check subscriptions that are due based on how often they upload, "
+    "intended for frequent cron runs",
+    default=False,
+)
+
+
+###################################################################################################
+# DAEMON PARSER
+class DaemonArguments:
+    TRIGGER = CLIArgument(
+        short="-tr",
+        long="--trigger",
+    )
+
+
+daemon_parser = subparsers.add_parser("daemon")
+_add_shared_arguments(daemon_parser, suppress_defaults=True)
+daemon_parser.add_argument(
+    "subscription_paths",
+    metavar="SUBPATH",
+    nargs="*",
+    help="path to subscription files, uses subscriptions.yaml if not provided",
+    default=["subscriptions.yaml"],
+)
+daemon_parser.add_argument(
+    DaemonArguments.TRIGGER.short,
+    DaemonArguments.TRIGGER.long,
+    metavar="SUBSCRIPTION",
+    dest="trigger",
+    nargs="+",
+    action="extend",
+    type=str,
+    help="run one or more subscriptions immediately in the running daemon, then exit",
+    default=[],
+)
+
+###################################################################################################
+# VALIDATE PARSER
+validate_parser = subparsers.add_parser("validate")
+_add_shared_arguments(validate_parser, suppress_defaults=True)
+validate_parser.add_argument(
+    "subscription_paths",
+    metavar="SUBPATH",
+    nargs="*",
+    help="path to subscription files, uses subscriptions.yaml if not provided",
+    default=["subscriptions.yaml"],
+)
 
 ###################################################################################################
 # DOWNLOAD PARSER
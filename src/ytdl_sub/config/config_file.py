@@ -4,9 +4,11 @@ from typing import Dict
 
 from ytdl_sub.config.config_validator import ConfigValidator
 from ytdl_sub.config.preset import Preset
+from ytdl_sub.downloaders.parent_metadata_cache import ParentMetadataCache
 from ytdl_sub.utils.exceptions import FileNotFoundException
 from ytdl_sub.utils.ffmpeg import FFMPEG
 from ytdl_sub.utils.file_path import FilePathTruncater
+from ytdl_sub.utils.thumbnail import ThumbnailCache
 from ytdl_sub.utils.yaml import load_yaml
 
 
@@ -36,6 +38,15 @@ class ConfigFile(ConfigValidator):
             ffprobe_path=self.config_options.ffprobe_path,
         )
 
+        if cache_directory := self.config_options.cache_directory:
+            ThumbnailCache.set_directory(directory=os.path.join(cache_directory, "thumbnails"))
+            ParentMetadataCache.set_directory(
+                directory=os.path.join(cache_directory, "parent_metadata")
+            )
+        else:
+            ThumbnailCache.set_directory(directory=None)
+            ParentMetadataCache.set_directory(directory=None)
+
         FilePathTruncater.set_max_file_name_bytes(
             max_file_name_bytes=self.config_options.file_name_max_bytes
         )
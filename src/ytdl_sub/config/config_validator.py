@@ -5,13 +5,18 @@ from typing import Optional
 from mergedeep import mergedeep
 from yt_dlp.utils import datetime_from_str
 
+from ytdl_sub.config.defaults import DEFAULT_CACHE_DIRECTORY
 from ytdl_sub.config.defaults import DEFAULT_FFMPEG_PATH
 from ytdl_sub.config.defaults import DEFAULT_FFPROBE_PATH
 from ytdl_sub.config.defaults import DEFAULT_LOCK_DIRECTORY
 from ytdl_sub.config.defaults import MAX_FILE_NAME_BYTES
+from ytdl_sub.config.preset_cache import PresetCache
 from ytdl_sub.prebuilt_presets import PREBUILT_PRESETS
+from ytdl_sub.utils.cron import Schedule
 from ytdl_sub.validators.file_path_validators import FFmpegFileValidator
 from ytdl_sub.validators.file_path_validators import FFprobeFileValidator
+from ytdl_sub.validators.schedule_validator import ScheduleDictValidator
+from ytdl_sub.validators.schedule_validator import ScheduleValidator
 from ytdl_sub.validators.strict_dict_validator import StrictDictValidator
 from ytdl_sub.validators.validators import BoolValidator
 from ytdl_sub.validators.validators import IntValidator
@@ -95,6 +100,94 @@ class PersistLogsValidator(StrictDictValidator):
         return self._keep_successful_logs.value
 
 
+class DaemonValidator(StrictDictValidator):
+    _optional_keys = {"schedule", "subscription_schedules"}
+
+    def __init__(self, name: str, value: Any):
+        super().__init__(name, value)
+
+        self._schedule = self._validate_key_if_present(key="schedule", validator=ScheduleValidator)
+        self._subscription_schedules = self._validate_key(
+            key="subscription_schedules", validator=ScheduleDictValidator, default={}
+        )
+
+    @property
+    def schedule(self) -> Optional[Schedule]:
+        """
+        Optional. How often ``ytdl-sub daemon`` runs each subscription, either as an interval
+        like ``6h`` (supports ``s``, ``m``, ``h``, ``d``, ``w``) or a cron expression like
+        ``0 */6 * * *``. If not set, each subscription is checked as often as it uploads, the same
+        as ``ytdl-sub sub --scheduled``.
+        """
+        return self._schedule.schedule if self._schedule else None
+
+    @property
+    def subscription_schedules(self) -> Dict[str, Schedule]:
+        """
+        Optional. Schedules for individual subscriptions by name, which take precedence over
+        ``schedule``. For example,
+
+        .. code-block:: yaml
+
+           configuration:
+             daemon:
+               schedule: "12h"
+               subscription_schedules:
+                 "Breaking News": "*/15 * * * *"
+        """
+        return self._subscription_schedules.schedules
+
+    def schedule_for(self, subscription_name: str) -> Optional[Schedule]:
+        """
+        Returns
+        -------
+        The subscription's schedule. None if it is checked as often as it uploads.
+        """
+        return self.subscription_schedules.get(subscription_name, self.schedule)
+
+
+class DistributedValidator(StrictDictValidator):
+    _required_keys = {"lease_directory"}
+    _optional_keys = {"lease_timeout", "worker_id"}
+
+    def __init__(self, name: str, value: Any):
+        super().__init__(name, value)
+
+        self._lease_directory = self._validate_key(key="lease_directory", validator=StringValidator)
+        self._lease_timeout = self._validate_key(
+            key="lease_timeout", validator=IntValidator, default=600
+        )
+        if self._lease_timeout.value <= 0:
+            raise self._validation_exception("lease_timeout must be greater than zero")
+
+        self._worker_id = self._validate_key_if_present(key="worker_id", validator=StringValidator)
+
+    @property
+    def lease_directory(self) -> str:
+        """
+        Required. Directory on a volume shared by every worker, i.e. the NFS output volume, to
+        store leases in. A worker skips a subscription while another worker holds the lease for
+        it or for its output directory. Output directories must be mounted at the same path on
+        every worker.
+        """
+        return self._lease_directory.value
+
+    @property
+    def lease_timeout(self) -> int:
+        """
+        Optional. Seconds after which a lease that its worker stopped renewing, i.e. because the
+        worker crashed, can be claimed by other workers. Defaults to 600.
+        """
+        return self._lease_timeout.value
+
+    @property
+    def worker_id(self) -> Optional[str]:
+        """
+        Optional. Name of this worker in logs. Defaults to the hostname and process id.
+        """
+        return self._worker_id.value if self._worker_id else None
+
+
 class ConfigOptions(StrictDictValidator):
     _optional_keys = {
         "working_directory",
@@ -106,6 +199,11 @@ class ConfigOptions(StrictDictValidator):
         "ffprobe_path",
         "file_name_max_bytes",
         "experimental",
+        "remove_all_empty_directories",
+        "resume_working_directory",
+        "cache_directory",
+        "daemon",
+        "distributed",
     }
 
     def __init__(self, name: str, value: Any):
@@ -140,6 +238,21 @@ class ConfigOptions(StrictDictValidator):
         self._file_name_max_bytes = self._validate_key(
             key="file_name_max_bytes", validator=IntValidator, default=MAX_FILE_NAME_BYTES
         )
+        self._remove_all_empty_directories = self._validate_key(
+            key="remove_all_empty_directories", validator=BoolValidator, default=False
+        )
+        self._resume_working_directory = self._validate_key(
+            key="resume_working_directory", validator=BoolValidator, default=False
+        )
+        self._cache_directory = self._validate_key(
+            key="cache_directory",
+            validator=StringValidator,
+            default=DEFAULT_CACHE_DIRECTORY,
+        )
+        self._daemon = self._validate_key(key="daemon", validator=DaemonValidator, default={})
+        self._distributed = self._validate_key_if_present(
+            key="distributed", validator=DistributedValidator
+        )
 
     @property
     def working_directory(self) -> str:
@@ -200,6 +313,51 @@ class ConfigOptions(StrictDictValidator):
         """
         return self._file_name_max_bytes.value
 
+    @property
+    def remove_all_empty_directories(self) -> bool:
+        """
+        After each subscription, ytdl-sub removes directories in the output directory that became
+        empty from deleting files. Set to True to instead walk the entire output directory and
+        remove every empty directory, which can be slow for large or network-mounted libraries.
+        Defaults to False.
+        """
+        return self._remove_all_empty_directories.value
+
+    @property
+    def resume_working_directory(self) -> bool:
+        """
+        Keep a subscription's working directory when its download fails or is interrupted, so the
+        next run can resume partially downloaded files instead of starting over. The directory is
+        only reused if the subscription's options and yt-dlp version are unchanged since the
+        interrupted run. Defaults to False.
+        """
+        return self._resume_working_directory.value
+
+    @property
+    def cache_directory(self) -> str:
+        """
+        The directory to cache channel and playlist thumbnails and uploader metadata in across
+        runs. Cached thumbnails are only re-downloaded and converted if the server reports they
+        changed, and uploader metadata is refetched once a day. Set to an empty string to disable
+        the cache. Defaults to ``~/.cache/ytdl-sub`` for Linux, and ``.ytdl-sub-cache`` for
+        Windows.
+        """
+        return self._cache_directory.value
+
+    @property
+    def daemon(self) -> DaemonValidator:
+        """
+        Daemon validator. readthedocs in the validator itself!
+        """
+        return self._daemon
+
+    @property
+    def distributed(self) -> Optional[DistributedValidator]:
+        """
+        Distributed validator. readthedocs in the validator itself!
+        """
+        return self._distributed
+
     @property
     def experimental(self) -> ExperimentalValidator:
         """
@@ -254,3 +412,6 @@ class ConfigValidator(StrictDictValidator):
 
         # Merge prebuilt presets into the config so custom presets can use them
         mergedeep.merge(self.presets._value, PREBUILT_PRESETS)
+
+        # Shared by every subscription that uses this config
+        self.preset_cache = PresetCache()
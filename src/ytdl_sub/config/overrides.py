@@ -1,7 +1,9 @@
 from typing import Any
 from typing import Dict
+from typing import Hashable
 from typing import Optional
 from typing import Set
+from typing import TypeVar
 
 import mergedeep
 
@@ -15,11 +17,12 @@ from ytdl_sub.script.utils.exceptions import ScriptVariableNotResolved
 from ytdl_sub.utils.exceptions import InvalidVariableNameException
 from ytdl_sub.utils.exceptions import StringFormattingException
 from ytdl_sub.utils.exceptions import ValidationException
-from ytdl_sub.utils.script import ScriptUtils
 from ytdl_sub.utils.scriptable import Scriptable
 from ytdl_sub.validators.string_formatter_validators import DictFormatterValidator
 from ytdl_sub.validators.string_formatter_validators import StringFormatterValidator
 
+FormatterKeyT = TypeVar("FormatterKeyT", bound=Hashable)
+
 
 class Overrides(DictFormatterValidator, Scriptable):
     """
@@ -126,7 +129,7 @@ class Overrides(DictFormatterValidator, Scriptable):
             self.dict_with_format_strings,
             unresolved_variables if unresolved_variables else {},
         )
-        return ScriptUtils.add_sanitized_variables(initial_variables)
+        return initial_variables
 
     def initialize_script(self, unresolved_variables: Set[str]) -> "Overrides":
         """
@@ -144,30 +147,42 @@ class Overrides(DictFormatterValidator, Scriptable):
         self.update_script()
         return self
 
-    def apply_formatter(
+    def partially_resolve_script(self) -> None:
+        """
+        Inlines the resolved override and subscription variables into the override definitions
+        that still depend on entries, so each entry only resolves the parts that depend on it.
+        Must be called after all subscription variables are added.
+        """
+        self.script.partially_resolve(
+            variable_names=(set(self.keys) | REQUIRED_OVERRIDE_VARIABLE_NAMES) - self.unresolvable
+        )
+
+    def apply_formatters(
         self,
-        formatter: StringFormatterValidator,
+        formatters: Dict[FormatterKeyT, StringFormatterValidator],
         entry: Optional[Entry] = None,
         function_overrides: Dict[str, str] = None,
-    ) -> str:
+    ) -> Dict[FormatterKeyT, str]:
         """
+        Applies many formatters at once, resolving any dependencies they share only once.
+
         Parameters
         ----------
-        formatter
-            Formatter to apply
+        formatters
+            Formatters to apply, by any key
         entry
-            Optional. Entry to add source variables to the formatter
+            Optional. Entry to add source variables to the formatters
         function_overrides
             Optional. Explicit values to override the overrides themselves and source variables
 
         Returns
         -------
-        The format_string after .format has been called
+        The format_strings after .format has been called, by the formatters' keys
 
         Raises
         ------
         StringFormattingException
-            If the formatter that is trying to be resolved cannot
+            If any of the formatters that are trying to be resolved cannot
         """
         script: Script = self.script
         unresolvable: Set[str] = self.unresolvable
@@ -176,18 +191,52 @@ class Overrides(DictFormatterValidator, Scriptable):
             unresolvable = entry.unresolvable
 
         try:
-            return formatter.post_process(
-                str(
-                    script.resolve_once(
-                        dict({"tmp_var": formatter.format_string}, **(function_overrides or {})),
-                        unresolvable=unresolvable,
-                    )["tmp_var"]
-                )
+            evaluated = script.evaluate_many(
+                {key: formatter.parsed for key, formatter in formatters.items()},
+                extra=function_overrides,
+                unresolvable=unresolvable,
             )
         except ScriptVariableNotResolved as exc:
+            format_strings = "\n ".join(
+                formatter.format_string for formatter in formatters.values()
+            )
             raise StringFormattingException(
                 "Tried to resolve the following script, but could not due to unresolved "
-                f"variables:\n {formatter.format_string}\n"
+                f"variables:\n {format_strings}\n"
                 "This is most likely due to circular dependencies in variables. "
                 "If you think otherwise, please file a bug on GitHub and post your config. Thanks!"
             ) from exc
+
+        return {
+            key: formatters[key].post_process(str(resolvable))
+            for key, resolvable in evaluated.items()
+        }
+
+    def apply_formatter(
+        self,
+        formatter: StringFormatterValidator,
+        entry: Optional[Entry] = None,
+        function_overrides: Dict[str, str] = None,
+    ) -> str:
+        """
+        Parameters
+        ----------
+        formatter
+            Formatter to apply
+        entry
+            Optional. Entry to add source variables to the formatter
+        function_overrides
+            Optional. Explicit values to override the overrides themselves and source variables
+
+        Returns
+        -------
+        The format_string after .format has been called
+
+        Raises
+        ------
+        StringFormattingException
+            If the formatter that is trying to be resolved cannot
+        """
+        return self.apply_formatters(
+            {0: formatter}, entry=entry, function_overrides=function_overrides
+        )[0]
@@ -1,4 +1,3 @@
-import copy
 from typing import Any
 from typing import Dict
 from typing import List
@@ -9,6 +8,7 @@ from ytdl_sub.config.config_validator import ConfigValidator
 from ytdl_sub.config.overrides import Overrides
 from ytdl_sub.config.plugin.plugin_mapping import PluginMapping
 from ytdl_sub.config.plugin.preset_plugins import PresetPlugins
+from ytdl_sub.config.preset_cache import PresetCache
 from ytdl_sub.config.preset_options import OutputOptions
 from ytdl_sub.config.preset_options import YTDLOptions
 from ytdl_sub.config.validators.variable_validation import VariableValidation
@@ -139,7 +139,7 @@ class Preset(_PresetShell):
                     presets=config.presets.keys,
                 )
 
-            parent_preset_dict = copy.deepcopy(config.presets.dict[parent_preset])
+            parent_preset_dict = config.presets.dict[parent_preset]
             presets_to_merge.append(parent_preset_dict)
 
             if "preset" in parent_preset_dict:
@@ -160,16 +160,30 @@ class Preset(_PresetShell):
         if parent_preset_validator is None:
             return
 
-        # Get list of all parent presets in depth-first search order, beginning with this preset
-        presets_to_merge: List[Dict] = [copy.deepcopy(self._value)] + self._get_presets_to_merge(
-            parent_presets=[preset.value for preset in parent_preset_validator.list],
-            seen_presets=[],
-            config=config,
-        )
+        parent_presets = [preset.value for preset in parent_preset_validator.list]
+
+        def _merge_parent_presets() -> Dict:
+            # Get list of all parent presets in depth-first search order
+            presets_to_merge: List[Dict] = self._get_presets_to_merge(
+                parent_presets=parent_presets,
+                seen_presets=[],
+                config=config,
+            )
+            return mergedeep.merge(
+                {}, *reversed(presets_to_merge), strategy=mergedeep.Strategy.ADDITIVE
+            )
 
-        # Merge all presets
+        # Merge this preset onto its parent presets. Merging copies, so the cached merge of the
+        # parent presets is never modified
         self._value = dict(
-            mergedeep.merge({}, *reversed(presets_to_merge), strategy=mergedeep.Strategy.ADDITIVE)
+            mergedeep.merge(
+                {},
+                config.preset_cache.merged_parent_presets(
+                    parent_presets=tuple(parent_presets), merge=_merge_parent_presets
+                ),
+                self._value,
+                strategy=mergedeep.Strategy.ADDITIVE,
+            )
         )
 
     def __init__(self, config: ConfigValidator, name: str, value: Any):
@@ -194,11 +208,24 @@ class Preset(_PresetShell):
         self.plugins: PresetPlugins = self._validate_and_get_plugins()
         self.overrides = self._validate_key(key="overrides", validator=Overrides, default={})
 
-        VariableValidation(
+        variable_validation = VariableValidation(
             downloader_options=self.downloader_options,
             output_options=self.output_options,
             plugins=self.plugins,
-        ).initialize_preset_overrides(overrides=self.overrides).ensure_proper_usage()
+        ).initialize_preset_overrides(overrides=self.overrides)
+
+        # Subscriptions that share presets and only differ in override values validate the same
+        validation_key = PresetCache.structural_hash(
+            {
+                key: value
+                for key, value in self._value.items()
+                if key not in ("preset", "overrides")
+            },
+            variable_validation.override_dependencies,
+        )
+        if not config.preset_cache.is_validated(validation_key):
+            variable_validation.ensure_proper_usage()
+            config.preset_cache.mark_validated(validation_key)
 
     @property
     def name(self) -> str:
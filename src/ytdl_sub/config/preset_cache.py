@@ -0,0 +1,76 @@
+import hashlib
+import json
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Set
+from typing import Tuple
+
+
+class PresetCache:
+    """
+    Work shared by every subscription of a config. Parent presets are merged once per unique
+    list of parent presets, and presets are validated once per unique structure, since
+    subscriptions that only differ in their override values validate the same way.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._merged_parent_presets: Dict[Tuple[str, ...], Dict] = {}
+        self._validated_keys: Set[str] = set()
+
+    def __deepcopy__(self, memo: Dict) -> "PresetCache":
+        # Copies of a config can have different presets, so they start with an empty cache
+        return PresetCache()
+
+    @classmethod
+    def structural_hash(cls, *values: Any) -> str:
+        """
+        Returns
+        -------
+        Hash of json-like values, which is the same for equal values
+        """
+        return hashlib.sha256(
+            json.dumps(values, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def merged_parent_presets(
+        self, parent_presets: Tuple[str, ...], merge: Callable[[], Dict]
+    ) -> Dict:
+        """
+        Parameters
+        ----------
+        parent_presets
+            Names of the parent presets, in the order they are listed
+        merge
+            Merges the parent presets and all of their ancestors if they are not cached yet
+
+        Returns
+        -------
+        The merged parent presets. Must not be modified.
+        """
+        with self._lock:
+            if (merged := self._merged_parent_presets.get(parent_presets)) is not None:
+                return merged
+
+        merged = merge()
+        with self._lock:
+            self._merged_parent_presets[parent_presets] = merged
+        return merged
+
+    def is_validated(self, key: str) -> bool:
+        """
+        Returns
+        -------
+        True if a preset with this structural hash was already validated successfully
+        """
+        with self._lock:
+            return key in self._validated_keys
+
+    def mark_validated(self, key: str) -> None:
+        """
+        Records that a preset with this structural hash validated successfully
+        """
+        with self._lock:
+            self._validated_keys.add(key)
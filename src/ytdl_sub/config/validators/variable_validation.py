@@ -36,7 +36,6 @@ def _add_dummy_variables(variables: Iterable[str]) -> Dict[str, str]:
     dummy_variables: Dict[str, str] = {}
     for var in variables:
         dummy_variables[var] = ""
-        dummy_variables[f"{var}_sanitized"] = ""
 
     return dummy_variables
 
@@ -101,6 +100,10 @@ class VariableValidation:
         self.resolved_variables: Set[str] = set()
         self.unresolved_variables: Set[str] = set()
 
+        self._overrides: Optional[Overrides] = None
+        self._plugin_variables: Set[str] = set()
+        self._dummy_overrides: Dict[str, str] = {}
+
     def initialize_preset_overrides(self, overrides: Overrides) -> "VariableValidation":
         """
         Do some gymnastics to initialize the Overrides script.
@@ -141,18 +144,41 @@ class VariableValidation:
         # Initialize overrides with unresolved variables + modified variables to throw an error.
         # For modified variables, this is to prevent a resolve(update=True) to setting any
         # dependencies until it has been explicitly added
-        overrides = overrides.initialize_script(unresolved_variables=self.unresolved_variables)
+        self._overrides = overrides.initialize_script(
+            unresolved_variables=self.unresolved_variables
+        )
+        self._plugin_variables = plugin_variables
+        self._dummy_overrides = _add_dummy_overrides(overrides=self._overrides)
 
-        # copy the script and mock entry variables
-        self.script = copy.deepcopy(overrides.script)
+        return self
+
+    @property
+    def override_dependencies(self) -> Dict[str, str]:
+        """
+        Returns
+        -------
+        Each override variable as the variables it depends on, and each override function's
+        definition. Validation only depends on these, not on the overrides' values.
+        """
+        assert self._overrides is not None, "Not initialized"
+        return self._dummy_overrides | {
+            name: definition
+            for name, definition in self._overrides.initial_variables().items()
+            if _is_function(name)
+        }
+
+    def _initialize_script(self) -> None:
+        """
+        Copy the override script and mock entry variables
+        """
+        assert self._overrides is not None, "Not initialized"
+        self.script = copy.deepcopy(self._overrides.script)
         self.script.add(
-            variables=_add_dummy_overrides(overrides=overrides)
-            | _add_dummy_variables(variables=plugin_variables)
+            variables=self._dummy_overrides
+            | _add_dummy_variables(variables=self._plugin_variables)
             | _DUMMY_ENTRY_VARIABLES
         )
 
-        return self
-
     def _update_script(self) -> None:
         _ = self.script.resolve(unresolvable=self.unresolved_variables, update=True)
 
@@ -183,6 +209,7 @@ class VariableValidation:
         Validate variables resolve as plugins are executed, and return
         a mock script which contains actualized added variables from the plugins
         """
+        self._initialize_script()
 
         self._add_variables(PluginOperation.DOWNLOADER, options=self.downloader_options)
         self._add_subscription_override_variables()
@@ -1,10 +1,18 @@
 import copy
+import heapq
 import json
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
+from typing import Deque
 from typing import Dict
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from ytdl_sub.config.overrides import Overrides
 from ytdl_sub.config.validators.options import OptionsDictValidator
@@ -22,6 +30,9 @@ from ytdl_sub.ytdl_additions.enhanced_download_archive import EnhancedDownloadAr
 
 v: VariableDefinitions = VARIABLES
 
+# An entry loaded from its info.json, and the variables stored in it by a prior run
+_LoadedInfoJson = Tuple[Entry, Dict[str, Any]]
+
 
 class InfoJsonDownloaderOptions(OptionsDictValidator):
     _optional_keys = {"no-op"}
@@ -30,6 +41,9 @@ class InfoJsonDownloaderOptions(OptionsDictValidator):
 class InfoJsonDownloader(SourcePlugin[InfoJsonDownloaderOptions]):
     plugin_options_type = InfoJsonDownloaderOptions
 
+    # Number of info.json files to read ahead of the entry that is currently being processed
+    _NUM_PREFETCHED_INFO_JSONS: int = 8
+
     def __init__(
         self,
         options: InfoJsonDownloaderOptions,
@@ -68,58 +82,134 @@ class InfoJsonDownloader(SourcePlugin[InfoJsonDownloaderOptions]):
         """
         return self._enhanced_download_archive.mapping.entry_mappings
 
-    def _get_entry_from_download_mapping(self, download_mapping: DownloadMapping):
+    def _get_info_json_path(self, download_mapping: DownloadMapping) -> Path:
         """
-        Try to load an entry from a download mapping's info json
+        Returns the path to the download mapping's info.json in the output directory
         """
         for file_name in download_mapping.file_names:
             if file_name.endswith(".info.json"):
-                try:
-                    with open(
-                        Path(self.output_directory) / file_name, "r", encoding="utf-8"
-                    ) as maybe_info_json:
-                        entry_dict = json.load(maybe_info_json)
-                except Exception as exc:
-                    raise ValidationException(
-                        "info.json file cannot be loaded - subscription cannot be reformatted"
-                    ) from exc
-
-                return Entry(
-                    entry_dict=entry_dict,
-                    working_directory=self.working_directory,
-                )
+                return Path(self.output_directory) / file_name
 
         raise ValidationException(
             "info.json file could not be found - subscription cannot be reformatted"
         )
 
-    def download_metadata(self) -> Iterable[Entry]:
+    def _load_info_json(self, info_json_path: Path) -> _LoadedInfoJson:
+        """
+        Try to load an entry and its prior variables from its info json. Does not initialize
+        its script.
+        """
+        try:
+            with open(info_json_path, "r", encoding="utf-8") as maybe_info_json:
+                entry_dict = json.load(maybe_info_json)
+        except Exception as exc:
+            raise ValidationException(
+                "info.json file cannot be loaded - subscription cannot be reformatted"
+            ) from exc
+
+        entry = Entry(
+            entry_dict=entry_dict,
+            working_directory=self.working_directory,
+        )
+
+        # See if prior variables exist. If so, delete them from metadata
+        # to avoid saving them recursively on multiple updates
+        return entry, entry.maybe_get_prior_variables()
+
+    def _sorted_info_jsons(
+        self, info_json_paths: List[Path]
+    ) -> Tuple[List[Path], Dict[Path, _LoadedInfoJson]]:
+        """
+        Reads every info.json once to sort them by the download index they were written with,
+        which also ensures they are all valid before any are processed. Only the first
+        ``_NUM_PREFETCHED_INFO_JSONS`` entries in sorted order are kept so they are not read
+        again, the rest are discarded to keep memory bounded.
+
+        Returns
+        -------
+        The info.json paths sorted by download index, and the entries that were kept
+        """
+        sort_keys: List[Tuple[int, int]] = []
+        # Max-heap of the smallest sort keys seen so far, with their loaded entries
+        first_loaded: List[Tuple[int, int, Path, _LoadedInfoJson]] = []
+
+        for position, (info_json_path, loaded) in enumerate(
+            zip(info_json_paths, self._iterate_info_jsons(info_json_paths, {}))
+        ):
+            # Defaults to 1, same as the download_index variable's definition.
+            # Ties keep mapping order, same as a stable sort
+            sort_key = (int(loaded[1].get(v.download_index.variable_name, 1)), position)
+            sort_keys.append(sort_key)
+
+            heapq.heappush(first_loaded, (-sort_key[0], -sort_key[1], info_json_path, loaded))
+            if len(first_loaded) > self._NUM_PREFETCHED_INFO_JSONS:
+                heapq.heappop(first_loaded)
+
+        sorted_info_json_paths = [info_json_paths[position] for _, position in sorted(sort_keys)]
+        return sorted_info_json_paths, {
+            info_json_path: loaded for _, _, info_json_path, loaded in first_loaded
+        }
+
+    def _initialize_entry(self, entry: Entry, prior_variables: Dict[str, Any]) -> Entry:
         """
-        Loads all entries via their info.json files first (to ensure they are all valid), then
-        iterates them
+        Initializes the entry's script using the prior variables stored in its info json
         """
-        entries: List[Entry] = []
+        entry.initialize_script(self.overrides).add(
+            {
+                inj: prior_variables.get(
+                    inj.variable_name,
+                    VARIABLE_SCRIPTS[inj.variable_name],
+                )
+                for inj in v.injected_variables()
+            }
+        )
+        return entry
 
-        for download_mapping in self._enhanced_download_archive.mapping.entry_mappings.values():
-            entry = self._get_entry_from_download_mapping(download_mapping)
+    def _iterate_info_jsons(
+        self, info_json_paths: List[Path], loaded_info_jsons: Dict[Path, _LoadedInfoJson]
+    ) -> Iterator[_LoadedInfoJson]:
+        """
+        Loads info json entries in the given order, reusing the already loaded ones. The next
+        few info jsons are read and parsed in a thread pool while the current one is being
+        processed, so at most ``_NUM_PREFETCHED_INFO_JSONS`` are held in memory at once.
+        """
 
-            # See if prior variables exist. If so, delete them from metadata
-            # to avoid saving them recursively on multiple updates
-            prior_variables = entry.maybe_get_prior_variables()
+        def _load(info_json_path: Path) -> _LoadedInfoJson:
+            if (loaded := loaded_info_jsons.pop(info_json_path, None)) is not None:
+                return loaded
+            return self._load_info_json(info_json_path)
 
-            entry.initialize_script(self.overrides).add(
-                {
-                    inj: prior_variables.get(
-                        inj.variable_name,
-                        VARIABLE_SCRIPTS[inj.variable_name],
-                    )
-                    for inj in v.injected_variables()
-                }
+        with ThreadPoolExecutor(max_workers=self._NUM_PREFETCHED_INFO_JSONS) as executor:
+            prefetched: Deque[Future] = deque(
+                executor.submit(_load, info_json_path)
+                for info_json_path in info_json_paths[: self._NUM_PREFETCHED_INFO_JSONS]
             )
-            entries.append(entry)
+
+            for idx in range(len(info_json_paths)):
+                loaded = prefetched.popleft().result()
+
+                if (next_idx := idx + self._NUM_PREFETCHED_INFO_JSONS) < len(info_json_paths):
+                    prefetched.append(executor.submit(_load, info_json_paths[next_idx]))
+
+                yield loaded
+
+    def download_metadata(self) -> Iterable[Entry]:
+        """
+        Reads the download index of every info.json file first (to ensure they are all valid
+        and to know their order), then lazily loads and iterates them in that order
+        """
+        info_json_paths: List[Path] = [
+            self._get_info_json_path(download_mapping)
+            for download_mapping in self._entry_mappings.values()
+        ]
+        sorted_info_json_paths, loaded_info_jsons = self._sorted_info_jsons(info_json_paths)
 
         # TODO: MATCH A URL TO A URL_VALIDATOR !!!
-        for entry in sorted(entries, key=lambda ent: ent.get(v.download_index, int)):
+        for entry, prior_variables in self._iterate_info_jsons(
+            sorted_info_json_paths, loaded_info_jsons
+        ):
+            entry = self._initialize_entry(entry, prior_variables)
+
             # Remove each entry from the live download archive since it will get re-added
             # unless it is filtered
             self._enhanced_download_archive.mapping.remove_entry(entry.uid)
@@ -0,0 +1,154 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import yt_dlp as ytdl
+
+from ytdl_sub.utils.logger import Logger
+
+logger = Logger.get(name="yt-dlp-downloader")
+
+
+class ParentMetadataCache:
+    """
+    Caches uploader (parent) metadata fetched by yt-dlp, keyed by the uploader url and the
+    ytdl options that change what it returns. Lookups are shared in-memory across subscriptions
+    within a run, and persisted to disk across runs until the TTL expires. Failed lookups are only
+    remembered for the current run.
+    """
+
+    # Options that change the fetched metadata: cookies can unlock otherwise hidden metadata, and
+    # extractor_args select e.g. the language of translated titles and descriptions
+    _KEYED_OPTIONS: Tuple[str, ...] = ("cookiefile", "cookiesfrombrowser", "extractor_args")
+
+    _DIRECTORY: Optional[str] = None
+    _TTL_SEC: float = 24 * 60 * 60
+
+    _LOCK = threading.Lock()
+    _IN_MEMORY: Dict[str, Optional[Dict]] = {}
+    _HITS: int = 0
+    _MISSES: int = 0
+
+    @classmethod
+    def set_directory(cls, directory: Optional[str]) -> None:
+        """
+        Sets the on-disk cache directory. None only caches in-memory for the current run.
+        """
+        cls._DIRECTORY = directory or None
+
+    @classmethod
+    def _cache_key(cls, uploader_url: str, ytdl_options: Optional[Dict]) -> str:
+        keyed_options = {name: (ytdl_options or {}).get(name) for name in cls._KEYED_OPTIONS}
+        options_json = json.dumps(keyed_options, sort_keys=True, default=str)
+        return f"{uploader_url} {hashlib.sha256(options_json.encode('utf-8')).hexdigest()}"
+
+    @classmethod
+    def _cache_path(cls, cache_key: str) -> Path:
+        key_hash = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+        return Path(cls._DIRECTORY) / f"{key_hash}.json"
+
+    @classmethod
+    def _load(cls, cache_key: str) -> Optional[Dict]:
+        if cls._DIRECTORY is None:
+            return None
+
+        try:
+            with open(cls._cache_path(cache_key), "r", encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or time.time() - cached.get("cached_at", 0) >= cls._TTL_SEC:
+            return None
+        return cached.get("metadata")
+
+    @classmethod
+    def _save(cls, cache_key: str, metadata: Dict) -> None:
+        if cls._DIRECTORY is None:
+            return
+
+        try:
+            os.makedirs(cls._DIRECTORY, exist_ok=True)
+            cache_path = cls._cache_path(cache_key)
+            tmp_cache_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_cache_path, "w", encoding="utf-8") as cache_file:
+                json.dump({"cached_at": time.time(), "metadata": metadata}, cache_file)
+            os.replace(tmp_cache_path, cache_path)
+        except OSError as os_error:
+            logger.debug("Failed to cache parent metadata for %s: %s", cache_key, os_error)
+
+    @classmethod
+    def get_or_fetch(
+        cls,
+        uploader_url: str,
+        fetch: Callable[[], Optional[Dict]],
+        ytdl_options: Optional[Dict] = None,
+    ) -> Optional[Dict]:
+        """
+        Parameters
+        ----------
+        uploader_url
+            URL the parent metadata is fetched from
+        fetch
+            Fetches the parent metadata on a cache miss. Returns None if the lookup failed
+        ytdl_options
+            Optional. ytdl options the metadata is fetched with. Lookups are only shared between
+            options with the same cookies and extractor_args
+
+        Returns
+        -------
+        A copy of the parent metadata, in the json-safe form it is cached in. None if the lookup
+        failed.
+        """
+        cache_key = cls._cache_key(uploader_url, ytdl_options)
+        with cls._LOCK:
+            is_in_memory = cache_key in cls._IN_MEMORY
+            metadata = cls._IN_MEMORY.get(cache_key)
+
+        if not is_in_memory and (metadata := cls._load(cache_key)) is not None:
+            is_in_memory = True
+            with cls._LOCK:
+                cls._IN_MEMORY[cache_key] = metadata
+
+        if is_in_memory:
+            with cls._LOCK:
+                cls._HITS += 1
+            return copy.deepcopy(metadata)
+
+        with cls._LOCK:
+            cls._MISSES += 1
+
+        metadata = fetch()
+        metadata = ytdl.YoutubeDL.sanitize_info(metadata) if isinstance(metadata, dict) else None
+        with cls._LOCK:
+            cls._IN_MEMORY[cache_key] = metadata
+
+        if metadata is not None:
+            cls._save(cache_key, metadata)
+        return copy.deepcopy(metadata)
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Starts a new run. Forgets in-memory lookups, including failed ones, and the hit and miss
+        counts. Lookups persisted to disk are kept.
+        """
+        with cls._LOCK:
+            cls._IN_MEMORY.clear()
+            cls._HITS = 0
+            cls._MISSES = 0
+
+    @classmethod
+    def log_stats(cls) -> None:
+        """
+        Logs the number of cache hits and misses so far
+        """
+        logger.debug("Parent metadata cache: %d hits, %d misses", cls._HITS, cls._MISSES)
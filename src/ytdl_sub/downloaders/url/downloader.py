@@ -1,5 +1,4 @@
-import contextlib
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 from typing import Iterable
@@ -10,6 +9,7 @@ from typing import Set
 from typing import Tuple
 
 from yt_dlp.utils import RejectedVideoReached
+from yt_dlp.utils import make_archive_id
 
 from ytdl_sub.config.overrides import Overrides
 from ytdl_sub.downloaders.source_plugin import SourcePlugin
@@ -23,6 +23,7 @@ from ytdl_sub.entries.entry import Entry
 from ytdl_sub.entries.entry_parent import EntryParent
 from ytdl_sub.entries.script.variable_definitions import VARIABLES
 from ytdl_sub.entries.script.variable_definitions import VariableDefinitions
+from ytdl_sub.utils.file_handler import DirectoryFileIndex
 from ytdl_sub.utils.file_handler import FileHandler
 from ytdl_sub.utils.logger import Logger
 from ytdl_sub.utils.script import ScriptUtils
@@ -66,6 +67,8 @@ class UrlDownloaderBasePluginExtension(SourcePluginExtension[MultiUrlValidator])
 
 
 class UrlDownloaderThumbnailPlugin(UrlDownloaderBasePluginExtension):
+    _MAX_THUMBNAIL_DOWNLOAD_WORKERS: int = 4
+
     def __init__(
         self,
         options: MultiUrlValidator,
@@ -88,6 +91,9 @@ class UrlDownloaderThumbnailPlugin(UrlDownloaderBasePluginExtension):
         """
         Downloads and moves channel avatar and banner images to the output directory.
         """
+        # thumbnail name -> (thumbnail id, url), downloaded concurrently after collecting them
+        thumbnails_to_download: Dict[str, Tuple[str, str]] = {}
+
         for thumbnail_info in thumbnail_list_info.list:
             thumbnail_name = self.overrides.apply_formatter(thumbnail_info.name, entry=entry)
             thumbnail_id = self.overrides.apply_formatter(thumbnail_info.uid)
@@ -113,18 +119,35 @@ class UrlDownloaderThumbnailPlugin(UrlDownloaderBasePluginExtension):
             if thumbnail_name in self._thumbnails_downloaded:
                 continue
 
+            if thumbnail_name in thumbnails_to_download:
+                continue
+
             if (thumbnail_url := parent.get_thumbnail_url(thumbnail_id=thumbnail_id)) is None:
                 download_logger.debug("Failed to find thumbnail id '%s'", thumbnail_id)
                 continue
 
-            if download_and_convert_url_thumbnail(
-                thumbnail_url=thumbnail_url,
-                output_thumbnail_path=str(Path(self.working_directory) / thumbnail_name),
+            thumbnails_to_download[thumbnail_name] = (thumbnail_id, thumbnail_url)
+
+        if not thumbnails_to_download:
+            return
+
+        with ThreadPoolExecutor(max_workers=self._MAX_THUMBNAIL_DOWNLOAD_WORKERS) as executor:
+            downloaded = executor.map(
+                lambda name_and_url: download_and_convert_url_thumbnail(
+                    thumbnail_url=name_and_url[1],
+                    output_thumbnail_path=str(Path(self.working_directory) / name_and_url[0]),
+                ),
+                [(name, url) for name, (_, url) in thumbnails_to_download.items()],
+            )
+
+            for (thumbnail_name, (thumbnail_id, _)), is_downloaded in zip(
+                thumbnails_to_download.items(), downloaded
             ):
-                self.save_file(file_name=thumbnail_name)
-                self._thumbnails_downloaded.add(thumbnail_name)
-            else:
-                download_logger.debug("Failed to download thumbnail id '%s'", thumbnail_id)
+                if is_downloaded:
+                    self.save_file(file_name=thumbnail_name)
+                    self._thumbnails_downloaded.add(thumbnail_name)
+                else:
+                    download_logger.debug("Failed to download thumbnail id '%s'", thumbnail_id)
 
     def _download_url_thumbnails(self, collection_url: UrlValidator, entry: Entry):
         """
@@ -196,6 +219,15 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
     plugin_options_type = MultiUrlValidator
     plugin_extensions = [UrlDownloaderThumbnailPlugin, UrlDownloaderCollectionVariablePlugin]
 
+    # Probing is skipped if any of these are set, since they change which items are fetched
+    _PROBE_INCOMPATIBLE_YTDL_OPTIONS = (
+        "playlist_items",
+        "playliststart",
+        "playlistend",
+        "playlistreverse",
+        "playlistrandom",
+    )
+
     @classmethod
     def ytdl_option_defaults(cls) -> Dict:
         """
@@ -304,54 +336,31 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
         """Return the download options collection"""
         return self.plugin_options
 
-    @contextlib.contextmanager
-    def _separate_download_archives(self, clear_info_json_files: bool = False):
+    def _with_download_archive_snapshot(self, ytdl_options: Dict) -> Dict:
         """
-        Separate download archive writing between collection urls. This is so break_on_existing
-        does not break when downloading from subset urls.
+        Replaces the download archive file path with the archive snapshot taken prior to any
+        downloading. yt-dlp cannot add to the snapshot, so every collection URL starts from the
+        same archive. This is so break_on_existing does not break when downloading from subset
+        urls.
+        """
+        if "download_archive" in ytdl_options:
+            ytdl_options["download_archive"] = (
+                self._enhanced_download_archive.download_archive_snapshot
+            )
+        return ytdl_options
 
-        Parameters
-        ----------
-        clear_info_json_files
-            Whether to delete info.json files after yield
-        """
-        archive_path = self.download_ytdl_options().get("download_archive", "")
-        backup_archive_path = f"{archive_path}.backup"
-
-        # If archive path exists, maintain download archive is enable
-        if archive_file_exists := archive_path and os.path.isfile(archive_path):
-            archive_file_exists = True
-
-            # If a backup exists, it's the one prior to any downloading, use that.
-            if os.path.isfile(backup_archive_path):
-                FileHandler.copy(src_file_path=backup_archive_path, dst_file_path=archive_path)
-            # If not, create the backup
-            else:
-                FileHandler.copy(src_file_path=archive_path, dst_file_path=backup_archive_path)
-
-        yield
-
-        # If an archive path did not exist at first, but now exists, delete it
-        if not archive_file_exists and os.path.isfile(archive_path):
-            FileHandler.delete(file_path=archive_path)
-        # If the archive file did exist, restore the backup
-        elif archive_file_exists:
-            FileHandler.move(src_file_path=backup_archive_path, dst_file_path=archive_path)
-
-        # Clear info json files if true
-        if clear_info_json_files:
-            info_json_files = [
-                Path(self.working_directory) / path
-                for path in os.listdir(self.working_directory)
-                if path.endswith(".info.json")
-            ]
-            for info_json_file in info_json_files:
-                FileHandler.delete(info_json_file)
+    def _delete_info_json_files(self) -> None:
+        """
+        Delete info.json files so other collection URLs do not use them
+        """
+        for file_name in DirectoryFileIndex.file_names(directory=self.working_directory):
+            if file_name.endswith(".info.json"):
+                FileHandler.delete(Path(self.working_directory) / file_name)
 
     def _extract_entry_info_with_retry(self, entry: Entry) -> Entry:
         download_entry_dict = YTDLP.extract_info_with_retry(
-            ytdl_options_overrides=self.download_ytdl_options(
-                url_idx=entry.get(v.ytdl_sub_input_url_index, int)
+            ytdl_options_overrides=self._with_download_archive_snapshot(
+                self.download_ytdl_options(url_idx=entry.get(v.ytdl_sub_input_url_index, int))
             ),
             is_downloaded_fn=None if self.is_dry_run else entry.is_downloaded,
             is_thumbnail_downloaded_fn=(
@@ -415,13 +424,14 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
         """
         Downloads only info.json files and forms EntryParent trees
         """
-        with self._separate_download_archives():
-            entry_dicts = YTDLP.extract_info_via_info_json(
-                working_directory=self.working_directory,
-                ytdl_options_overrides=ytdl_options_overrides,
-                log_prefix_on_info_json_dl="Downloading metadata for",
-                url=url,
-            )
+        entry_dicts = YTDLP.extract_info_via_info_json(
+            working_directory=self.working_directory,
+            ytdl_options_overrides=self._with_download_archive_snapshot(ytdl_options_overrides),
+            log_prefix_on_info_json_dl="Downloading metadata for",
+            url=url,
+        )
+        # New info.json files now reside in the working directory
+        DirectoryFileIndex.invalidate()
 
         parents = EntryParent.from_entry_dicts(
             url=url,
@@ -437,6 +447,81 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
 
         return parents, orphans
 
+    @classmethod
+    def _is_newest_first(cls, probed_entries: List[Dict]) -> bool:
+        """
+        Flat entries only sometimes carry their upload time. When every probed entry does, use it
+        to make sure the url lists its newest items first, i.e. new items can not be appended
+        past the probed ones. Otherwise, trust the user that it does.
+        """
+        for date_key in ("timestamp", "release_timestamp", "upload_date"):
+            dates = [probed_entry.get(date_key) for probed_entry in probed_entries]
+            if all(date is not None for date in dates):
+                if all(newer >= older for newer, older in zip(dates, dates[1:])):
+                    return True
+
+                download_logger.debug("Probed items are not listed newest-first, not probing")
+                return False
+        return True
+
+    def _probe_url(
+        self, url: str, probe_items: int, ytdl_options_overrides: Dict
+    ) -> Optional[List[bool]]:
+        """
+        Fetches only the first few items of a url using a flat extraction, which does not fetch
+        each item's metadata. Only valid for urls that list their newest items first.
+
+        Returns
+        -------
+        Whether each probed item is in the download archive, in playlist order. None if the url
+        can not be probed, or its probed items are not listed newest-first.
+        """
+        if probe_items <= 0 or not self._enhanced_download_archive.download_archive_snapshot:
+            return None
+
+        if any(key in ytdl_options_overrides for key in self._PROBE_INCOMPATIBLE_YTDL_OPTIONS):
+            return None
+
+        probe_ytdl_options = {
+            key: value
+            for key, value in ytdl_options_overrides.items()
+            if key not in ("download_archive", "break_on_existing", "break_on_reject")
+        } | {
+            "extract_flat": "in_playlist",
+            "playlistend": probe_items,
+            "skip_download": True,
+            "writeinfojson": False,
+            "writethumbnail": False,
+        }
+
+        try:
+            probe_dict = YTDLP.extract_info(
+                ytdl_options_overrides=probe_ytdl_options, url=url, download=False
+            )
+        except Exception:  # pylint: disable=broad-except
+            download_logger.debug("Failed to probe %s, downloading its metadata instead", url)
+            return None
+
+        probed_entries = probe_dict.get("entries") if isinstance(probe_dict, dict) else None
+        if not probed_entries or not self._is_newest_first(probed_entries):
+            return None
+
+        is_downloaded: List[bool] = []
+        for probed_entry in probed_entries:
+            if not (
+                isinstance(probed_entry, dict)
+                and (extractor := probed_entry.get("ie_key") or probed_entry.get("extractor_key"))
+                and (entry_id := probed_entry.get("id"))
+            ):
+                return None
+
+            is_downloaded.append(
+                make_archive_id(ie=extractor, video_id=entry_id)
+                in self._enhanced_download_archive.download_archive_snapshot
+            )
+
+        return is_downloaded
+
     def _iterate_entries(
         self,
         parents: List[EntryParent],
@@ -446,18 +531,18 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
         """
         Downloads the leaf entries from EntryParent trees
         """
-        # Delete info json files afterwards so other collection URLs do not use them
-        with self._separate_download_archives(clear_info_json_files=True):
-            for parent in parents:
-                for entry_child in self._iterate_parent_entry(
-                    parent=parent, download_reversed=download_reversed
-                ):
-                    yield entry_child
-
-            for orphan in self._iterate_child_entries(
-                entries=orphans, download_reversed=download_reversed
+        for parent in parents:
+            for entry_child in self._iterate_parent_entry(
+                parent=parent, download_reversed=download_reversed
             ):
-                yield orphan
+                yield entry_child
+
+        for orphan in self._iterate_child_entries(
+            entries=orphans, download_reversed=download_reversed
+        ):
+            yield orphan
+
+        self._delete_info_json_files()
 
     def _download_metadata(self, url: str, validator: UrlValidator) -> Iterable[Entry]:
         metadata_ytdl_options = self.metadata_ytdl_options(
@@ -467,6 +552,25 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
             self.overrides.apply_formatter(validator.download_reverse)
         )
 
+        probed_is_downloaded = self._probe_url(
+            url=url,
+            probe_items=int(self.overrides.apply_formatter(validator.probe_items)),
+            ytdl_options_overrides=metadata_ytdl_options,
+        )
+        if probed_is_downloaded is not None:
+            if all(probed_is_downloaded):
+                download_logger.info("No new entries found when probing %s, skipping", url)
+                return
+
+            # The metadata download would break on the first existing entry anyway, stop
+            # right before it instead
+            if (
+                metadata_ytdl_options.get("break_on_existing")
+                and not probed_is_downloaded[0]
+                and True in probed_is_downloaded
+            ):
+                metadata_ytdl_options["playlistend"] = probed_is_downloaded.index(True)
+
         parents, orphan_entries = self._download_url_metadata(
             url=url,
             include_sibling_metadata=validator.include_sibling_metadata,
@@ -10,6 +10,7 @@ from ytdl_sub.script.parser import parse
 from ytdl_sub.validators.strict_dict_validator import StrictDictValidator
 from ytdl_sub.validators.string_formatter_validators import DictFormatterValidator
 from ytdl_sub.validators.string_formatter_validators import OverridesBooleanFormatterValidator
+from ytdl_sub.validators.string_formatter_validators import OverridesIntegerFormatterValidator
 from ytdl_sub.validators.string_formatter_validators import OverridesStringFormatterValidator
 from ytdl_sub.validators.string_formatter_validators import StringFormatterValidator
 from ytdl_sub.validators.validators import BoolValidator
@@ -53,6 +54,7 @@ class UrlValidator(StrictDictValidator):
         "download_reverse",
         "ytdl_options",
         "include_sibling_metadata",
+        "probe_items",
     }
 
     @classmethod
@@ -88,6 +90,9 @@ class UrlValidator(StrictDictValidator):
         self._include_sibling_metadata = self._validate_key(
             key="include_sibling_metadata", validator=BoolValidator, default=False
         )
+        self._probe_items = self._validate_key(
+            key="probe_items", validator=OverridesIntegerFormatterValidator, default="0"
+        )
 
     @property
     def url(self) -> OverridesStringFormatterValidator:
@@ -179,6 +184,21 @@ class UrlValidator(StrictDictValidator):
         """
         return self._include_sibling_metadata.value
 
+    @property
+    def probe_items(self) -> OverridesIntegerFormatterValidator:
+        """
+        Optional. Before downloading the URL's metadata, cheaply fetch only this many of its first
+        items without their metadata. If all of them are already in the download archive, the URL
+        is skipped entirely. Otherwise, the probe is used to bound how far the metadata download
+        goes when ``break_on_existing`` is enabled. Defaults to 0, which disables probing.
+
+        Only set this on URLs that list their newest videos first, i.e. a channel's ``/videos``
+        tab. Playlists that add new videos to the end would be skipped even when they have new
+        videos. When the probed items include their upload dates, URLs that are not listed
+        newest-first are detected and downloaded normally, but most sites do not include them.
+        """
+        return self._probe_items
+
 
 class UrlStringOrDictValidator(UrlValidator):
     """
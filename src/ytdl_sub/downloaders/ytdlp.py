@@ -3,6 +3,7 @@ import copy
 import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Callable
@@ -15,29 +16,77 @@ from yt_dlp.utils import ExistingVideoReached
 from yt_dlp.utils import MaxDownloadsReached
 from yt_dlp.utils import RejectedVideoReached
 
+from ytdl_sub.downloaders.parent_metadata_cache import ParentMetadataCache
 from ytdl_sub.thread.log_entries_downloaded_listener import LogEntriesDownloadedListener
 from ytdl_sub.utils.exceptions import FileNotDownloadedException
+from ytdl_sub.utils.file_handler import DirectoryFileIndex
+from ytdl_sub.utils.http_pool import HttpSessionPool
 from ytdl_sub.utils.logger import Logger
 
 
 class YTDLP:
     _EXTRACT_ENTRY_NUM_RETRIES: int = 5
     _EXTRACT_ENTRY_RETRY_WAIT_SEC: int = 5
+    _MAX_PARENT_METADATA_WORKERS: int = 4
 
     logger = Logger.get(name="yt-dlp-downloader")
 
     @classmethod
     @contextmanager
-    def ytdlp_downloader(cls, ytdl_options_overrides: Dict) -> ytdl.YoutubeDL:
+    def ytdlp_downloader(
+        cls, ytdl_options_overrides: Dict, handle_external_logs: bool = True
+    ) -> ytdl.YoutubeDL:
         """
         Context manager to interact with yt_dlp.
+
+        Parameters
+        ----------
+        ytdl_options_overrides
+            Dict containing ytdl args
+        handle_external_logs
+            Optional. Redirect yt-dlp's stdout/stderr to the logger. Redirection is process-wide,
+            so concurrent callers must redirect once around all threads instead.
         """
         cls.logger.debug("ytdl_options: %s", str(ytdl_options_overrides))
-        with Logger.handle_external_logs(name="yt-dlp"):
+        with (
+            Logger.handle_external_logs(name="yt-dlp")
+            if handle_external_logs
+            else contextlib.nullcontext()
+        ):
             # Deep copy ytdl_options in case yt-dlp modifies the dict
             with ytdl.YoutubeDL(copy.deepcopy(ytdl_options_overrides)) as ytdl_downloader:
                 yield ytdl_downloader
 
+    @classmethod
+    def _extract_parent_info(
+        cls, ytdl_options_overrides: Dict, uploader_url: str
+    ) -> Optional[Dict]:
+        """
+        Extracts only the parent (uploader) metadata of a url, or gets it from the cache. Ran
+        concurrently, so yt-dlp logs are expected to already be redirected by the caller.
+        """
+        return ParentMetadataCache.get_or_fetch(
+            uploader_url=uploader_url,
+            fetch=lambda: cls._fetch_parent_info(
+                ytdl_options_overrides=ytdl_options_overrides, uploader_url=uploader_url
+            ),
+            ytdl_options=ytdl_options_overrides,
+        )
+
+    @classmethod
+    def _fetch_parent_info(cls, ytdl_options_overrides: Dict, uploader_url: str) -> Optional[Dict]:
+        cls.logger.debug("Attempting to get parent metadata from URL %s", uploader_url)
+        try:
+            with HttpSessionPool.host_slot(uploader_url):
+                with cls.ytdlp_downloader(
+                    ytdl_options_overrides | {"playlist_items": "0:0"}, handle_external_logs=False
+                ) as ytdlp:
+                    return ytdlp.extract_info(url=uploader_url)
+        except Exception:  # pylint: disable=broad-except
+            return None
+        finally:
+            DirectoryFileIndex.invalidate()
+
     @classmethod
     def extract_info(cls, ytdl_options_overrides: Dict, **kwargs) -> Dict:
         """
@@ -51,8 +100,12 @@ class YTDLP:
         **kwargs
             arguments passed directory to YoutubeDL extract_info
         """
-        with cls.ytdlp_downloader(ytdl_options_overrides) as ytdlp:
-            return ytdlp.extract_info(**kwargs)
+        try:
+            with cls.ytdlp_downloader(ytdl_options_overrides) as ytdlp:
+                return ytdlp.extract_info(**kwargs)
+        finally:
+            # yt-dlp writes files outside of FileHandler, drop any cached directory listings
+            DirectoryFileIndex.invalidate()
 
     @classmethod
     def extract_info_with_retry(
@@ -188,6 +241,69 @@ class YTDLP:
         finally:
             info_json_listener.complete = True
 
+    @classmethod
+    def _extract_parent_dicts(
+        cls, ytdl_options_overrides: Dict, entry_dicts: List[Dict]
+    ) -> List[Dict]:
+        """
+        Try to get additional uploader (source) metadata that yt-dlp does not fetch
+        in a single request. Each distinct uploader is fetched once, concurrently
+
+        Parameters
+        ----------
+        ytdl_options_overrides
+            Dict containing ytdl args to override other predefined ytdl args
+        entry_dicts
+            Entry dicts read from the downloaded info.json files
+
+        Returns
+        -------
+        Parent dicts of uploaders that are not already present in the entry dicts
+        """
+        parent_dicts: List[Dict] = []
+        entry_ids = {entry_dict.get("id") for entry_dict in entry_dicts}
+
+        uploader_urls: Dict[str, str] = {}
+        for entry_dict in entry_dicts:
+            if not (uploader_id := entry_dict.get("uploader_id")):
+                continue
+
+            if uploader_id in entry_ids or not (uploader_url := entry_dict.get("uploader_url")):
+                continue
+
+            if uploader_id not in uploader_urls and uploader_url not in uploader_urls.values():
+                uploader_urls[uploader_id] = uploader_url
+
+        if not uploader_urls:
+            return parent_dicts
+
+        with (
+            Logger.handle_external_logs(name="yt-dlp"),
+            ThreadPoolExecutor(max_workers=cls._MAX_PARENT_METADATA_WORKERS) as executor,
+        ):
+            parent_dicts_by_uploader = list(
+                executor.map(
+                    lambda url: cls._extract_parent_info(
+                        ytdl_options_overrides=ytdl_options_overrides, uploader_url=url
+                    ),
+                    uploader_urls.values(),
+                )
+            )
+
+        for uploader_id, parent_dict in zip(uploader_urls.keys(), parent_dicts_by_uploader):
+            parent_id = parent_dict.get("id") if isinstance(parent_dict, dict) else None
+            if parent_id and parent_id not in entry_ids:
+                parent_dicts.append(parent_dict)
+                entry_ids.add(parent_id)
+                cls.logger.debug("Adding parent metadata with ids [%s, %s]", uploader_id, parent_id)
+
+            # Always add the uploader_id since it has been tried
+            entry_ids.add(uploader_id)
+
+        ParentMetadataCache.log_stats()
+
+        return parent_dicts
+
     @classmethod
     def extract_info_via_info_json(
         cls,
@@ -234,36 +350,7 @@ class YTDLP:
         except MaxDownloadsReached:
             cls.logger.info("MaxDownloadsReached, stopping additional downloads.")
 
-        parent_dicts: List[Dict] = []
         entry_dicts = cls._get_entry_dicts_from_info_json_files(working_directory=working_directory)
-        entry_ids = {entry_dict.get("id") for entry_dict in entry_dicts}
-
-        # Try to get additional uploader (source) metadata that yt-dlp does not fetch
-        # in a single request
-        for entry_dict in entry_dicts:
-            if not (uploader_id := entry_dict.get("uploader_id")):
-                continue
-
-            if uploader_id in entry_ids or not (uploader_url := entry_dict.get("uploader_url")):
-                continue
-
-            cls.logger.debug("Attempting to get parent metadata from URL %s", uploader_url)
-            parent_dict: Optional[Dict] = None
-            try:
-                parent_dict = cls.extract_info(
-                    ytdl_options_overrides=ytdl_options_overrides | {"playlist_items": "0:0"},
-                    url=uploader_url,
-                )
-            except Exception:  # pylint: disable=broad-except
-                pass
-
-            parent_id = parent_dict.get("id") if isinstance(parent_dict, dict) else None
-            if parent_id and parent_id not in entry_ids:
-                parent_dicts.append(parent_dict)
-                entry_ids.add(parent_id)
-                cls.logger.debug("Adding parent metadata with ids [%s, %s]", uploader_id, parent_id)
-
-            # Always add the uploader_id since it has been tried
-            entry_ids.add(uploader_id)
-
-        return entry_dicts + parent_dicts
+        return entry_dicts + cls._extract_parent_dicts(
+            ytdl_options_overrides=ytdl_options_overrides, entry_dicts=entry_dicts
+        )
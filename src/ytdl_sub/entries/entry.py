@@ -1,7 +1,6 @@
 # pylint: disable=protected-access
 import copy
 import json
-import os
 from pathlib import Path
 from typing import Any
 from typing import Dict
@@ -17,7 +16,7 @@ from ytdl_sub.entries.script.variable_types import ArrayVariable
 from ytdl_sub.entries.script.variable_types import StringVariable
 from ytdl_sub.entries.script.variable_types import Variable
 from ytdl_sub.script.utils.exceptions import ScriptVariableNotResolved
-from ytdl_sub.utils.script import ScriptUtils
+from ytdl_sub.utils.file_handler import DirectoryFileIndex
 from ytdl_sub.utils.scriptable import Scriptable
 from ytdl_sub.validators.audo_codec_validator import AUDIO_CODEC_EXTS
 from ytdl_sub.validators.audo_codec_validator import VIDEO_CODEC_EXTS
@@ -60,10 +59,7 @@ class Entry(BaseEntry, Scriptable):
         return self
 
     def _add_entry_kwargs_to_script(self) -> None:
-        # Add entry metadata, but avoid the `.add()` helper since it also adds sanitized
-        self.unresolvable.remove(v.entry_metadata.variable_name)
-        self.script.add({v.entry_metadata.variable_name: ScriptUtils.to_script(self._kwargs)})
-        self.update_script()
+        self.add({v.entry_metadata: self._kwargs})
 
     def get(self, variable: Variable, expected_type: Type[TypeT]) -> TypeT:
         """
@@ -117,7 +113,7 @@ class Entry(BaseEntry, Scriptable):
         for possible_ext in [ext, "mkv"]:
             file_name = self.base_filename(ext=possible_ext)
             file_path = str(Path(self.working_directory()) / file_name)
-            if os.path.isfile(file_path):
+            if DirectoryFileIndex.is_file(file_path):
                 return possible_ext
 
         return ext
@@ -162,7 +158,7 @@ class Entry(BaseEntry, Scriptable):
             possible_thumbnail_path = str(
                 Path(self.working_directory()) / possible_thumbnail_filename
             )
-            if os.path.isfile(possible_thumbnail_path):
+            if DirectoryFileIndex.is_file(possible_thumbnail_path):
                 return possible_thumbnail_path
 
         return None
@@ -177,6 +173,7 @@ class Entry(BaseEntry, Scriptable):
 
         with open(self.get_download_info_json_path(), "w", encoding="utf-8") as file:
             file.write(kwargs_json)
+        DirectoryFileIndex.add(self.get_download_info_json_path())
 
     @final
     def is_thumbnail_downloaded_via_ytdlp(self) -> bool:
@@ -194,7 +191,7 @@ class Entry(BaseEntry, Scriptable):
         -------
         True if the thumbnail file exists and is its proper format. False otherwise.
         """
-        return os.path.isfile(self.get_download_thumbnail_path())
+        return DirectoryFileIndex.is_file(self.get_download_thumbnail_path())
 
     @final
     def is_downloaded(self) -> bool:
@@ -203,15 +200,19 @@ class Entry(BaseEntry, Scriptable):
         -------
         True if the file exist locally. False otherwise.
         """
-        file_exists = os.path.isfile(self.get_download_file_path())
+        file_exists = DirectoryFileIndex.is_file(self.get_download_file_path())
 
         # HACK: yt-dlp does not record extracted/converted extensions anywhere. If the file is not
         # found, try it using all possible extensions
         if not file_exists:
-            for ext in AUDIO_CODEC_EXTS | VIDEO_CODEC_EXTS:
-                if os.path.isfile(self.get_download_file_path().removesuffix(self.ext) + ext):
-                    file_exists = True
-                    break
+            possible_file_names = {
+                self.base_filename(ext=ext) for ext in AUDIO_CODEC_EXTS | VIDEO_CODEC_EXTS
+            }
+            file_exists = not possible_file_names.isdisjoint(
+                DirectoryFileIndex.file_names(
+                    directory=self.working_directory(), prefix=self.uid_sanitized
+                )
+            )
 
         return file_exists
 
@@ -234,7 +235,7 @@ class Entry(BaseEntry, Scriptable):
         -------
         Dictionary containing all variables
         """
-        return self.script.resolve().as_native()
+        return self.script.resolve(include_virtual=True).as_native()
 
     @classmethod
     def create_split_entry(cls, entry: "Entry", new_uid: str) -> "Entry":
@@ -1,4 +1,3 @@
-import os.path
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -12,6 +11,7 @@ from ytdl_sub.entries.entry import Entry
 from ytdl_sub.entries.script.variable_definitions import VARIABLES
 from ytdl_sub.entries.script.variable_definitions import VariableDefinitions
 from ytdl_sub.utils.exceptions import FileNotDownloadedException
+from ytdl_sub.utils.file_handler import DirectoryFileIndex
 from ytdl_sub.utils.file_handler import FileMetadata
 from ytdl_sub.validators.audo_codec_validator import AUDIO_CODEC_EXTS
 from ytdl_sub.validators.audo_codec_validator import AUDIO_CODEC_TYPES_EXTENSION_MAPPING
@@ -134,7 +134,7 @@ class AudioExtractPlugin(Plugin[AudioExtractOptions]):
                     entry.get_download_file_path().removesuffix(entry.ext) + possible_ext
                 )
 
-                if os.path.isfile(extracted_audio_file):
+                if DirectoryFileIndex.is_file(extracted_audio_file):
                     new_ext = possible_ext
                     break
         else:
@@ -144,7 +144,7 @@ class AudioExtractPlugin(Plugin[AudioExtractOptions]):
         entry.add({v.ext: new_ext})
 
         if not self.is_dry_run:
-            if not os.path.isfile(extracted_audio_file):
+            if not DirectoryFileIndex.is_file(extracted_audio_file):
                 raise FileNotDownloadedException("Failed to find the extracted audio file")
 
         return entry
@@ -15,7 +15,7 @@ from ytdl_sub.entries.entry import ytdl_sub_split_by_chapters_parent_uid
 from ytdl_sub.entries.script.variable_definitions import VARIABLES
 from ytdl_sub.entries.script.variable_definitions import VariableDefinitions
 from ytdl_sub.utils.chapters import Chapters
-from ytdl_sub.utils.ffmpeg import set_ffmpeg_metadata_chapters
+from ytdl_sub.utils.ffmpeg import FFMPEGRemuxPlanner
 from ytdl_sub.utils.file_handler import FileMetadata
 from ytdl_sub.validators.regex_validator import RegexListValidator
 from ytdl_sub.validators.string_select_validator import StringSelectValidator
@@ -336,7 +336,7 @@ class ChaptersPlugin(Plugin[ChaptersOptions]):
                 entry.add({ytdl_sub_chapters_from_comments: chapters.to_yt_dlp_chapter_metadata()})
 
                 if not self.is_dry_run:
-                    set_ffmpeg_metadata_chapters(
+                    FFMPEGRemuxPlanner.set_chapters(
                         file_path=entry.get_download_file_path(),
                         chapters=chapters,
                         file_duration_sec=entry.get(v.duration, int),
@@ -1,4 +1,3 @@
-from typing import List
 from typing import Optional
 
 import mediafile
@@ -6,8 +5,7 @@ import mediafile
 from ytdl_sub.config.plugin.plugin import Plugin
 from ytdl_sub.config.validators.options import OptionsValidator
 from ytdl_sub.entries.entry import Entry
-from ytdl_sub.utils.ffmpeg import FFMPEG
-from ytdl_sub.utils.file_handler import FileHandler
+from ytdl_sub.utils.ffmpeg import FFMPEGRemuxPlanner
 from ytdl_sub.utils.file_handler import FileMetadata
 from ytdl_sub.utils.logger import Logger
 from ytdl_sub.validators.audo_codec_validator import AUDIO_CODEC_EXTS
@@ -37,34 +35,16 @@ class EmbedThumbnailPlugin(Plugin[EmbedThumbnailOptions]):
 
     @classmethod
     def _embed_video_thumbnail(cls, entry: Entry) -> None:
-        file_path = entry.get_download_file_path()
-        thumbnail_path = entry.get_download_thumbnail_path()
-        tmp_file_path = FFMPEG.tmp_file_path(file_path)
-        try:
-            ffmpeg_args: List[str] = [
-                "-i",
-                file_path,
-                "-i",
-                thumbnail_path,
-                "-map",
-                "1",
-                "-map",
-                "0",
-                "-dn",  # ignore data streams
-                "-c",
-                "copy",
-                "-bitexact",  # for reproducibility
-                "-disposition:0",
-                "attached_pic",
-                tmp_file_path,
-            ]
-            FFMPEG.run(ffmpeg_args)
-            FileHandler.move(tmp_file_path, file_path)
-        finally:
-            FileHandler.delete(tmp_file_path)
+        FFMPEGRemuxPlanner.set_attached_picture(
+            file_path=entry.get_download_file_path(),
+            picture_path=entry.get_download_thumbnail_path(),
+        )
 
     @classmethod
     def _embed_audio_file(cls, entry: Entry) -> None:
+        # mediafile edits the file directly, run any pending remuxes first
+        FFMPEGRemuxPlanner.run(entry.get_download_file_path())
+
         audio_file = mediafile.MediaFile(entry.get_download_file_path())
         with open(entry.get_download_thumbnail_path(), "rb") as thumb:
             mediafile_img = mediafile.Image(
@@ -12,6 +12,7 @@ from ytdl_sub.entries.entry import Entry
 from ytdl_sub.entries.script.variable_definitions import VARIABLES
 from ytdl_sub.entries.script.variable_definitions import VariableDefinitions
 from ytdl_sub.utils.exceptions import ValidationException
+from ytdl_sub.utils.ffmpeg import FFMPEGRemuxPlanner
 from ytdl_sub.utils.file_handler import FileMetadata
 from ytdl_sub.utils.logger import Logger
 from ytdl_sub.validators.audo_codec_validator import AUDIO_CODEC_EXTS
@@ -116,11 +117,18 @@ class MusicTagsPlugin(Plugin[MusicTagsOptions]):
             )
 
         # Resolve the tags into this dict
+        resolved_tags = self.overrides.apply_formatters(
+            {
+                (tag_name, idx): tag_formatter
+                for tag_name, tag_formatters in self.plugin_options.as_lists.items()
+                for idx, tag_formatter in enumerate(tag_formatters)
+            },
+            entry=entry,
+        )
         tags_to_write: Dict[str, List[str]] = defaultdict(list)
         for tag_name, tag_formatters in self.plugin_options.as_lists.items():
-            for tag_formatter in tag_formatters:
-                tag_value = self.overrides.apply_formatter(formatter=tag_formatter, entry=entry)
-                tags_to_write[tag_name].append(tag_value)
+            for idx in range(len(tag_formatters)):
+                tags_to_write[tag_name].append(resolved_tags[(tag_name, idx)])
 
             if _is_date_field(tag_name):
                 try:
@@ -135,6 +143,9 @@ class MusicTagsPlugin(Plugin[MusicTagsOptions]):
 
         # write the actual tags if its not a dry run
         if not self.is_dry_run:
+            # mediafile edits the file directly, run any pending remuxes first
+            FFMPEGRemuxPlanner.run(entry.get_download_file_path())
+
             audio_file = mediafile.MediaFile(entry.get_download_file_path())
             for tag_name, tag_value in tags_to_write.items():
                 # If the attribute is a date-type, set it as a datetime type
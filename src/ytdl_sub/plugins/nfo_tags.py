@@ -6,6 +6,7 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from ytdl_sub.config.plugin.plugin import Plugin
 from ytdl_sub.config.validators.options import ToggleableOptionsDictValidator
@@ -97,16 +98,34 @@ class SharedNfoTagsPlugin(Plugin[SharedNfoTagsOptions], ABC):
     Shared code between NFO tags and Ouptut Directory NFO Tags
     """
 
-    def _get_xml_element_dict(self, entry: Entry) -> Dict[str, List[XmlElement]]:
+    def _tag_formatters(self) -> Dict[Tuple[str, ...], StringFormatterValidator]:
+        """
+        Returns
+        -------
+        Every tag and attribute formatter, by (tag name, tag index, [attribute name])
+        """
+        formatters: Dict[Tuple[str, ...], StringFormatterValidator] = {}
+        for key, string_tags in self.plugin_options.tags.string_tags.items():
+            for idx, string_tag in enumerate(string_tags):
+                formatters[(key, str(idx))] = string_tag
+
+        for key, attribute_tags in self.plugin_options.tags.attribute_tags.items():
+            for idx, attribute_tag in enumerate(attribute_tags):
+                formatters[(key, str(idx))] = attribute_tag.tag
+                for attr_name, attr_formatter in attribute_tag.attributes.dict.items():
+                    formatters[(key, str(idx), attr_name)] = attr_formatter
+
+        return formatters
+
+    def _get_xml_element_dict(
+        self, resolved: Dict[Tuple[str, ...], str]
+    ) -> Dict[str, List[XmlElement]]:
         nfo_tags: Dict[str, List[XmlElement]] = defaultdict(list)
 
         for key, string_tags in self.plugin_options.tags.string_tags.items():
             tags = [
-                XmlElement(
-                    text=self.overrides.apply_formatter(formatter=string_tag, entry=entry),
-                    attributes={},
-                )
-                for string_tag in string_tags
+                XmlElement(text=resolved[(key, str(idx))], attributes={})
+                for idx in range(len(string_tags))
             ]
             # Do not add tags with empty text
             nfo_tags[key].extend(tag for tag in tags if tag.text)
@@ -114,15 +133,13 @@ class SharedNfoTagsPlugin(Plugin[SharedNfoTagsOptions], ABC):
         for key, attribute_tags in self.plugin_options.tags.attribute_tags.items():
             tags = [
                 XmlElement(
-                    text=self.overrides.apply_formatter(formatter=attribute_tag.tag, entry=entry),
+                    text=resolved[(key, str(idx))],
                     attributes={
-                        attr_name: self.overrides.apply_formatter(
-                            formatter=attr_formatter, entry=entry
-                        )
-                        for attr_name, attr_formatter in attribute_tag.attributes.dict.items()
+                        attr_name: resolved[(key, str(idx), attr_name)]
+                        for attr_name in attribute_tag.attributes.dict.keys()
                     },
                 )
-                for attribute_tag in attribute_tags
+                for idx, attribute_tag in enumerate(attribute_tags)
             ]
             # Do not add tags with empty text
             nfo_tags[key].extend(tag for tag in tags if tag.text)
@@ -131,11 +148,19 @@ class SharedNfoTagsPlugin(Plugin[SharedNfoTagsOptions], ABC):
         return {key: tags for key, tags in nfo_tags.items() if len(tags) > 0}
 
     def _create_nfo(self, entry: Entry, save_to_entry: bool = True) -> None:
-        # Write the nfo tags to XML with the nfo_root
-        nfo_root = self.overrides.apply_formatter(
-            formatter=self.plugin_options.nfo_root, entry=entry
+        # Resolve every formatter of the nfo at once
+        resolved = self.overrides.apply_formatters(
+            {
+                ("nfo_root",): self.plugin_options.nfo_root,
+                ("nfo_name",): self.plugin_options.nfo_name,
+                **self._tag_formatters(),
+            },
+            entry=entry,
         )
-        nfo_tags = self._get_xml_element_dict(entry=entry)
+
+        # Write the nfo tags to XML with the nfo_root
+        nfo_root = resolved[("nfo_root",)]
+        nfo_tags = self._get_xml_element_dict(resolved=resolved)
 
         # If the nfo tags are empty, then stop continuing
         if not nfo_tags:
@@ -156,9 +181,7 @@ class SharedNfoTagsPlugin(Plugin[SharedNfoTagsOptions], ABC):
 
         xml = to_xml(nfo_dict=nfo_tags, nfo_root=nfo_root)
 
-        nfo_file_name = self.overrides.apply_formatter(
-            formatter=self.plugin_options.nfo_name, entry=entry
-        )
+        nfo_file_name = resolved[("nfo_name",)]
 
         # Save the nfo's XML to file
         nfo_file_path = Path(self.working_directory) / nfo_file_name
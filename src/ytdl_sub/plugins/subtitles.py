@@ -11,6 +11,7 @@ from ytdl_sub.downloaders.ytdl_options_builder import YTDLOptionsBuilder
 from ytdl_sub.entries.entry import Entry
 from ytdl_sub.entries.script.variable_definitions import VARIABLES
 from ytdl_sub.entries.script.variable_definitions import VariableDefinitions
+from ytdl_sub.utils.file_handler import DirectoryFileIndex
 from ytdl_sub.utils.file_handler import FileHandler
 from ytdl_sub.utils.file_handler import FileMetadata
 from ytdl_sub.utils.logger import Logger
@@ -229,6 +230,7 @@ class SubtitlesPlugin(Plugin[SubtitleOptions]):
             for possible_ext in SUBTITLE_EXTENSIONS:
                 possible_subs_filename = entry.base_filename(ext=f"{lang}.{possible_ext}")
                 possible_subs_file = Path(self.working_directory) / possible_subs_filename
-                FileHandler.delete(possible_subs_file)
+                if DirectoryFileIndex.is_file(possible_subs_file):
+                    FileHandler.delete(possible_subs_file)
 
         return file_metadata
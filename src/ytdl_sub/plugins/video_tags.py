@@ -3,7 +3,7 @@ from typing import Dict
 from ytdl_sub.config.plugin.plugin import Plugin
 from ytdl_sub.config.validators.options import OptionsValidator
 from ytdl_sub.entries.entry import Entry
-from ytdl_sub.utils.ffmpeg import add_ffmpeg_metadata_key_values
+from ytdl_sub.utils.ffmpeg import FFMPEGRemuxPlanner
 from ytdl_sub.utils.file_handler import FileMetadata
 from ytdl_sub.utils.logger import Logger
 from ytdl_sub.validators.string_formatter_validators import DictFormatterValidator
@@ -33,14 +33,13 @@ class VideoTagsPlugin(Plugin[VideoTagsOptions]):
         """
         Tags the entry's audio file using values defined in the metadata options
         """
-        tags_to_write: Dict[str, str] = {}
-        for tag_name, tag_formatter in self.plugin_options.dict.items():
-            tag_value = self.overrides.apply_formatter(formatter=tag_formatter, entry=entry)
-            tags_to_write[tag_name] = tag_value
+        tags_to_write: Dict[str, str] = self.overrides.apply_formatters(
+            self.plugin_options.dict, entry=entry
+        )
 
-        # write the actual tags if its not a dry run
+        # write the actual tags if its not a dry run, fused with other remuxes of the file
         if not self.is_dry_run:
-            add_ffmpeg_metadata_key_values(
+            FFMPEGRemuxPlanner.add_metadata_key_values(
                 file_path=entry.get_download_file_path(),
                 key_values=tags_to_write,
             )
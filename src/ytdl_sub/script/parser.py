@@ -1,9 +1,13 @@
 import json
+import re
+import threading
 from enum import Enum
 from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 
 from ytdl_sub.script.functions import Functions
 from ytdl_sub.script.types.array import UnresolvedArray
@@ -94,6 +98,13 @@ MAP_KEY_NOT_HASHABLE = InvalidSyntaxException(
 )
 
 
+# Characters that are kept as-is outside of brackets
+_LITERAL_REGEX = re.compile(r"[^{}\\]+")
+_WHITESPACE_REGEX = re.compile(r"\s*")
+# Variable names end at the first breakable character, see _is_breakable
+_VARIABLE_NAME_REGEX = re.compile(r"[^\s},)\]:]*")
+
+
 def _is_variable_start(char: str) -> bool:
     return char.isalpha() and char.islower()
 
@@ -174,35 +185,25 @@ class _Parser:
         self._error_highlight_pos = pos if pos is not None else self._pos
 
     def _read(self, increment_pos: bool = True, length: int = 1) -> Optional[str]:
-        if isinstance(self._text, int):
-            pass
         if self._pos >= len(self._text):
             return None
 
-        try:
-            ch = self._text[self._pos : (self._pos + length)]
-        except IndexError:
-            return None
-
+        ch = self._text[self._pos : (self._pos + length)]
         if increment_pos:
             self._pos += length
         return ch
 
+    def _skip_whitespace(self) -> None:
+        self._pos = _WHITESPACE_REGEX.match(self._text, self._pos).end()
+
     def _parse_variable(self) -> Variable:
-        var_name = ""
         variable_start_pos = self._pos
-        while ch := self._read(increment_pos=False):
-            if ch.isspace() and not var_name:
-                self._pos += 1
-                continue
-            if _is_breakable(ch):
-                break
+        self._skip_whitespace()
 
-            if not var_name:
-                variable_start_pos = self._pos
-
-            var_name += ch
-            self._pos += 1
+        var_name = _VARIABLE_NAME_REGEX.match(self._text, self._pos).group()
+        if var_name:
+            variable_start_pos = self._pos
+        self._pos += len(var_name)
 
         try:
             validate_variable_name(var_name)
@@ -289,22 +290,19 @@ class _Parser:
         Begin parsing a string, including the quotation value
         """
         self._set_highlight_position()
-        string_value = ""
 
         if not _is_string_start_single_char(str_open_token) and not _is_string_start_multi_char(
             str_open_token
         ):
             raise UNREACHABLE
 
-        while ch := self._read(increment_pos=False):
-            if self._read(increment_pos=False, length=len(str_open_token)) == str_open_token:
-                self._pos += len(str_open_token)
-                return String(value=string_value)
-
-            self._pos += 1
-            string_value += ch
+        if (str_close_pos := self._text.find(str_open_token, self._pos)) == -1:
+            self._pos = len(self._text)
+            raise STRINGS_NOT_CLOSED
 
-        raise STRINGS_NOT_CLOSED
+        string_value = self._text[self._pos : str_close_pos]
+        self._pos = str_close_pos + len(str_open_token)
+        return String(value=string_value)
 
     def _parse_function_arg(self, argument_parser: ParsedArgType) -> Argument:
         if self._read(increment_pos=False) == "%":
@@ -358,7 +356,7 @@ class _Parser:
                 break
 
             if ch.isspace():
-                self._pos += 1
+                self._skip_whitespace()
             elif ch == ",":
                 self._set_highlight_position()
                 comma_count += 1
@@ -526,12 +524,8 @@ class _Parser:
                 self._literal_str = ""
 
             # Allow whitespace after bracket opening
-            while ch1 := self._read(increment_pos=False):
-                if not ch1.isspace():
-                    break
-                self._pos += 1
-
-            if ch1 is None:
+            self._skip_whitespace()
+            if (ch1 := self._read(increment_pos=False)) is None:
                 return False  # will hit closing bracket error
 
             if ch1 == "%":
@@ -572,7 +566,17 @@ class _Parser:
 
     def _parse(self) -> SyntaxTree:
 
-        while ch := self._read():
+        while True:
+            # Consume literal text in one go instead of character by character
+            if self._bracket_counter == 0 and (
+                literal := _LITERAL_REGEX.match(self._text, self._pos)
+            ):
+                self._literal_str += literal.group()
+                self._pos = literal.end()
+
+            if not (ch := self._read()):
+                break
+
             continue_parse = self._parse_main_loop(ch)
             if not continue_parse:
                 break
@@ -587,6 +591,82 @@ class _Parser:
         return SyntaxTree(ast=self._ast)
 
 
+class _ParseCache:
+    """
+    LRU cache of syntax trees by the text and name they were parsed with, so identical
+    definitions, like the same override across many subscriptions, are only parsed once. The
+    variables and custom functions a cached tree uses are checked against the names known to each
+    lookup, so a tree is never returned where parsing it would fail.
+    """
+
+    # Long texts are mostly unique entry metadata, which is not worth caching
+    _MAX_TEXT_LENGTH: int = 4096
+    _MAX_SIZE: int = 4096
+
+    _LOCK = threading.Lock()
+    # (text, name) to (tree, used custom function names, used variable names), least recently
+    # used first
+    _CACHE: Dict[Tuple[str, Optional[str]], Tuple[SyntaxTree, FrozenSet[str], FrozenSet[str]]] = {}
+
+    @classmethod
+    def get(
+        cls,
+        text: str,
+        name: Optional[str],
+        custom_function_names: Optional[Set[str]],
+        variable_names: Optional[Set[str]],
+    ) -> Optional[SyntaxTree]:
+        """
+        Returns
+        -------
+        The cached tree if it exists and only uses known variables and custom functions
+        """
+        with cls._LOCK:
+            if (cached := cls._CACHE.pop((text, name), None)) is None:
+                return None
+            cls._CACHE[(text, name)] = cached
+
+        tree, used_custom_function_names, used_variable_names = cached
+        if custom_function_names is not None and not used_custom_function_names.issubset(
+            custom_function_names
+        ):
+            return None
+        if variable_names is not None and not used_variable_names.issubset(variable_names):
+            return None
+        return tree
+
+    @classmethod
+    def put(cls, text: str, name: Optional[str], tree: SyntaxTree) -> None:
+        """
+        Caches a successfully parsed tree
+        """
+        if len(text) > cls._MAX_TEXT_LENGTH:
+            return
+
+        used_custom_function_names = frozenset(
+            function.name
+            for function in tree.custom_functions
+            if not Functions.is_built_in(function.name)
+        )
+        used_variable_names = frozenset(
+            variable.name
+            for variable in tree.variables
+            if not isinstance(variable, FunctionArgument)
+        )
+        with cls._LOCK:
+            cls._CACHE[(text, name)] = (tree, used_custom_function_names, used_variable_names)
+            if len(cls._CACHE) > cls._MAX_SIZE:
+                del cls._CACHE[next(iter(cls._CACHE))]
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Removes every cached tree
+        """
+        with cls._LOCK:
+            cls._CACHE.clear()
+
+
 def parse(
     text: str,
     name: Optional[str] = None,
@@ -596,12 +676,25 @@ def parse(
     """
     Entrypoint for parsing ytdl-sub code into a Syntax Tree
     """
-    return _Parser(
-        text=json.dumps(text) if not isinstance(text, str) else text,
+    text = json.dumps(text) if not isinstance(text, str) else text
+    if (
+        tree := _ParseCache.get(
+            text=text,
+            name=name,
+            custom_function_names=custom_function_names,
+            variable_names=variable_names,
+        )
+    ) is not None:
+        return tree
+
+    tree = _Parser(
+        text=text,
         name=name,
         custom_function_names=custom_function_names,
         variable_names=variable_names,
     ).ast
+    _ParseCache.put(text=text, name=name, tree=tree)
+    return tree
 
 
 # pylint: enable=invalid-name
@@ -0,0 +1,187 @@
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TypeVar
+
+from ytdl_sub.script.parser import parse
+from ytdl_sub.script.types.array import UnresolvedArray
+from ytdl_sub.script.types.function import BuiltInFunction
+from ytdl_sub.script.types.function import CustomFunction
+from ytdl_sub.script.types.function import Function
+from ytdl_sub.script.types.map import UnresolvedMap
+from ytdl_sub.script.types.resolvable import Argument
+from ytdl_sub.script.types.resolvable import Resolvable
+from ytdl_sub.script.types.syntax_tree import SyntaxTree
+from ytdl_sub.script.types.variable import FunctionArgument
+from ytdl_sub.script.types.variable import Variable
+from ytdl_sub.script.types.variable_dependency import VariableDependency
+from ytdl_sub.script.utils.exceptions import RuntimeException
+from ytdl_sub.script.utils.exceptions import ScriptVariableNotResolved
+from ytdl_sub.script.utils.exceptions import UserThrownRuntimeError
+from ytdl_sub.script.utils.exceptions import VariableDoesNotExist
+
+# Prefix of the names definitions are resolved under in ``Script.evaluate_many``, which are not
+# valid variable names
+_EVALUATE_VARIABLE_NAME = "%evaluate"
+
+EvaluateKeyT = TypeVar("EvaluateKeyT", bound=Hashable)
+
+
+def _partially_resolve_nested_arguments(
+    arg: VariableDependency, constants: Dict[Variable, Resolvable]
+) -> VariableDependency:
+    if isinstance(arg, UnresolvedArray):
+        return UnresolvedArray(
+            [partially_resolve_argument(arg=value, constants=constants) for value in arg.value]
+        )
+    if isinstance(arg, UnresolvedMap):
+        return UnresolvedMap(
+            {
+                partially_resolve_argument(
+                    arg=key, constants=constants
+                ): partially_resolve_argument(arg=value, constants=constants)
+                for key, value in arg.value.items()
+            }
+        )
+    return type(arg)(
+        name=arg.name,
+        args=[partially_resolve_argument(arg=value, constants=constants) for value in arg.args],
+    )
+
+
+def _is_constant(arg: VariableDependency) -> bool:
+    # Custom function bodies are not inlined, only their input arguments are resolved
+    if isinstance(arg, CustomFunction):
+        return False
+
+    # Lambdas can call custom functions, leave them to be resolved with the Script
+    if isinstance(arg, BuiltInFunction) and (
+        arg.function_spec.is_lambda_function or arg.function_spec.is_lambda_reduce_function
+    ):
+        return False
+
+    # pylint: disable=protected-access
+    return all(isinstance(value, Resolvable) for value in arg._iterable_arguments)
+    # pylint: enable=protected-access
+
+
+def partially_resolve_argument(arg: Argument, constants: Dict[Variable, Resolvable]) -> Argument:
+    """
+    Replaces the constant variables within the argument with their values, and evaluates the
+    function calls, arrays, and maps whose arguments are then all constant
+    """
+    if isinstance(arg, Variable):
+        return constants.get(arg, arg)
+
+    if not isinstance(arg, (UnresolvedArray, UnresolvedMap, Function)):
+        return arg
+
+    folded = _partially_resolve_nested_arguments(arg=arg, constants=constants)
+    if not _is_constant(folded):
+        return folded
+
+    try:
+        return folded.resolve(resolved_variables={}, custom_functions={})
+    except (RuntimeException, UserThrownRuntimeError):
+        # Raise the error when the variable is actually resolved
+        return folded
+
+
+def partially_resolve_definition(
+    definition: SyntaxTree, constants: Dict[Variable, Resolvable]
+) -> SyntaxTree:
+    """
+    Returns
+    -------
+    The definition with the constant variables inlined, resolved entirely if nothing else remains
+    """
+    ast = [partially_resolve_argument(arg=arg, constants=constants) for arg in definition.ast]
+    if all(isinstance(arg, Resolvable) for arg in ast):
+        ast = [SyntaxTree(ast=ast).resolve(resolved_variables={}, custom_functions={})]
+    return SyntaxTree(ast=ast)
+
+
+def parse_extra_definitions(
+    extra: Dict[str, str], variable_names: Set[str], custom_function_names: Set[str]
+) -> Dict[str, SyntaxTree]:
+    """
+    Parses variable definitions that take precedence over the Script's own for one evaluation
+    """
+    return {
+        name: parse(
+            text=definition,
+            name=name,
+            custom_function_names=custom_function_names,
+            variable_names=variable_names,
+        )
+        for name, definition in extra.items()
+    }
+
+
+def _evaluate_if_resolved(
+    tree: SyntaxTree,
+    variables: Dict[str, SyntaxTree],
+    unresolvable: Set[str],
+    custom_functions: Dict[str, VariableDependency],
+) -> Optional[Resolvable]:
+    """
+    Evaluates the definition directly if it only uses variables that are already resolved,
+    which is the case for most definitions. Returns None otherwise.
+    """
+    if (resolvable := tree.maybe_resolvable) is not None:
+        return resolvable
+
+    for variable in tree.variables:
+        if isinstance(variable, FunctionArgument):
+            continue
+        if variable.name in unresolvable:
+            raise ScriptVariableNotResolved(
+                f"Definition contains the variable {variable.name} which is set as unresolvable"
+            )
+        if variable.name not in variables:
+            raise VariableDoesNotExist(f"Variable {variable.name} does not exist.")
+
+    if tree.custom_functions or tree.lambdas or tree.function_arguments:
+        return None
+
+    resolved: Dict[Variable, Resolvable] = {}
+    for variable in tree.variables:
+        if (resolvable := variables[variable.name].maybe_resolvable) is None:
+            return None
+        resolved[variable] = resolvable
+
+    return tree.resolve(resolved_variables=resolved, custom_functions=custom_functions)
+
+
+def evaluate_resolved(
+    trees: Dict[EvaluateKeyT, SyntaxTree],
+    variables: Dict[str, SyntaxTree],
+    unresolvable: Set[str],
+    custom_functions: Dict[str, VariableDependency],
+) -> Tuple[Dict[EvaluateKeyT, Resolvable], Dict[str, EvaluateKeyT]]:
+    """
+    Evaluates the definitions that only use already resolved variables
+
+    Returns
+    -------
+    The evaluated definitions by their key, and the keys of the remaining definitions by the
+    variable name to resolve them under
+    """
+    evaluated: Dict[EvaluateKeyT, Resolvable] = {}
+    unevaluated: Dict[str, EvaluateKeyT] = {}
+    for key, tree in trees.items():
+        if (
+            resolvable := _evaluate_if_resolved(
+                tree=tree,
+                variables=variables,
+                unresolvable=unresolvable,
+                custom_functions=custom_functions,
+            )
+        ) is None:
+            unevaluated[f"{_EVALUATE_VARIABLE_NAME}_{len(unevaluated)}"] = key
+        else:
+            evaluated[key] = resolvable
+
+    return evaluated, unevaluated
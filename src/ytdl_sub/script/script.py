@@ -1,12 +1,18 @@
 # pylint: disable=missing-raises-doc
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Set
 
 from ytdl_sub.script.functions import Functions
 from ytdl_sub.script.parser import parse
+from ytdl_sub.script.partial_evaluation import EvaluateKeyT
+from ytdl_sub.script.partial_evaluation import evaluate_resolved
+from ytdl_sub.script.partial_evaluation import parse_extra_definitions
+from ytdl_sub.script.partial_evaluation import partially_resolve_definition
 from ytdl_sub.script.script_output import ScriptOutput
+from ytdl_sub.script.types.function import BuiltInFunction
 from ytdl_sub.script.types.resolvable import Lambda
 from ytdl_sub.script.types.resolvable import Resolvable
 from ytdl_sub.script.types.syntax_tree import SyntaxTree
@@ -26,6 +32,10 @@ def _is_function(override_name: str):
     return override_name.startswith("%")
 
 
+def _definition_variable_names(definitions: Iterable[SyntaxTree]) -> Set[str]:
+    return {variable.name for definition in definitions for variable in definition.variables}
+
+
 def _function_name(function_key: str) -> str:
     """
     Drop the % in %custom_function
@@ -46,6 +56,11 @@ class Script:
         ``{ variable_names: syntax }``
     and
         ``{ %custom_function: syntax }``
+
+    Optionally takes virtual variable suffixes and the built-in function that derives them,
+    i.e. ``{ "_sanitized": "sanitize" }`` makes ``title_sanitized`` available as
+    ``%sanitize(title)`` for every variable ``title``. Virtual variables are only added to the
+    Script once a definition uses them.
     """
 
     def _ensure_no_cycle(
@@ -212,13 +227,17 @@ class Script:
                     prefix=prefix, name=name, definition=definition
                 )
 
-    def __init__(self, script: Dict[str, str]):
+    def __init__(self, script: Dict[str, str], virtual_variables: Optional[Dict[str, str]] = None):
+        self._virtual_variables: Dict[str, str] = virtual_variables or {}
+        # Names of the virtual variables that have been added
+        self._virtual_variable_names: Set[str] = set()
+
         function_names: Set[str] = {
             _function_name(name) for name in script.keys() if _is_function(name)
         }
-        variable_names: Set[str] = {
-            validate_variable_name(name) for name in script.keys() if not _is_function(name)
-        }
+        variable_names: Set[str] = self._with_virtual_variable_names(
+            {validate_variable_name(name) for name in script.keys() if not _is_function(name)}
+        )
 
         self._functions: Dict[str, SyntaxTree] = {
             # custom_function_name must be passed to properly type custom function
@@ -243,14 +262,136 @@ class Script:
             for variable_key, variable_value in script.items()
             if not _is_function(variable_key)
         }
+
+        # Reverse dependency graph of the unresolved variables, from each variable name to the
+        # unresolved variables whose definitions use it
+        self._dependents: Dict[str, Set[str]] = {}
+        for variable_name, definition in self._variables.items():
+            self._link_dependencies(name=variable_name, definition=definition)
+
+        self.add_virtual_variables(
+            _definition_variable_names(
+                list(self._variables.values()) + list(self._functions.values())
+            )
+        )
         self._validate()
 
+    def _with_virtual_variable_names(self, variable_names: Set[str]) -> Set[str]:
+        """
+        The variable names along with every virtual variable name they make available
+        """
+        return variable_names.union(
+            f"{name}{suffix}" for name in variable_names for suffix in self._virtual_variables
+        )
+
+    def _virtual_variable_definition(self, name: str) -> Optional[SyntaxTree]:
+        for suffix, function_name in self._virtual_variables.items():
+            if name.endswith(suffix) and (base_name := name[: -len(suffix)]) in self._variables:
+                return SyntaxTree(
+                    ast=[BuiltInFunction(name=function_name, args=[Variable(base_name)])]
+                )
+        return None
+
+    def add_virtual_variables(self, variable_names: Iterable[str]) -> None:
+        """
+        Adds the virtual variables among the variable names to the Script. Virtual variables of
+        resolved variables are resolved right away.
+
+        Parameters
+        ----------
+        variable_names
+            Variable names that may be virtual. Names of existing or non-virtual variables are
+            ignored.
+        """
+        if not self._virtual_variables:
+            return
+
+        for name in variable_names:
+            if name in self._variables:
+                continue
+            if (definition := self._virtual_variable_definition(name)) is None:
+                continue
+
+            base_variable = definition.variables.pop()
+            if (resolvable := self._variables[base_variable.name].maybe_resolvable) is not None:
+                definition = SyntaxTree(
+                    ast=[
+                        definition.resolve(
+                            resolved_variables={base_variable: resolvable},
+                            custom_functions=self._functions,
+                        )
+                    ]
+                )
+
+            self._set_variable(name=name, definition=definition)
+            self._virtual_variable_names.add(name)
+
+    def _variable_dependencies(
+        self, definition: SyntaxTree, visited_functions: Optional[Set[str]] = None
+    ) -> Set[str]:
+        """
+        Names of the variables the definition uses, including within the custom functions it uses
+        """
+        visited_functions = visited_functions if visited_functions is not None else set()
+        dependencies: Set[str] = {
+            variable.name
+            for variable in definition.variables
+            if not isinstance(variable, FunctionArgument)
+        }
+        for custom_function in definition.custom_functions:
+            if (
+                custom_function.name in visited_functions
+                or custom_function.name not in self._functions
+            ):
+                continue
+            visited_functions.add(custom_function.name)
+            dependencies |= self._variable_dependencies(
+                definition=self._functions[custom_function.name],
+                visited_functions=visited_functions,
+            )
+        return dependencies
+
+    def _link_dependencies(self, name: str, definition: SyntaxTree) -> None:
+        if definition.maybe_resolvable is not None:
+            return  # resolved variables have no dependencies
+        for dependency in self._variable_dependencies(definition):
+            self._dependents.setdefault(dependency, set()).add(name)
+
+    def _unlink_dependencies(self, name: str, definition: SyntaxTree) -> None:
+        if definition.maybe_resolvable is not None:
+            return
+        for dependency in self._variable_dependencies(definition):
+            if dependency in self._dependents:
+                self._dependents[dependency].discard(name)
+
+    def _set_variable(self, name: str, definition: SyntaxTree) -> None:
+        """
+        Sets the variable's definition and updates the reverse dependency graph
+        """
+        if (previous := self._variables.get(name)) is not None:
+            self._unlink_dependencies(name=name, definition=previous)
+        self._variables[name] = definition
+        self._link_dependencies(name=name, definition=definition)
+
+    def _delete_variable(self, name: str) -> None:
+        if (previous := self._variables.pop(name, None)) is not None:
+            self._unlink_dependencies(name=name, definition=previous)
+
     def _update_internally(self, resolved_variables: Dict[str, Resolvable]) -> None:
         for variable_name, resolved in resolved_variables.items():
-            self._variables[variable_name] = SyntaxTree(ast=[resolved])
+            # Already stored as this resolvable
+            if (previous := self._variables.get(variable_name)) is not None and (
+                previous.maybe_resolvable is resolved
+            ):
+                continue
+            self._set_variable(name=variable_name, definition=SyntaxTree(ast=[resolved]))
 
     def _recursive_get_unresolved_output_filter_variables(
-        self, current_var: SyntaxTree, subset_to_resolve: Set[str], unresolvable: Set[Variable]
+        self,
+        current_var: SyntaxTree,
+        subset_to_resolve: Set[str],
+        unresolvable: Set[Variable],
+        variables: Dict[str, SyntaxTree],
     ) -> Set[str]:
         for var_dep in current_var.variables:
             if var_dep in unresolvable:
@@ -265,15 +406,17 @@ class Script:
 
             subset_to_resolve.add(var_dep.name)
             subset_to_resolve |= self._recursive_get_unresolved_output_filter_variables(
-                current_var=self._variables[var_dep.name],
+                current_var=variables[var_dep.name],
                 subset_to_resolve=subset_to_resolve,
                 unresolvable=unresolvable,
+                variables=variables,
             )
         for custom_func_dep in current_var.custom_functions:
             subset_to_resolve |= self._recursive_get_unresolved_output_filter_variables(
                 current_var=self._functions[custom_func_dep.name],
                 subset_to_resolve=subset_to_resolve,
                 unresolvable=unresolvable,
+                variables=variables,
             )
 
         return subset_to_resolve
@@ -283,6 +426,7 @@ class Script:
         unresolved: Dict[Variable, SyntaxTree],
         output_filter: Set[str],
         unresolvable: Set[Variable],
+        variables: Dict[str, SyntaxTree],
     ) -> Dict[Variable, SyntaxTree]:
         """
         When an output filter is applied, only a subset of variables that the filter
@@ -293,15 +437,16 @@ class Script:
         for output_filter_variable in output_filter:
             subset_to_resolve.add(output_filter_variable)
 
-            if output_filter_variable not in self._variables:
+            if output_filter_variable not in variables:
                 raise ScriptVariableNotResolved(
                     "Tried to specify an output filter variable that does not exist"
                 )
 
             subset_to_resolve |= self._recursive_get_unresolved_output_filter_variables(
-                current_var=self._variables[output_filter_variable],
+                current_var=variables[output_filter_variable],
                 subset_to_resolve=subset_to_resolve,
                 unresolvable=unresolvable,
+                variables=variables,
             )
 
         return {var: syntax for var, syntax in unresolved.items() if var.name in subset_to_resolve}
@@ -312,6 +457,7 @@ class Script:
         unresolvable: Optional[Set[str]] = None,
         update: bool = False,
         output_filter: Optional[Set[str]] = None,
+        variables: Optional[Dict[str, SyntaxTree]] = None,
     ) -> ScriptOutput:
         """
         Parameters
@@ -324,6 +470,10 @@ class Script:
         update
             Optional. Whether to update the internal representation of variables with their
             resolved value (if they get resolved).
+        output_filter
+            Optional. Only resolve these variables and their dependencies
+        variables
+            Optional. Variable definitions to resolve instead of the script's own
 
         Returns
         -------
@@ -340,9 +490,10 @@ class Script:
 
         unresolvable: Set[Variable] = {Variable(name) for name in (unresolvable or {})}
         unresolved_filter = set(resolved.keys()).union(unresolvable)
+        variables = self._variables if variables is None else variables
         unresolved: Dict[Variable, SyntaxTree] = {
             Variable(name): ast
-            for name, ast in self._variables.items()
+            for name, ast in variables.items()
             if Variable(name) not in unresolved_filter
         }
 
@@ -351,6 +502,7 @@ class Script:
                 unresolved=unresolved,
                 output_filter=output_filter,
                 unresolvable=unresolvable,
+                variables=variables,
             )
 
         while unresolved:
@@ -410,6 +562,7 @@ class Script:
         resolved: Optional[Dict[str, Resolvable]] = None,
         unresolvable: Optional[Set[str]] = None,
         update: bool = False,
+        include_virtual: bool = False,
     ) -> ScriptOutput:
         """
         Resolves the script
@@ -424,15 +577,29 @@ class Script:
         update
             Whether to update the script's internal values with the resolved variables instead of
             their original definition. This helps avoid re-evaluated the same variables repeatedly.
+        include_virtual
+            Whether to also output the virtual variables of every resolved variable. They are not
+            added to the Script.
 
         Returns
         -------
         ScriptOutput
             Containing all resolved variables.
         """
-        return self._resolve(
+        output = self._resolve(
             pre_resolved=resolved, unresolvable=unresolvable, update=update, output_filter=None
         )
+        if not include_virtual:
+            return output
+
+        resolved_variables = dict(output.output)
+        for name, resolvable in output.output.items():
+            for suffix, function_name in self._virtual_variables.items():
+                if (virtual_name := f"{name}{suffix}") not in resolved_variables:
+                    resolved_variables[virtual_name] = BuiltInFunction(
+                        name=function_name, args=[resolvable]
+                    ).resolve(resolved_variables={}, custom_functions=self._functions)
+        return ScriptOutput(resolved_variables)
 
     def add(self, variables: Dict[str, str], unresolvable: Optional[Set[str]] = None) -> "Script":
         """
@@ -462,16 +629,20 @@ class Script:
             name: definition for name, definition in variables.items() if not _is_function(name)
         }
 
+        variable_names = self._with_virtual_variable_names(
+            set(self._variables.keys()).union(variables_to_add.keys()).union(unresolvable or set())
+        )
+        parsed_definitions: List[SyntaxTree] = []
+
         for definitions in [functions_to_add, variables_to_add]:
             for name, definition in definitions.items():
                 parsed = parse(
                     text=definition,
                     name=name,
                     custom_function_names=set(self._functions.keys()),
-                    variable_names=set(self._variables.keys())
-                    .union(variables.keys())
-                    .union(unresolvable or set()),
+                    variable_names=variable_names,
                 )
+                parsed_definitions.append(parsed)
 
                 if parsed.maybe_resolvable is None:
                     added_variables_to_validate.add(name)
@@ -479,13 +650,115 @@ class Script:
                 if name in functions_to_add:
                     self._functions[name] = parsed
                 else:
-                    self._variables[name] = parsed
+                    self._set_variable(name=name, definition=parsed)
+                    self._virtual_variable_names.discard(name)
+
+        # Added virtual variables now derive from the new definitions
+        for name in variables_to_add:
+            for suffix in self._virtual_variables:
+                if (virtual_name := f"{name}{suffix}") in self._virtual_variable_names:
+                    self._set_variable(
+                        name=virtual_name,
+                        definition=self._virtual_variable_definition(virtual_name),
+                    )
+        self.add_virtual_variables(_definition_variable_names(parsed_definitions))
 
         if added_variables_to_validate:
             self._validate(added_variables=added_variables_to_validate)
 
         return self
 
+    def resolve_dependents(
+        self, variable_names: Set[str], unresolvable: Optional[Set[str]] = None
+    ) -> None:
+        """
+        Resolves the variables that were just added or changed, and any unresolved variables
+        that depend on them, and updates the script with their resolved values. Unlike
+        ``resolve(update=True)``, variables that are unaffected by the change are not revisited.
+
+        Parameters
+        ----------
+        variable_names
+            Names of the variables that were added or changed
+        unresolvable
+            Optional. Unresolvable variables that will be ignored in resolution, including all
+            variables with a dependency to them.
+        """
+        # Custom functions are not in the dependency graph
+        if any(_is_function(name) for name in variable_names):
+            self._resolve(unresolvable=unresolvable, update=True)
+            return
+
+        to_resolve: Set[str] = set()
+        visited: Set[str] = set()
+        to_visit: List[str] = list(variable_names)
+        while to_visit:
+            if (name := to_visit.pop()) in visited:
+                continue
+            visited.add(name)
+            if name in self._variables and self._variables[name].maybe_resolvable is None:
+                to_resolve.add(name)
+            to_visit.extend(self._dependents.get(name, set()))
+
+        # Include the unresolved variables they depend on to resolve them like a full pass would
+        to_visit = list(to_resolve)
+        while to_visit:
+            for dependency in self._variable_dependencies(self._variables[to_visit.pop()]):
+                if (
+                    dependency not in to_resolve
+                    and dependency in self._variables
+                    and self._variables[dependency].maybe_resolvable is None
+                ):
+                    to_resolve.add(dependency)
+                    to_visit.append(dependency)
+
+        if not to_resolve:
+            return
+
+        variables: Dict[str, SyntaxTree] = {name: self._variables[name] for name in to_resolve}
+        pre_resolved: Dict[str, Resolvable] = {}
+        for definition in variables.values():
+            for dependency in self._variable_dependencies(definition):
+                if dependency in self._variables and (
+                    (resolvable := self._variables[dependency].maybe_resolvable) is not None
+                ):
+                    pre_resolved[dependency] = resolvable
+
+        output = self._resolve(
+            pre_resolved=pre_resolved, unresolvable=unresolvable, variables=variables
+        ).output
+        self._update_internally(
+            resolved_variables={name: output[name] for name in to_resolve if name in output}
+        )
+
+    def partially_resolve(self, variable_names: Set[str]) -> None:
+        """
+        Inlines the values of the given resolved variables into the definitions of the unresolved
+        variables, and evaluates what becomes constant as a result, so resolving the remaining
+        variables repeats as little work as possible. Unresolved variables no longer depend on
+        the inlined variables, so they must not be added again afterwards.
+
+        Parameters
+        ----------
+        variable_names
+            Names of the resolved variables to inline. Their virtual variables are inlined too.
+        """
+        constants: Dict[Variable, Resolvable] = {}
+        for name in self._with_virtual_variable_names(variable_names):
+            if name in self._variables and (
+                (resolvable := self._variables[name].maybe_resolvable) is not None
+            ):
+                constants[Variable(name)] = resolvable
+
+        for name, definition in list(self._variables.items()):
+            if definition.maybe_resolvable is not None or not definition.contains(constants):
+                continue
+
+            self._set_variable(
+                name=name,
+                definition=partially_resolve_definition(definition=definition, constants=constants),
+            )
+
     def resolve_once(
         self,
         variable_definitions: Dict[str, str],
@@ -520,8 +793,121 @@ class Script:
             ).output
         finally:
             for name in variable_definitions.keys():
-                if name in self._variables:
-                    del self._variables[name]
+                self._delete_variable(name)
+
+    def validate_function_usage(self, name: str, tree: SyntaxTree) -> None:
+        """
+        Validates a parsed definition's usage of custom functions and lambdas against the Script.
+        ``evaluate`` does not perform this validation.
+
+        Parameters
+        ----------
+        name
+            Name of the definition to use in error messages
+        tree
+            Parsed definition to validate
+        """
+        self._ensure_custom_function_usage_num_input_arguments_valid(
+            prefix="", name=name, definition=tree
+        )
+        self._ensure_lambda_usage_num_input_arguments_valid(prefix="", name=name, definition=tree)
+
+    def evaluate_many(
+        self,
+        trees: Dict[EvaluateKeyT, SyntaxTree],
+        extra: Optional[Dict[str, str]] = None,
+        unresolvable: Optional[Set[str]] = None,
+    ) -> Dict[EvaluateKeyT, Resolvable]:
+        """
+        Evaluates already parsed definitions using the Script's current variables. Unlike
+        ``resolve_once``, the definitions are not re-parsed, added to the Script, or
+        re-validated, so they must have been validated against the Script beforehand.
+        Definitions with unresolved dependencies are resolved together in a single pass, so
+        dependencies they share are only resolved once.
+
+        Parameters
+        ----------
+        trees
+            Parsed definitions to evaluate, by any key
+        extra
+            Optional. Variable definitions that take precedence over the Script's own for this
+            evaluation only
+        unresolvable
+            Optional. Unresolvable variables that will be ignored in resolution, including all
+            variables with a dependency to them.
+
+        Returns
+        -------
+        Dict[EvaluateKeyT, Resolvable]
+            The evaluated definitions by their key
+
+        Raises
+        ------
+        ScriptVariableNotResolved
+            If a definition depends on an unresolvable variable
+        """
+        unresolvable = unresolvable or set()
+        self.add_virtual_variables(_definition_variable_names(trees.values()))
+
+        variables = self._variables
+        if extra:
+            variables = self._variables | parse_extra_definitions(
+                extra=extra,
+                variable_names=self.variable_names.union(extra.keys()).union(unresolvable),
+                custom_function_names=set(self._functions.keys()),
+            )
+
+        evaluated, unevaluated = evaluate_resolved(
+            trees=trees,
+            variables=variables,
+            unresolvable=unresolvable,
+            custom_functions=self._functions,
+        )
+
+        if unevaluated:
+            output = self._resolve(
+                unresolvable=unresolvable,
+                output_filter=set(unevaluated.keys()),
+                variables=dict(
+                    variables, **{name: trees[key] for name, key in unevaluated.items()}
+                ),
+            ).output
+            for name, key in unevaluated.items():
+                evaluated[key] = output[name]
+
+        return {key: evaluated[key] for key in trees.keys()}
+
+    def evaluate(
+        self,
+        tree: SyntaxTree,
+        extra: Optional[Dict[str, str]] = None,
+        unresolvable: Optional[Set[str]] = None,
+    ) -> Resolvable:
+        """
+        Evaluates a single already parsed definition. See ``evaluate_many``.
+
+        Parameters
+        ----------
+        tree
+            Parsed definition to evaluate
+        extra
+            Optional. Variable definitions that take precedence over the Script's own for this
+            evaluation only
+        unresolvable
+            Optional. Unresolvable variables that will be ignored in resolution, including all
+            variables with a dependency to them.
+
+        Returns
+        -------
+        Resolvable
+            The evaluated definition
+
+        Raises
+        ------
+        ScriptVariableNotResolved
+            If the definition depends on an unresolvable variable
+        """
+        return self.evaluate_many({0: tree}, extra=extra, unresolvable=unresolvable)[0]
 
     def get(self, variable_name: str) -> Resolvable:
         """
@@ -540,6 +926,7 @@ class Script:
         RuntimeException
             If the variable has not been resolved yet in the Script.
         """
+        self.add_virtual_variables([variable_name])
         if variable_name not in self._variables:
             raise RuntimeException(
                 f"Tried to get resolved variable {variable_name}, but it does not exist"
@@ -91,6 +91,7 @@ class BaseSubscription(ABC):
                     }}""",
             }
         )
+        self.overrides.partially_resolve_script()
 
         self._exception: Optional[Exception] = None
 
@@ -4,6 +4,7 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from mergedeep import mergedeep
 
@@ -11,6 +12,7 @@ from ytdl_sub.config.config_file import ConfigFile
 from ytdl_sub.config.preset import Preset
 from ytdl_sub.subscriptions.subscription_download import SubscriptionDownload
 from ytdl_sub.subscriptions.subscription_validators import SubscriptionValidator
+from ytdl_sub.utils.exceptions import ValidationException
 from ytdl_sub.utils.logger import Logger
 from ytdl_sub.utils.yaml import load_yaml
 from ytdl_sub.validators.validators import LiteralDictValidator
@@ -20,6 +22,10 @@ FILE_PRESET_APPLY_KEY = "__preset__"
 logger = Logger.get("subscription")
 
 
+def _subscription_error_message(subscription_name: str, subscription_path: str, error: str) -> str:
+    return f"Subscription '{subscription_name}' in {subscription_path}:\n{error}"
+
+
 class Subscription(SubscriptionDownload):
     @classmethod
     def from_preset(cls, preset: Preset, config: ConfigFile) -> "Subscription":
@@ -71,37 +77,19 @@ class Subscription(SubscriptionDownload):
         )
 
     @classmethod
-    def from_file_path(
+    def _subscription_dicts_from_file_path(
         cls,
         config: ConfigFile,
         subscription_path: str | Path,
         subscription_matches: Optional[List[str]] = None,
         subscription_override_dict: Optional[Dict] = None,
-    ) -> List["Subscription"]:
+    ) -> Tuple[ConfigFile, Dict[str, Dict]]:
         """
-        Loads subscriptions from a file.
-
-        Parameters
-        ----------
-        config:
-            Validated instance of the config
-        subscription_path:
-            File path to the subscription yaml file
-        subscription_matches:
-            Optional list, only output subscriptions that match one or more of these values
-        subscription_override_dict:
-            Optional dict containing overrides to every subscription
-
         Returns
         -------
-        List of subscriptions, for each one in the subscription yaml
-
-        Raises
-        ------
-        ValidationException
-            If subscription file is misconfigured
+        The config to use for the file's subscriptions, and the preset dict of each subscription
+        in the file
         """
-        subscriptions: List["Subscription"] = []
         subscription_object = load_yaml(file_path=subscription_path)
 
         has_file_preset = FILE_PRESET_APPLY_KEY in subscription_object
@@ -142,8 +130,7 @@ class Subscription(SubscriptionDownload):
                 if any(match in subscription_name for match in subscription_matches)
             }
 
-        for subscription_name, subscription_object in subscriptions_dicts.items():
-
+        for subscription_object in subscriptions_dicts.values():
             # Hard-override subscriptions here
             mergedeep.merge(
                 subscription_object,
@@ -151,12 +138,162 @@ class Subscription(SubscriptionDownload):
                 strategy=mergedeep.Strategy.ADDITIVE,
             )
 
-            subscriptions.append(
-                cls.from_dict(
+        return config, subscriptions_dicts
+
+    @classmethod
+    def from_file_path(
+        cls,
+        config: ConfigFile,
+        subscription_path: str | Path,
+        subscription_matches: Optional[List[str]] = None,
+        subscription_override_dict: Optional[Dict] = None,
+    ) -> List["Subscription"]:
+        """
+        Loads subscriptions from a file.
+
+        Parameters
+        ----------
+        config:
+            Validated instance of the config
+        subscription_path:
+            File path to the subscription yaml file
+        subscription_matches:
+            Optional list, only output subscriptions that match one or more of these values
+        subscription_override_dict:
+            Optional dict containing overrides to every subscription
+
+        Returns
+        -------
+        List of subscriptions, for each one in the subscription yaml
+
+        Raises
+        ------
+        ValidationException
+            If subscription file is misconfigured
+        """
+        config, subscriptions_dicts = cls._subscription_dicts_from_file_path(
+            config=config,
+            subscription_path=subscription_path,
+            subscription_matches=subscription_matches,
+            subscription_override_dict=subscription_override_dict,
+        )
+
+        return [
+            cls.from_dict(
+                config=config,
+                preset_name=subscription_name,
+                preset_dict=subscription_object,
+            )
+            for subscription_name, subscription_object in subscriptions_dicts.items()
+        ]
+
+    @classmethod
+    def _load_subscription_files(
+        cls,
+        config: ConfigFile,
+        subscription_paths: List[str],
+        subscription_matches: Optional[List[str]],
+        subscription_override_dict: Optional[Dict],
+    ) -> Tuple[List[Tuple[ConfigFile, str, Dict[str, Dict]]], List[str]]:
+        """
+        Returns
+        -------
+        The config, path, and subscription dicts of each file that loaded, and the errors of
+        the files that did not
+        """
+        errors: List[str] = []
+        files: List[Tuple[ConfigFile, str, Dict[str, Dict]]] = []
+        for subscription_path in subscription_paths:
+            try:
+                file_config, subscriptions_dicts = cls._subscription_dicts_from_file_path(
                     config=config,
-                    preset_name=subscription_name,
-                    preset_dict=subscription_object,
+                    subscription_path=subscription_path,
+                    subscription_matches=subscription_matches,
+                    subscription_override_dict=subscription_override_dict,
                 )
+            except ValidationException as exc:
+                errors.append(f"{subscription_path}:\n{exc}")
+                continue
+            files.append((file_config, subscription_path, subscriptions_dicts))
+
+        return files, errors
+
+    @classmethod
+    def _from_files(
+        cls, files: List[Tuple[ConfigFile, str, Dict[str, Dict]]]
+    ) -> Tuple[List["Subscription"], List[str]]:
+        """
+        Returns
+        -------
+        The subscriptions of each file, and the errors of the ones that failed to validate
+        """
+        errors: List[str] = []
+        subscriptions: List["Subscription"] = []
+        for file_config, subscription_path, subscriptions_dicts in files:
+            for subscription_name, subscription_object in subscriptions_dicts.items():
+                try:
+                    subscriptions.append(
+                        cls.from_dict(
+                            config=file_config,
+                            preset_name=subscription_name,
+                            preset_dict=subscription_object,
+                        )
+                    )
+                except ValidationException as exc:
+                    errors.append(
+                        _subscription_error_message(
+                            subscription_name=subscription_name,
+                            subscription_path=subscription_path,
+                            error=str(exc),
+                        )
+                    )
+
+        return subscriptions, errors
+
+    @classmethod
+    def from_file_paths(
+        cls,
+        config: ConfigFile,
+        subscription_paths: List[str],
+        subscription_matches: Optional[List[str]] = None,
+        subscription_override_dict: Optional[Dict] = None,
+    ) -> List["Subscription"]:
+        """
+        Loads subscriptions from many files. Every validation error is reported together.
+
+        Parameters
+        ----------
+        config:
+            Validated instance of the config
+        subscription_paths:
+            File paths to the subscription yaml files
+        subscription_matches:
+            Optional list, only output subscriptions that match one or more of these values
+        subscription_override_dict:
+            Optional dict containing overrides to every subscription
+
+        Returns
+        -------
+        List of subscriptions, for each one in the subscription yamls
+
+        Raises
+        ------
+        ValidationException
+            If any subscription file is misconfigured
+        """
+        files, errors = cls._load_subscription_files(
+            config=config,
+            subscription_paths=subscription_paths,
+            subscription_matches=subscription_matches,
+            subscription_override_dict=subscription_override_dict,
+        )
+
+        subscriptions, build_errors = cls._from_files(files=files)
+        errors.extend(build_errors)
+
+        if errors:
+            raise ValidationException(
+                f"{len(errors)} validation error(s) in the subscriptions:\n\n" + "\n\n".join(errors)
             )
 
         return subscriptions
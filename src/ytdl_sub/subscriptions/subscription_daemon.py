@@ -0,0 +1,285 @@
+import os
+import time
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from ytdl_sub.config.config_file import ConfigFile
+from ytdl_sub.subscriptions.subscription import Subscription
+from ytdl_sub.subscriptions.subscription_scheduler import SubscriptionScheduler
+from ytdl_sub.utils.logger import Logger
+
+logger = Logger.get("daemon")
+
+_TRIGGER_SUFFIX = ".trigger"
+
+
+class SubscriptionDaemon:
+    """
+    Keeps the config and validated subscriptions resident for ``ytdl-sub daemon``. Files are only
+    re-validated when their modification time changes, subscriptions are run on their schedule,
+    and other processes can trigger a subscription immediately by dropping a file into the
+    trigger directory.
+    """
+
+    # How often to check for triggers, changed files, and due subscriptions
+    POLL_INTERVAL_SEC: float = 5.0
+    # How long to wait before retrying a subscription that failed
+    _FAILURE_RETRY_SEC: float = 15 * 60
+
+    def __init__(
+        self,
+        config: ConfigFile,
+        config_path: Optional[str],
+        subscription_paths: List[str],
+        subscription_matches: List[str],
+    ):
+        """
+        Parameters
+        ----------
+        config
+            The already loaded config
+        config_path
+            Path to the config, None if the config is the default one
+        subscription_paths
+            Paths to the subscription files
+        subscription_matches
+            Optional list of substrings to match subscription names to (only run if matched)
+
+        Raises
+        ------
+        ValidationException
+            If the subscription files are misconfigured
+        """
+        self._config = config
+        self._config_path = config_path
+        self._subscription_paths = subscription_paths
+        self._subscription_matches = subscription_matches
+        self._started_at = time.time()
+
+        self._config_mtime = self._mtime(config_path) if config_path else None
+        self._subscription_mtimes: Dict[str, Optional[float]] = {}
+        self._subscriptions_by_path: Dict[str, List[Subscription]] = {}
+
+        self._scheduler = SubscriptionScheduler(
+            state_file_path=str(Path(config.config_options.cache_directory) / "schedule.json")
+        )
+        self._last_run: Dict[str, float] = {}
+        self._retry_at: Dict[str, float] = {}
+        self._next_run_times: Dict[str, float] = {}
+        self._triggered: List[str] = []
+
+        # Fail fast on startup, afterwards keep the last valid subscriptions on errors
+        for path in subscription_paths:
+            self._subscription_mtimes[path] = self._mtime(path)
+            self._subscriptions_by_path[path] = self._load_subscriptions(path)
+
+        os.makedirs(self.trigger_directory(config), exist_ok=True)
+
+    @classmethod
+    def trigger_directory(cls, config: ConfigFile) -> Path:
+        """
+        Returns
+        -------
+        Directory the daemon watches for trigger files
+        """
+        return Path(config.config_options.cache_directory) / "daemon" / "triggers"
+
+    @classmethod
+    def trigger(cls, config: ConfigFile, subscription_name: str) -> Path:
+        """
+        Asks a running daemon to run the subscription on its next poll
+
+        Returns
+        -------
+        Path to the trigger file
+        """
+        trigger_directory = cls.trigger_directory(config)
+        os.makedirs(trigger_directory, exist_ok=True)
+
+        trigger_path = trigger_directory / f"{time.time_ns()}.{os.getpid()}{_TRIGGER_SUFFIX}"
+        tmp_trigger_path = trigger_directory / f"{trigger_path.name}.tmp"
+        with open(tmp_trigger_path, "w", encoding="utf-8") as trigger_file:
+            trigger_file.write(subscription_name)
+        os.replace(tmp_trigger_path, trigger_path)
+        return trigger_path
+
+    @classmethod
+    def _mtime(cls, path: str) -> Optional[float]:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    @property
+    def config(self) -> ConfigFile:
+        """
+        Returns
+        -------
+        The most recent valid config
+        """
+        return self._config
+
+    @property
+    def subscriptions(self) -> List[Subscription]:
+        """
+        Returns
+        -------
+        All resident subscriptions
+        """
+        return [
+            subscription
+            for path in self._subscription_paths
+            for subscription in self._subscriptions_by_path.get(path, [])
+        ]
+
+    def _load_subscriptions(self, path: str) -> List[Subscription]:
+        subscriptions = Subscription.from_file_path(
+            config=self._config,
+            subscription_path=path,
+            subscription_matches=self._subscription_matches,
+        )
+        logger.info("Loaded %d subscriptions from %s", len(subscriptions), path)
+        return subscriptions
+
+    def reload(self) -> None:
+        """
+        Re-validates the config and subscription files that changed since they were last loaded.
+        A changed config reloads every subscription file. Files that fail to validate keep their
+        previously loaded subscriptions until they change again.
+        """
+        reload_all = False
+        if self._config_path and (mtime := self._mtime(self._config_path)) != self._config_mtime:
+            self._config_mtime = mtime
+            try:
+                self._config = ConfigFile.from_file_path(self._config_path)
+                reload_all = True
+                logger.info("Reloaded the config %s", self._config_path)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error(
+                    "Failed to reload the config %s, using the previous one: %s",
+                    self._config_path,
+                    exc,
+                )
+
+        for path in self._subscription_paths:
+            mtime = self._mtime(path)
+            if not reload_all and mtime == self._subscription_mtimes.get(path):
+                continue
+
+            self._subscription_mtimes[path] = mtime
+            try:
+                self._subscriptions_by_path[path] = self._load_subscriptions(path)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Failed to reload %s, using its previous subscriptions: %s", path, exc)
+                continue
+
+            self._next_run_times.clear()
+
+    def _read_triggers(self) -> None:
+        try:
+            trigger_paths = sorted(
+                path
+                for path in self.trigger_directory(self._config).iterdir()
+                if path.name.endswith(_TRIGGER_SUFFIX)
+            )
+        except OSError:
+            return
+
+        for trigger_path in trigger_paths:
+            try:
+                subscription_name = trigger_path.read_text(encoding="utf-8").strip()
+                trigger_path.unlink()
+            except OSError:
+                continue
+
+            if subscription_name not in self._triggered:
+                self._triggered.append(subscription_name)
+
+    def _next_run_time(self, subscription: Subscription) -> float:
+        name = subscription.name
+        if name in self._retry_at:
+            return self._retry_at[name]
+
+        if name not in self._next_run_times:
+            last_run = self._last_run.get(name, self._scheduler.last_checked(name))
+            if schedule := self._config.config_options.daemon.schedule_for(name):
+                next_run_time = schedule.next_run_time(
+                    last_run=last_run, started_at=self._started_at
+                )
+            elif last_run is None:
+                next_run_time = self._started_at
+            else:
+                next_run_time = last_run + SubscriptionScheduler.check_interval_sec(
+                    subscription.download_archive.mapping
+                )
+            self._next_run_times[name] = next_run_time
+
+        return self._next_run_times[name]
+
+    def due_subscriptions(self) -> List[Subscription]:
+        """
+        Returns
+        -------
+        Triggered subscriptions first, then subscriptions that are due on their schedule
+        """
+        self._read_triggers()
+        subscriptions_by_name = {
+            subscription.name: subscription for subscription in self.subscriptions
+        }
+
+        due_subscriptions: List[Subscription] = []
+        for subscription_name in self._triggered:
+            if subscription_name in subscriptions_by_name:
+                logger.info("Subscription %s was triggered", subscription_name)
+                due_subscriptions.append(subscriptions_by_name.pop(subscription_name))
+            else:
+                logger.warning("Ignoring trigger for unknown subscription %s", subscription_name)
+        self._triggered.clear()
+
+        now = time.time()
+        due_subscriptions.extend(
+            subscription
+            for subscription in subscriptions_by_name.values()
+            if self._next_run_time(subscription) <= now
+        )
+        return due_subscriptions
+
+    def mark_skipped(self, subscription: Subscription) -> None:
+        """
+        Records that another worker is running the subscription, so it is not due again until
+        its next scheduled run
+        """
+        name = subscription.name
+        self._retry_at.pop(name, None)
+        self._next_run_times.pop(name, None)
+        self._last_run[name] = time.time()
+
+    def mark_run(self, subscription: Subscription, dry_run: bool) -> None:
+        """
+        Records that the subscription ran. Failed subscriptions are retried after a delay.
+        """
+        name = subscription.name
+        self._next_run_times.pop(name, None)
+
+        if subscription.exception is not None:
+            self._retry_at[name] = time.time() + self._FAILURE_RETRY_SEC
+            logger.info(
+                "Retrying subscription %s in %s",
+                name,
+                SubscriptionScheduler.format_duration(self._FAILURE_RETRY_SEC),
+            )
+            return
+
+        self._retry_at.pop(name, None)
+        self._last_run[name] = time.time()
+        if not dry_run:
+            self._scheduler.mark_checked(subscription_name=name)
+
+        next_run_time = self._next_run_time(subscription)
+        logger.info(
+            "Next run of subscription %s is in %s",
+            name,
+            SubscriptionScheduler.format_duration(next_run_time - time.time()),
+        )
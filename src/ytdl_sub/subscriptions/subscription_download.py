@@ -1,11 +1,18 @@
 import contextlib
+import hashlib
+import json
 import logging
 import os
 import shutil
 from abc import ABC
 from pathlib import Path
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Set
+
+from yt_dlp.version import __version__ as yt_dlp_version
 
 from ytdl_sub.config.plugin.plugin import Plugin
 from ytdl_sub.config.plugin.plugin import SplitPlugin
@@ -21,6 +28,8 @@ from ytdl_sub.subscriptions.base_subscription import BaseSubscription
 from ytdl_sub.subscriptions.subscription_ytdl_options import SubscriptionYTDLOptions
 from ytdl_sub.utils.datetime import to_date_range
 from ytdl_sub.utils.exceptions import ValidationException
+from ytdl_sub.utils.ffmpeg import FFMPEGRemuxPlanner
+from ytdl_sub.utils.file_handler import DirectoryFileIndex
 from ytdl_sub.utils.file_handler import FileHandler
 from ytdl_sub.utils.file_handler import FileHandlerTransactionLog
 from ytdl_sub.utils.file_handler import FileMetadata
@@ -28,6 +37,8 @@ from ytdl_sub.utils.logger import Logger
 
 logger: logging.Logger = Logger.get()
 
+_RESUME_MANIFEST_FILE_NAME = ".ytdl-sub-resume.json"
+
 
 def _get_split_plugin(plugins: List[Plugin]) -> Optional[SplitPlugin]:
     split_plugins = [plugin for plugin in plugins if isinstance(plugin, SplitPlugin)]
@@ -63,22 +74,31 @@ class SubscriptionDownload(BaseSubscription, ABC):
         entry_metadata
             Optional. Metadata to record to the transaction log for this entry
         """
-        # Move the file after all direct file modifications are complete
-        output_file_name = self.overrides.apply_formatter(
-            formatter=self.output_options.file_name, entry=entry
+        # Resolve all output file names at once
+        output_names = self.overrides.apply_formatters(
+            {
+                name: formatter
+                for name, formatter in (
+                    ("file_name", self.output_options.file_name),
+                    ("thumbnail_name", self.output_options.thumbnail_name),
+                    ("info_json_name", self.output_options.info_json_name),
+                )
+                if formatter
+            },
+            entry=entry,
         )
+
+        # Move the file after all direct file modifications are complete
         self.download_archive.save_file_to_output_directory(
             file_name=entry.get_download_file_name(),
             file_metadata=entry_metadata,
-            output_file_name=output_file_name,
+            output_file_name=output_names["file_name"],
             entry=entry,
         )
 
         # Always pretend to include the thumbnail in a dry-run
         if self.output_options.thumbnail_name and (dry_run or entry.is_thumbnail_downloaded()):
-            output_thumbnail_name = self.overrides.apply_formatter(
-                formatter=self.output_options.thumbnail_name, entry=entry
-            )
+            output_thumbnail_name = output_names["thumbnail_name"]
 
             # Copy the thumbnails since they could be used later for other things
             self.download_archive.save_file_to_output_directory(
@@ -93,9 +113,7 @@ class SubscriptionDownload(BaseSubscription, ABC):
             )
 
         if self.output_options.info_json_name:
-            output_info_json_name = self.overrides.apply_formatter(
-                formatter=self.output_options.info_json_name, entry=entry
-            )
+            output_info_json_name = output_names["info_json_name"]
 
             # if not dry-run, write the info json
             if not dry_run:
@@ -111,22 +129,83 @@ class SubscriptionDownload(BaseSubscription, ABC):
         _ = is_error
         if os.path.isdir(self.working_directory):
             shutil.rmtree(self.working_directory)
+        DirectoryFileIndex.invalidate()
+
+    @property
+    def _is_working_directory_resumable(self) -> bool:
+        return (
+            self._config_options.resume_working_directory and not self.download_archive.is_dry_run
+        )
+
+    @property
+    def _resume_manifest_path(self) -> Path:
+        return Path(self.working_directory) / _RESUME_MANIFEST_FILE_NAME
+
+    def _resume_manifest(self) -> Dict[str, str]:
+        return {
+            "options_fingerprint": hashlib.sha256(self.as_yaml().encode("utf-8")).hexdigest(),
+            "yt_dlp_version": yt_dlp_version,
+        }
+
+    def _try_resume_working_directory(self) -> bool:
+        """
+        Returns
+        -------
+        True if the working directory was left behind by an interrupted run with the same options
+        and yt-dlp version, and can be reused. False otherwise.
+        """
+        try:
+            with open(self._resume_manifest_path, "r", encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return False
+
+        if manifest != self._resume_manifest():
+            logger.info(
+                "Options or yt-dlp version changed since the interrupted run of %s, "
+                "not resuming its working directory",
+                self.name,
+            )
+            return False
+
+        # Partial downloads and thumbnails are kept. info.json files are scoped to the URL that
+        # was being downloaded, so they get redownloaded.
+        for file_name in os.listdir(self.working_directory):
+            if file_name.endswith(".info.json"):
+                FileHandler.delete(Path(self.working_directory) / file_name)
+
+        logger.info("Resuming the working directory of the interrupted run of %s", self.name)
+        return True
 
     @contextlib.contextmanager
     def _prepare_working_directory(self):
         """
         Context manager to create all directories to the working directory. Deletes the entire
-        working directory when cleaning up.
+        working directory when cleaning up. If resuming is enabled, the working directory is kept
+        on error, and reused by the next run if it is still compatible.
         """
-        self._delete_working_directory()
+        if not (self._is_working_directory_resumable and self._try_resume_working_directory()):
+            self._delete_working_directory()
+
         os.makedirs(self.working_directory, exist_ok=True)
+        DirectoryFileIndex.invalidate()
+
+        if self._is_working_directory_resumable:
+            with open(self._resume_manifest_path, "w", encoding="utf-8") as manifest_file:
+                json.dump(self._resume_manifest(), manifest_file)
 
         try:
             yield
         except Exception as exc:
-            self._delete_working_directory(is_error=True)
+            if self._is_working_directory_resumable:
+                logger.info(
+                    "Keeping the working directory of %s to resume on the next run", self.name
+                )
+            else:
+                self._delete_working_directory(is_error=True)
             raise exc
         else:
+            # Only reached once the download archive has been saved
             self._delete_working_directory()
 
     @contextlib.contextmanager
@@ -163,24 +242,65 @@ class SubscriptionDownload(BaseSubscription, ABC):
             self.download_archive.save_download_mappings()
             FileHandler.delete(self.download_archive.working_file_path)
 
+    def _remove_all_empty_directories(self) -> None:
+        """
+        Walks the entire output directory and removes every empty directory
+        """
+        for root, dir_names, _ in os.walk(Path(self.output_directory), topdown=False):
+            for dir_name in dir_names:
+                dir_path = Path(root) / dir_name
+                if len(os.listdir(dir_path)) == 0:
+                    os.rmdir(dir_path)
+
+    def _remove_empty_parent_directories(self, file_names: Iterable[str]) -> None:
+        """
+        Walks upward from the directory of each file (relative to the output directory), removing
+        directories until reaching one that is not empty or the output directory itself
+        """
+        output_directory = Path(self.output_directory)
+        directories: Set[Path] = {(output_directory / file_name).parent for file_name in file_names}
+
+        # Visit the deepest directories first so their parents are emptied before being visited
+        for directory in sorted(directories, key=lambda path: len(path.parts), reverse=True):
+            while output_directory in directory.parents:
+                if not directory.is_dir() or len(os.listdir(directory)) > 0:
+                    break
+
+                os.rmdir(directory)
+                directory = directory.parent
+
+    def _mapped_file_names(self) -> Set[str]:
+        return {
+            file_name
+            for mapping in self.download_archive.mapping.entry_mappings.values()
+            for file_name in mapping.file_names
+        }
+
     @contextlib.contextmanager
     def _remove_empty_directories_in_output_directory(self):
+        mapped_file_names = self._mapped_file_names()
         try:
             yield
         finally:
             if not self.download_archive.is_dry_run:
-                for root, dir_names, _ in os.walk(Path(self.output_directory), topdown=False):
-                    for dir_name in dir_names:
-                        dir_path = Path(root) / dir_name
-                        if len(os.listdir(dir_path)) == 0:
-                            os.rmdir(dir_path)
+                if self._config_options.remove_all_empty_directories:
+                    self._remove_all_empty_directories()
+                else:
+                    # Directories can only become empty from files being removed in this session,
+                    # or from entries whose files were moved or renamed to another path
+                    self._remove_empty_parent_directories(
+                        file_names=self.transaction_log.files_removed
+                        | (mapped_file_names - self._mapped_file_names())
+                    )
 
     @contextlib.contextmanager
     def _subscription_download_context_managers(self) -> None:
+        # Remove empty directories after the archive's stale files are deleted, so directories
+        # they empty are removed too
         with (
             self._prepare_working_directory(),
-            self._maintain_archive_file(),
             self._remove_empty_directories_in_output_directory(),
+            self._maintain_archive_file(),
         ):
             yield
 
@@ -202,6 +322,7 @@ class SubscriptionDownload(BaseSubscription, ABC):
 
     @classmethod
     def _cleanup_entry_files(cls, entry: Entry):
+        FFMPEGRemuxPlanner.discard(entry.get_download_file_path())
         FileHandler.delete(entry.get_download_file_path())
         FileHandler.delete(entry.get_download_thumbnail_path())
         FileHandler.delete(entry.get_download_info_json_path())
@@ -226,6 +347,9 @@ class SubscriptionDownload(BaseSubscription, ABC):
             if optional_plugin_entry_metadata:
                 entry_metadata.extend(optional_plugin_entry_metadata)
 
+        # Plugins register their remuxes of the entry's file, perform them all in one pass
+        FFMPEGRemuxPlanner.run(entry.get_download_file_path())
+
         # Then, move it to the output directory
         self._move_entry_files_to_output_directory(
             dry_run=dry_run, entry=entry, entry_metadata=entry_metadata
@@ -268,6 +392,7 @@ class SubscriptionDownload(BaseSubscription, ABC):
 
         # Then, perform the split
         if entry_:
+            FFMPEGRemuxPlanner.run(entry_.get_download_file_path())
             for split_entry, split_entry_metadata in split_plugin.split(entry=entry_):
                 split_entry_: Optional[Entry] = split_entry
 
@@ -311,14 +436,21 @@ class SubscriptionDownload(BaseSubscription, ABC):
                 if isinstance(entry, tuple):
                     entry, entry_metadata = entry
 
-                if split_plugin := _get_split_plugin(plugins):
-                    self._process_split_entry(
-                        split_plugin=split_plugin, plugins=plugins, dry_run=dry_run, entry=entry
-                    )
-                else:
-                    self._process_entry(
-                        plugins=plugins, dry_run=dry_run, entry=entry, entry_metadata=entry_metadata
-                    )
+                try:
+                    if split_plugin := _get_split_plugin(plugins):
+                        self._process_split_entry(
+                            split_plugin=split_plugin, plugins=plugins, dry_run=dry_run, entry=entry
+                        )
+                    else:
+                        self._process_entry(
+                            plugins=plugins,
+                            dry_run=dry_run,
+                            entry=entry,
+                            entry_metadata=entry_metadata,
+                        )
+                finally:
+                    # If a plugin failed, do not apply its remuxes to a later file at the same path
+                    FFMPEGRemuxPlanner.clear()
 
         for plugin in plugins:
             plugin.post_process_subscription()
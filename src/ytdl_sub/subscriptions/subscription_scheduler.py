@@ -0,0 +1,128 @@
+import json
+import os
+import time
+from datetime import date
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from ytdl_sub.utils.logger import Logger
+from ytdl_sub.ytdl_additions.enhanced_download_archive import DownloadMappings
+
+logger = Logger.get("scheduler")
+
+_SEC_PER_DAY: float = 24 * 60 * 60
+
+
+class SubscriptionScheduler:
+    """
+    Decides which subscriptions are due to be checked in ``--scheduled`` mode. Each
+    subscription's check interval scales with its upload cadence, computed from the upload dates
+    in its download archive, so frequent uploaders are checked often and dormant ones rarely.
+    """
+
+    # How many recent uploads to compute the upload cadence from
+    _NUM_RECENT_UPLOADS: int = 10
+    # How many times to check within one expected upload cadence
+    _CHECKS_PER_UPLOAD: float = 24
+    _MIN_CHECK_INTERVAL_SEC: float = 30 * 60
+    _MAX_CHECK_INTERVAL_SEC: float = _SEC_PER_DAY
+
+    def __init__(self, state_file_path: str):
+        """
+        Parameters
+        ----------
+        state_file_path
+            Path to the json file that persists each subscription's last check time
+        """
+        self._state_file_path = state_file_path
+        self._last_checked: Dict[str, float] = {}
+
+        try:
+            with open(state_file_path, "r", encoding="utf-8") as state_file:
+                self._last_checked = {
+                    name: float(last_checked)
+                    for name, last_checked in json.load(state_file).get("last_checked", {}).items()
+                }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError):
+            logger.warning(
+                "Could not read the schedule at %s, checking all subscriptions", state_file_path
+            )
+
+    @classmethod
+    def check_interval_sec(cls, mapping: DownloadMappings, today: Optional[date] = None) -> float:
+        """
+        Parameters
+        ----------
+        mapping
+            The subscription's download mappings
+        today
+            Optional. Today's date, defaults to the current date
+
+        Returns
+        -------
+        How long to wait between checks of the subscription
+        """
+        today = today or date.today()
+        upload_dates: List[date] = sorted(
+            (date.fromisoformat(entry.upload_date) for entry in mapping.entry_mappings.values()),
+            reverse=True,
+        )[: cls._NUM_RECENT_UPLOADS]
+
+        # No history, check as often as possible
+        if not upload_dates:
+            return cls._MIN_CHECK_INTERVAL_SEC
+
+        # Average days between recent uploads. A channel that went quiet for longer than its
+        # usual cadence is treated as uploading at the rate of its silence
+        cadence_days = float((today - upload_dates[0]).days)
+        if len(upload_dates) > 1:
+            average_gap_days = (upload_dates[0] - upload_dates[-1]).days / (len(upload_dates) - 1)
+            cadence_days = max(cadence_days, average_gap_days)
+
+        interval_sec = cadence_days * _SEC_PER_DAY / cls._CHECKS_PER_UPLOAD
+        return min(max(interval_sec, cls._MIN_CHECK_INTERVAL_SEC), cls._MAX_CHECK_INTERVAL_SEC)
+
+    def last_checked(self, subscription_name: str) -> Optional[float]:
+        """
+        Returns
+        -------
+        Timestamp of the subscription's last successful check. None if it was never checked.
+        """
+        return self._last_checked.get(subscription_name)
+
+    def seconds_until_due(self, subscription_name: str, mapping: DownloadMappings) -> float:
+        """
+        Returns
+        -------
+        Seconds until the subscription is due to be checked. Zero or less if it is due.
+        """
+        if (last_checked := self._last_checked.get(subscription_name)) is None:
+            return 0.0
+        return last_checked + self.check_interval_sec(mapping) - time.time()
+
+    def mark_checked(self, subscription_name: str) -> None:
+        """
+        Records that the subscription was checked successfully, and persists the schedule
+        """
+        self._last_checked[subscription_name] = time.time()
+
+        os.makedirs(os.path.dirname(self._state_file_path) or ".", exist_ok=True)
+        tmp_state_file_path = f"{self._state_file_path}.tmp"
+        with open(tmp_state_file_path, "w", encoding="utf-8") as state_file:
+            json.dump({"last_checked": self._last_checked}, state_file, indent=2, sort_keys=True)
+        os.replace(tmp_state_file_path, self._state_file_path)
+
+    @classmethod
+    def format_duration(cls, seconds: float) -> str:
+        """
+        Returns
+        -------
+        The duration in a short human-readable form, i.e. 2h15m
+        """
+        minutes = max(int(seconds // 60), 0)
+        if minutes < 60:
+            return f"{minutes}m"
+        return f"{minutes // 60}h{minutes % 60:02d}m"
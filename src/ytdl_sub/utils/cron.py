@@ -0,0 +1,212 @@
+import re
+from datetime import datetime
+from datetime import timedelta
+from typing import Dict
+from typing import FrozenSet
+from typing import Optional
+from typing import Tuple
+
+# (min, max) of minute, hour, day of month, month, day of week
+_FIELD_RANGES: Tuple[Tuple[int, int], ...] = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+_FIELD_NAMES: Tuple[str, ...] = ("minute", "hour", "day of month", "month", "day of week")
+
+_MACROS: Dict[str, str] = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+}
+
+_INTERVAL_REGEX = re.compile(r"^\s*(\d+)\s*([smhdw]?)\s*$")
+_INTERVAL_UNIT_SEC: Dict[str, int] = {
+    "": 1,
+    "s": 1,
+    "m": 60,
+    "h": 60 * 60,
+    "d": 24 * 60 * 60,
+    "w": 7 * 24 * 60 * 60,
+}
+
+# Give up looking for the next match after this many days, i.e. for ``0 0 30 2 *``
+_MAX_SEARCH_DAYS: int = 5 * 366
+
+
+def _parse_field(field: str, field_idx: int) -> FrozenSet[int]:
+    field_min, field_max = _FIELD_RANGES[field_idx]
+    values = set()
+
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", maxsplit=1)
+            if not step_str.isdigit() or int(step_str) == 0:
+                raise ValueError(f"invalid step '{step_str}'")
+            step = int(step_str)
+
+        if part == "*":
+            start, end = field_min, field_max
+        elif "-" in part:
+            start_str, end_str = part.split("-", maxsplit=1)
+            if not start_str.isdigit() or not end_str.isdigit():
+                raise ValueError(f"invalid range '{part}'")
+            start, end = int(start_str), int(end_str)
+        elif part.isdigit():
+            start = int(part)
+            # 5/15 means every 15 starting at 5
+            end = field_max if step > 1 else start
+        else:
+            raise ValueError(f"invalid value '{part}'")
+
+        if not field_min <= start <= end <= field_max:
+            raise ValueError(f"'{part}' is out of the range {field_min}-{field_max}")
+
+        values.update(range(start, end + 1, step))
+
+    return frozenset(values)
+
+
+class CronExpression:
+    """
+    A standard 5-field cron expression: minute, hour, day of month, month, and day of week
+    (0 or 7 is Sunday). Supports ``*``, ranges, lists, steps, and the ``@daily`` style macros.
+    Times are in local time.
+    """
+
+    def __init__(self, expression: str):
+        """
+        Raises
+        ------
+        ValueError
+            If the expression is invalid
+        """
+        self._expression = expression
+        fields = _MACROS.get(expression.strip(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"expected 5 fields, got {len(fields)}")
+
+        parsed = []
+        for field_idx, field in enumerate(fields):
+            try:
+                parsed.append(_parse_field(field, field_idx))
+            except ValueError as exc:
+                raise ValueError(f"invalid {_FIELD_NAMES[field_idx]} field: {exc}") from exc
+
+        self._minutes = parsed[0]
+        self._hours = parsed[1]
+        self._days = parsed[2]
+        self._months = parsed[3]
+        self._days_of_week = frozenset(day % 7 for day in parsed[4])
+
+        # Like cron, if both day fields are restricted, a day matches if either of them does
+        self._any_day = fields[2] == "*"
+        self._any_day_of_week = fields[4] == "*"
+
+    @property
+    def expression(self) -> str:
+        """
+        Returns
+        -------
+        The original expression
+        """
+        return self._expression
+
+    def _matches_day(self, date_time: datetime) -> bool:
+        day_of_week = (date_time.weekday() + 1) % 7  # cron weeks start on Sunday
+        if self._any_day:
+            return day_of_week in self._days_of_week
+        if self._any_day_of_week:
+            return date_time.day in self._days
+        return date_time.day in self._days or day_of_week in self._days_of_week
+
+    def matches(self, date_time: datetime) -> bool:
+        """
+        Returns
+        -------
+        True if the expression matches the datetime's minute
+        """
+        return (
+            date_time.month in self._months
+            and self._matches_day(date_time)
+            and date_time.hour in self._hours
+            and date_time.minute in self._minutes
+        )
+
+    def next_after(self, date_time: datetime) -> datetime:
+        """
+        Returns
+        -------
+        The first matching minute strictly after the datetime
+
+        Raises
+        ------
+        ValueError
+            If the expression never matches
+        """
+        next_dt = date_time.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        give_up_dt = next_dt + timedelta(days=_MAX_SEARCH_DAYS)
+
+        # Skip whole days and hours that cannot match instead of stepping minute by minute
+        while next_dt < give_up_dt:
+            if next_dt.month not in self._months or not self._matches_day(next_dt):
+                next_dt = next_dt.replace(hour=0, minute=0) + timedelta(days=1)
+            elif next_dt.hour not in self._hours:
+                next_dt = next_dt.replace(minute=0) + timedelta(hours=1)
+            elif next_dt.minute not in self._minutes:
+                next_dt += timedelta(minutes=1)
+            else:
+                return next_dt
+
+        raise ValueError(f"cron expression '{self._expression}' never matches")
+
+
+class Schedule:
+    """
+    When to run a subscription in the daemon. Either a fixed interval like ``6h``, or a cron
+    expression like ``0 */6 * * *``.
+    """
+
+    def __init__(self, schedule: str):
+        """
+        Raises
+        ------
+        ValueError
+            If the schedule is neither a valid interval nor cron expression
+        """
+        self._schedule = schedule
+        self._interval_sec: Optional[int] = None
+        self._cron: Optional[CronExpression] = None
+
+        if match := _INTERVAL_REGEX.match(schedule):
+            self._interval_sec = int(match.group(1)) * _INTERVAL_UNIT_SEC[match.group(2)]
+            if self._interval_sec <= 0:
+                raise ValueError("interval must be greater than zero")
+        else:
+            self._cron = CronExpression(schedule)
+            # Fail now rather than in the daemon if it can never run
+            self._cron.next_after(datetime.now())
+
+    def __str__(self) -> str:
+        return self._schedule
+
+    def next_run_time(self, last_run: Optional[float], started_at: float) -> float:
+        """
+        Parameters
+        ----------
+        last_run
+            Timestamp of the last run, None if it never ran
+        started_at
+            Timestamp of when the daemon started
+
+        Returns
+        -------
+        Timestamp of the next run. Intervals run immediately if they never ran. Cron schedules
+        that missed a run while the daemon was stopped run once to catch up.
+        """
+        if self._interval_sec is not None:
+            return started_at if last_run is None else last_run + self._interval_sec
+
+        since = datetime.fromtimestamp(started_at if last_run is None else last_run)
+        return self._cron.next_after(since).timestamp()
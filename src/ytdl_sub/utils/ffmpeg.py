@@ -1,11 +1,19 @@
+import os
 import subprocess
 import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Deque
 from typing import Dict
 from typing import List
 from typing import Optional
 
 from ytdl_sub.utils.chapters import Chapters
 from ytdl_sub.utils.exceptions import ValidationException
+from ytdl_sub.utils.file_handler import DirectoryFileIndex
 from ytdl_sub.utils.file_handler import FileHandler
 from ytdl_sub.utils.logger import Logger
 
@@ -22,13 +30,36 @@ def _ffmpeg_metadata_escape(str_to_escape: str) -> str:
     return str_to_escape
 
 
+@dataclass(frozen=True)
+class FFMPEGRunTiming:
+    command: str
+    wall_time_sec: float
+    cpu_time_sec: Optional[float]
+
+
 class FFMPEG:
     _FFMPEG_PATH: str = ""
     _FFPROBE_PATH: str = ""
 
+    # Version line of the probed ffmpeg binary, None until probed
+    _FFMPEG_VERSION: Optional[str] = None
+
+    # Bounds the number of ffmpeg processes run concurrently by plugins
+    _MAX_CONCURRENT_RUNS: int = os.cpu_count() or 1
+    _RUN_SEMAPHORE = threading.BoundedSemaphore(_MAX_CONCURRENT_RUNS)
+
+    # Number of trailing stderr lines to attach to a failed run's exception
+    _STDERR_TAIL_LINES: int = 20
+
+    _RUN_TIMINGS: List[FFMPEGRunTiming] = []
+    _RUN_TIMINGS_LOCK = threading.Lock()
+
     @classmethod
     def set_paths(cls, ffmpeg_path: str, ffprobe_path: str) -> None:
         """Set ffmpeg paths for usage"""
+        if ffmpeg_path != cls._FFMPEG_PATH:
+            cls._FFMPEG_VERSION = None
+
         cls._FFMPEG_PATH = ffmpeg_path
         cls._FFPROBE_PATH = ffprobe_path
 
@@ -45,13 +76,31 @@ class FFMPEG:
         return cls._FFPROBE_PATH
 
     @classmethod
-    def _ensure_installed(cls):
-        try:
-            subprocess.check_output([cls.ffmpeg_path(), "-version"])
-        except subprocess.CalledProcessError as subprocess_error:
-            raise ValidationException(
-                "Trying to use a feature which requires ffmpeg, but it cannot be found"
-            ) from subprocess_error
+    def version(cls) -> str:
+        """
+        Probes the ffmpeg binary once per process, then returns the cached result.
+
+        Returns
+        -------
+        The first line of ``ffmpeg -version``
+
+        Raises
+        ------
+        ValidationException
+            If ffmpeg cannot be run
+        """
+        if cls._FFMPEG_VERSION is None:
+            try:
+                version_output = subprocess.check_output([cls.ffmpeg_path(), "-version"], text=True)
+            except subprocess.CalledProcessError as subprocess_error:
+                raise ValidationException(
+                    "Trying to use a feature which requires ffmpeg, but it cannot be found"
+                ) from subprocess_error
+
+            cls._FFMPEG_VERSION = next(iter(version_output.splitlines()), "")
+            logger.debug("Using %s", cls._FFMPEG_VERSION)
+
+        return cls._FFMPEG_VERSION
 
     @classmethod
     def tmp_file_path(cls, relative_file_path: str, extension: Optional[str] = None) -> str:
@@ -84,13 +133,121 @@ class FFMPEG:
         timeout
             Optional. timeout
         """
-        cls._ensure_installed()
+        cls.version()
 
-        cmd = [cls.ffmpeg_path()]
+        cmd = [cls.ffmpeg_path(), "-hide_banner"]
         cmd.extend(ffmpeg_args)
         logger.debug("Running %s", " ".join(cmd))
-        with Logger.handle_external_logs(name="ffmpeg"):
-            subprocess.run(cmd, check=True, capture_output=True, timeout=timeout)
+        try:
+            with cls._RUN_SEMAPHORE:
+                cls._run(cmd=cmd, timeout=timeout)
+        finally:
+            DirectoryFileIndex.invalidate()
+
+    @classmethod
+    def _wait(cls, process: subprocess.Popen) -> Optional[float]:
+        """
+        Waits for the process to exit.
+
+        Returns
+        -------
+        CPU time (user + system) of the process in seconds, if the platform reports it
+        """
+        if not hasattr(os, "wait4"):
+            process.wait()
+            return None
+
+        _, status, rusage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        return rusage.ru_utime + rusage.ru_stime
+
+    @classmethod
+    def _run(cls, cmd: List[str], timeout: Optional[float]) -> None:
+        stderr_tail: Deque[str] = deque(maxlen=cls._STDERR_TAIL_LINES)
+        start_time = time.perf_counter()
+
+        with subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+        ) as process:
+            timed_out = threading.Event()
+
+            def _kill_on_timeout() -> None:
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(timeout, _kill_on_timeout) if timeout else None
+            if timer:
+                timer.start()
+
+            try:
+                # Stream progress as it is written rather than buffering all of it
+                for line in process.stderr:
+                    if line := line.rstrip():
+                        stderr_tail.append(line)
+                        logger.debug("%s", line)
+
+                cpu_time_sec = cls._wait(process)
+            finally:
+                if timer:
+                    timer.cancel()
+
+        wall_time_sec = time.perf_counter() - start_time
+        with cls._RUN_TIMINGS_LOCK:
+            cls._RUN_TIMINGS.append(
+                FFMPEGRunTiming(
+                    command=" ".join(cmd),
+                    wall_time_sec=wall_time_sec,
+                    cpu_time_sec=cpu_time_sec,
+                )
+            )
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd=cmd, timeout=timeout, stderr="\n".join(stderr_tail))
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode=process.returncode, cmd=cmd, stderr="\n".join(stderr_tail)
+            )
+
+    @classmethod
+    def run_timings(cls) -> List[FFMPEGRunTiming]:
+        """
+        Returns
+        -------
+        Wall and CPU time of every ffmpeg run in this process
+        """
+        with cls._RUN_TIMINGS_LOCK:
+            return list(cls._RUN_TIMINGS)
+
+    @classmethod
+    def clear_run_timings(cls) -> None:
+        """
+        Forgets all recorded ffmpeg runs, i.e. between the runs of a long-lived process
+        """
+        with cls._RUN_TIMINGS_LOCK:
+            cls._RUN_TIMINGS.clear()
+
+    @classmethod
+    def log_timing_report(cls) -> None:
+        """
+        Logs the total and slowest ffmpeg runs at debug level
+        """
+        if not (timings := cls.run_timings()):
+            return
+
+        cpu_times = [timing.cpu_time_sec for timing in timings if timing.cpu_time_sec is not None]
+        logger.debug(
+            "Ran ffmpeg %d times, %.2fs wall time, %s CPU time",
+            len(timings),
+            sum(timing.wall_time_sec for timing in timings),
+            f"{sum(cpu_times):.2f}s" if cpu_times else "unknown",
+        )
+        for timing in sorted(timings, key=lambda timing: timing.wall_time_sec, reverse=True)[:5]:
+            logger.debug("%.2fs wall time: %s", timing.wall_time_sec, timing.command)
 
 
 def _create_metadata_chapter_entry(start_sec: int, end_sec: int, title: str) -> List[str]:
@@ -131,78 +288,131 @@ def _create_metadata_chapters(chapters: Chapters, file_duration_sec: int) -> Lis
     return lines
 
 
-def set_ffmpeg_metadata_chapters(
-    file_path: str, chapters: Optional[Chapters], file_duration_sec: int
-) -> None:
-    """
-    Sets ffmetadata chapters to a file. Note that this will (I think) wipe all prior
-    metadata.
-
-    Parameters
-    ----------
-    file_path
-        Full path to the file to add metadata to
-    chapters
-        Chapters to embed in the file. If a chapter for 0:00 does not exist, one is created
-    file_duration_sec
-        Length of the file in seconds
-    """
-    lines = [";FFMETADATA1"]
-
-    if chapters:
-        lines += _create_metadata_chapters(chapters=chapters, file_duration_sec=file_duration_sec)
-
-    tmp_file_path = FFMPEG.tmp_file_path(relative_file_path=file_path)
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".txt", encoding="utf-8", delete=False
-    ) as metadata_file:
-        metadata_file.write("\n".join(lines))
-        metadata_file.flush()
-
-    try:
-        FFMPEG.run(
-            [
-                "-i",
-                file_path,
-                "-i",
-                metadata_file.name,
-                "-map",
-                "0",
-                "-dn",  # ignore data streams
-                "-map_chapters",
-                "1",
-                "-bitexact",  # for reproducibility
-                "-codec",
-                "copy",
-                tmp_file_path,
-            ]
-        )
-        FileHandler.move(tmp_file_path, file_path)
-    finally:
-        FileHandler.delete(metadata_file.name)
+@dataclass
+class _RemuxPlan:
+    chapters_metadata: Optional[List[str]] = None
+    attached_picture_path: Optional[str] = None
+    metadata_key_values: Dict[str, str] = field(default_factory=dict)
 
 
-def add_ffmpeg_metadata_key_values(file_path: str, key_values: Dict[str, str]) -> None:
+class FFMPEGRemuxPlanner:
     """
-    Parameters
-    ----------
-    file_path
-        File to add metadata key/values to
-    key_values
-        The key/values to add
+    Collects stream-copy remux operations (chapters, attached picture, metadata key/values)
+    registered against a file, then fuses them into a single ffmpeg invocation so the file
+    only gets rewritten once.
     """
-    tmp_file_path = FFMPEG.tmp_file_path(file_path)
-
-    ffmpeg_args = [
-        "-i",
-        file_path,
-        "-map",
-        "0",
-        "-dn",  # ignore data streams
-    ]
-    for key, value in key_values.items():
-        ffmpeg_args.extend(["-metadata", f"{key}={value}"])
-    ffmpeg_args.extend(["-codec", "copy", "-bitexact", tmp_file_path])
 
-    FFMPEG.run(ffmpeg_args)
-    FileHandler.move(tmp_file_path, file_path)
+    _PLANS: Dict[str, _RemuxPlan] = {}
+
+    @classmethod
+    def _plan(cls, file_path: str) -> _RemuxPlan:
+        return cls._PLANS.setdefault(str(file_path), _RemuxPlan())
+
+    @classmethod
+    def set_chapters(
+        cls, file_path: str, chapters: Optional[Chapters], file_duration_sec: int
+    ) -> None:
+        """
+        Sets ffmetadata chapters to a file. Note that this will (I think) wipe all prior
+        chapters.
+
+        Parameters
+        ----------
+        file_path
+            Full path to the file to add chapters to
+        chapters
+            Chapters to embed in the file. If a chapter for 0:00 does not exist, one is created
+        file_duration_sec
+            Length of the file in seconds
+        """
+        lines = [";FFMETADATA1"]
+        if chapters:
+            lines += _create_metadata_chapters(
+                chapters=chapters, file_duration_sec=file_duration_sec
+            )
+
+        cls._plan(file_path).chapters_metadata = lines
+
+    @classmethod
+    def add_metadata_key_values(cls, file_path: str, key_values: Dict[str, str]) -> None:
+        """
+        Parameters
+        ----------
+        file_path
+            File to add metadata key/values to
+        key_values
+            The key/values to add
+        """
+        cls._plan(file_path).metadata_key_values.update(key_values)
+
+    @classmethod
+    def set_attached_picture(cls, file_path: str, picture_path: str) -> None:
+        """
+        Parameters
+        ----------
+        file_path
+            Video file to embed the picture into
+        picture_path
+            Picture to embed as the first stream of the file
+        """
+        cls._plan(file_path).attached_picture_path = picture_path
+
+    @classmethod
+    def discard(cls, file_path: str) -> None:
+        """
+        Drops any operations registered against the file without running them
+        """
+        cls._PLANS.pop(str(file_path), None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drops the operations registered against every file without running them
+        """
+        cls._PLANS.clear()
+
+    @classmethod
+    def run(cls, file_path: str) -> None:
+        """
+        Runs all operations registered against the file in a single ffmpeg invocation, if any.
+
+        Parameters
+        ----------
+        file_path
+            File to remux in-place
+        """
+        if (plan := cls._PLANS.pop(str(file_path), None)) is None:
+            return
+
+        input_args: List[str] = ["-i", file_path]
+        map_args: List[str] = ["-map", "0", "-dn"]  # ignore data streams
+        output_args: List[str] = ["-codec", "copy", "-bitexact"]  # for reproducibility
+        metadata_file_path: Optional[str] = None
+
+        if plan.attached_picture_path:
+            input_args += ["-i", plan.attached_picture_path]
+            map_args = ["-map", "1"] + map_args
+            output_args += ["-disposition:0", "attached_pic"]
+
+        if plan.chapters_metadata is not None:
+            with tempfile.NamedTemporaryFile(
+                mode="w", suffix=".txt", encoding="utf-8", delete=False
+            ) as metadata_file:
+                metadata_file.write("\n".join(plan.chapters_metadata))
+                metadata_file.flush()
+
+            metadata_file_path = metadata_file.name
+            map_args += ["-map_chapters", str(len(input_args) // 2)]
+            input_args += ["-i", metadata_file_path]
+
+        for key, value in plan.metadata_key_values.items():
+            map_args.extend(["-metadata", f"{key}={value}"])
+
+        tmp_file_path = FFMPEG.tmp_file_path(file_path)
+        try:
+            FFMPEG.run(input_args + map_args + output_args + [tmp_file_path])
+            FileHandler.move(tmp_file_path, file_path)
+        finally:
+            FileHandler.delete(tmp_file_path)
+            if metadata_file_path:
+                FileHandler.delete(metadata_file_path)
@@ -2,6 +2,7 @@ import hashlib
 import json
 import os
 import shutil
+import threading
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
@@ -355,6 +356,116 @@ class FileHandlerTransactionLog:
         return "\n".join(lines)
 
 
+class DirectoryFileIndex:
+    """
+    Caches the file names of directories that get probed repeatedly (i.e. the working directory),
+    grouped by their prefix before the first period (an entry's uid). Each directory is scanned
+    once, then kept up-to-date by FileHandler writes. Writes made by external processes
+    (yt-dlp, ffmpeg) must call ``invalidate`` so the next lookup re-scans. Thread-safe, since
+    thumbnails and parent metadata are written from worker threads.
+    """
+
+    _LOCK = threading.Lock()
+    _INDEX: Dict[str, Dict[str, Set[str]]] = {}
+
+    @classmethod
+    def _directory_key(cls, directory: Union[str, Path]) -> str:
+        return os.path.normpath(os.path.abspath(directory))
+
+    @classmethod
+    def _group(cls, file_name: str) -> str:
+        return file_name.split(".", maxsplit=1)[0]
+
+    @classmethod
+    def _get_or_scan(cls, directory: Union[str, Path]) -> Dict[str, Set[str]]:
+        # Must be called while holding the lock
+        directory_key = cls._directory_key(directory)
+        if directory_key in cls._INDEX:
+            return cls._INDEX[directory_key]
+
+        file_groups: Dict[str, Set[str]] = defaultdict(set)
+        if os.path.isdir(directory_key):
+            with os.scandir(directory_key) as dir_entries:
+                for dir_entry in dir_entries:
+                    if dir_entry.is_file():
+                        file_groups[cls._group(dir_entry.name)].add(dir_entry.name)
+
+        cls._INDEX[directory_key] = file_groups
+        return file_groups
+
+    @classmethod
+    def is_file(cls, file_path: Union[str, Path]) -> bool:
+        """
+        Parameters
+        ----------
+        file_path
+            Full path to the file
+
+        Returns
+        -------
+        True if the file exists. False otherwise.
+        """
+        directory, file_name = os.path.split(file_path)
+        with cls._LOCK:
+            return file_name in cls._get_or_scan(directory).get(cls._group(file_name), set())
+
+    @classmethod
+    def file_names(cls, directory: Union[str, Path], prefix: Optional[str] = None) -> List[str]:
+        """
+        Parameters
+        ----------
+        directory
+            Directory containing the files
+        prefix
+            Optional. File name prefix, i.e. the entry's uid
+
+        Returns
+        -------
+        Sorted file names within the directory that begin with the prefix, or all of them if
+        no prefix is given
+        """
+        with cls._LOCK:
+            file_groups = cls._get_or_scan(directory)
+            if prefix is None:
+                return sorted(set().union(*file_groups.values()))
+
+            return sorted(
+                file_name
+                for file_name in file_groups.get(cls._group(prefix), set())
+                if file_name.startswith(prefix)
+            )
+
+    @classmethod
+    def add(cls, file_path: Union[str, Path]) -> None:
+        """
+        Records a file written to an indexed directory
+        """
+        directory, file_name = os.path.split(file_path)
+        directory_key = cls._directory_key(directory)
+        with cls._LOCK:
+            if directory_key in cls._INDEX:
+                cls._INDEX[directory_key][cls._group(file_name)].add(file_name)
+
+    @classmethod
+    def remove(cls, file_path: Union[str, Path]) -> None:
+        """
+        Records a file removed from an indexed directory
+        """
+        directory, file_name = os.path.split(file_path)
+        directory_key = cls._directory_key(directory)
+        with cls._LOCK:
+            if directory_key in cls._INDEX:
+                cls._INDEX[directory_key][cls._group(file_name)].discard(file_name)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Drops all indexed directories, forcing them to be re-scanned on their next lookup
+        """
+        with cls._LOCK:
+            cls._INDEX.clear()
+
+
 class FileHandler:
     """
     Performs and tracks all file moving/copying/deleting
@@ -386,6 +497,7 @@ class FileHandler:
             Destination file
         """
         shutil.copyfile(src=src_file_path, dst=dst_file_path)
+        DirectoryFileIndex.add(dst_file_path)
 
     @classmethod
     def move(cls, src_file_path: Union[str, Path], dst_file_path: Union[str, Path]):
@@ -404,6 +516,8 @@ class FileHandler:
         """
         try:
             shutil.move(src=src_file_path, dst=dst_file_path)
+            DirectoryFileIndex.remove(src_file_path)
+            DirectoryFileIndex.add(dst_file_path)
         except OSError:
             # Invalid cross-device link
             # Can happen from using os.rename under the hood, which requires the two file on the
@@ -421,6 +535,7 @@ class FileHandler:
         """
         if os.path.isfile(file_path):
             os.remove(file_path)
+            DirectoryFileIndex.remove(file_path)
 
     def move_file_to_output_directory(
         self,
@@ -0,0 +1,221 @@
+import http.client
+import ssl
+import threading
+import urllib.request
+from contextlib import contextmanager
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from urllib.error import HTTPError
+from urllib.error import URLError
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+from urllib.request import Request
+from urllib.request import getproxies
+from urllib.request import proxy_bypass
+from urllib.request import urlopen
+
+from ytdl_sub.utils.logger import Logger
+
+logger = Logger.get("http")
+
+# (scheme, host, port)
+_HostKey = Tuple[str, str, int]
+
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+class HttpSessionPool:
+    """
+    Shares keep-alive HTTP(S) connections across threads for small secondary fetches like
+    thumbnails, and limits how many requests run against a single host at once.
+    """
+
+    _MAX_CONNECTIONS_PER_HOST: int = 4
+    _MAX_REDIRECTS: int = 5
+    _HEADERS: Dict[str, str] = {"User-Agent": f"Python-urllib/{urllib.request.__version__}"}
+
+    _LOCK = threading.Lock()
+    _IDLE_CONNECTIONS: Dict[_HostKey, List[http.client.HTTPConnection]] = {}
+    _HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+    _SSL_CONTEXT: Optional[ssl.SSLContext] = None
+
+    @classmethod
+    @contextmanager
+    def host_slot(cls, url: str) -> Iterator[None]:
+        """
+        Blocks until fewer than the max number of concurrent requests are running against the
+        url's host. Can also be used to limit requests made outside the pool, i.e. by yt-dlp.
+        """
+        host = urlsplit(url).hostname or ""
+        with cls._LOCK:
+            if host not in cls._HOST_SLOTS:
+                cls._HOST_SLOTS[host] = threading.BoundedSemaphore(cls._MAX_CONNECTIONS_PER_HOST)
+            slot = cls._HOST_SLOTS[host]
+
+        with slot:
+            yield
+
+    @classmethod
+    def _uses_urllib(cls, url: str) -> bool:
+        """
+        Proxies and non-http schemes are left to urllib
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            return True
+        return parts.scheme in getproxies() and not proxy_bypass(parts.hostname or "")
+
+    @classmethod
+    def _host_key(cls, url: str) -> _HostKey:
+        parts = urlsplit(url)
+        default_port = 443 if parts.scheme == "https" else 80
+        return parts.scheme, parts.hostname or "", parts.port or default_port
+
+    @classmethod
+    def _new_connection(cls, key: _HostKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            if cls._SSL_CONTEXT is None:
+                cls._SSL_CONTEXT = ssl.create_default_context()
+            return http.client.HTTPSConnection(
+                host, port, timeout=timeout, context=cls._SSL_CONTEXT
+            )
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    @classmethod
+    def _acquire_connection(
+        cls, key: _HostKey, timeout: float
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        with cls._LOCK:
+            idle_connections = cls._IDLE_CONNECTIONS.get(key)
+            connection = idle_connections.pop() if idle_connections else None
+
+        if connection is None:
+            return cls._new_connection(key, timeout=timeout), False
+
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection, True
+
+    @classmethod
+    def _release_connection(
+        cls,
+        key: _HostKey,
+        connection: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ) -> None:
+        # Only reuse the connection if the response was fully read and the server keeps it open
+        if not response.isclosed() or response.will_close:
+            connection.close()
+            return
+
+        with cls._LOCK:
+            idle_connections = cls._IDLE_CONNECTIONS.setdefault(key, [])
+            if len(idle_connections) < cls._MAX_CONNECTIONS_PER_HOST:
+                idle_connections.append(connection)
+                return
+
+        connection.close()
+
+    @classmethod
+    def _request(
+        cls, url: str, headers: Dict[str, str], timeout: float
+    ) -> Tuple[_HostKey, http.client.HTTPConnection, http.client.HTTPResponse]:
+        key = cls._host_key(url)
+        parts = urlsplit(url)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        connection, is_reused = cls._acquire_connection(key, timeout=timeout)
+        try:
+            connection.request("GET", path, headers=cls._HEADERS | headers)
+            return key, connection, connection.getresponse()
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            if not is_reused:
+                raise
+
+        # The server closed the idle keep-alive connection, retry once on a new one
+        logger.debug("Reconnecting to %s after a stale keep-alive connection", key[1])
+        connection = cls._new_connection(key, timeout=timeout)
+        try:
+            connection.request("GET", path, headers=cls._HEADERS | headers)
+            return key, connection, connection.getresponse()
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            raise
+
+    @classmethod
+    @contextmanager
+    def open(
+        cls, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10.0
+    ) -> Iterator[http.client.HTTPResponse]:
+        """
+        GETs a url using a pooled keep-alive connection. Follows redirects.
+
+        Parameters
+        ----------
+        url
+            URL to get
+        headers
+            Optional. Request headers
+        timeout
+            Socket timeout in seconds
+
+        Yields
+        ------
+        The response. Read it fully for its connection to be reused.
+
+        Raises
+        ------
+        HTTPError
+            If the response is not successful, same as urlopen
+        URLError
+            If urlopen fails to reach a file or ftp url
+        """
+        headers = headers or {}
+        if cls._uses_urllib(url):
+            with urlopen(Request(url, headers=headers), timeout=timeout) as response:
+                yield response
+            return
+
+        with cls.host_slot(url):
+            for _ in range(cls._MAX_REDIRECTS + 1):
+                key, connection, response = cls._request(url, headers=headers, timeout=timeout)
+                try:
+                    if response.status in _REDIRECT_STATUSES and response.getheader("Location"):
+                        response.read()
+                        url = urljoin(url, response.getheader("Location"))
+                        continue
+
+                    if not 200 <= response.status < 300:
+                        response.read()
+                        raise HTTPError(
+                            url, response.status, response.reason, response.headers, None
+                        )
+
+                    yield response
+                    return
+                finally:
+                    cls._release_connection(key, connection, response)
+
+        raise URLError(f"Too many redirects when getting {url}")
+
+    @classmethod
+    def close(cls) -> None:
+        """
+        Closes all idle connections
+        """
+        with cls._LOCK:
+            idle_connections = [
+                connection
+                for connections in cls._IDLE_CONNECTIONS.values()
+                for connection in connections
+            ]
+            cls._IDLE_CONNECTIONS.clear()
+
+        for connection in idle_connections:
+            connection.close()
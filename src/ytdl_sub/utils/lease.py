@@ -0,0 +1,235 @@
+import hashlib
+import json
+import os
+import socket
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from ytdl_sub.utils.logger import Logger
+
+logger = Logger.get("lease")
+
+_LEASE_SUFFIX = ".lease"
+
+
+class LeaseDirectory:
+    """
+    Leases shared between ytdl-sub workers on different hosts through a directory on a shared
+    volume, i.e. NFS. Leases are claimed by hard-linking a file into place, which is atomic on
+    NFS unlike exclusive creates and SQLite locks. Held leases are renewed by a heartbeat thread
+    and expire if a worker stops renewing them. Expiry compares file modification times, which
+    the file server sets, so it does not depend on the workers' clocks agreeing.
+    """
+
+    def __init__(self, directory: str, lease_timeout_sec: float, worker_id: Optional[str] = None):
+        """
+        Parameters
+        ----------
+        directory
+            Shared lease directory
+        lease_timeout_sec
+            Leases that are not renewed for this long can be claimed by other workers
+        worker_id
+            Optional. Name of this worker in logs, defaults to hostname and pid
+        """
+        self._directory = Path(directory)
+        self._lease_timeout_sec = lease_timeout_sec
+        self._worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self._token = uuid.uuid4().hex
+
+        # Keys of the leases this worker holds, by lease file path
+        self._lock = threading.Lock()
+        self._held: Dict[Path, str] = {}
+
+        os.makedirs(self._directory, exist_ok=True)
+
+    @property
+    def worker_id(self) -> str:
+        """
+        Returns
+        -------
+        Name of this worker
+        """
+        return self._worker_id
+
+    def _lease_path(self, key: str) -> Path:
+        key_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._directory / f"{key_hash}{_LEASE_SUFFIX}"
+
+    def _write_lease_file(self, key: str) -> Path:
+        """
+        Writes this worker's lease for the key to a new temp file in the lease directory
+        """
+        tmp_lease_path = self._directory / f".{uuid.uuid4().hex}.tmp"
+        with open(tmp_lease_path, "w", encoding="utf-8") as lease_file:
+            json.dump({"key": key, "worker_id": self._worker_id, "token": self._token}, lease_file)
+        return tmp_lease_path
+
+    @classmethod
+    def _read_lease_file(cls, lease_path: Path) -> Dict:
+        try:
+            with open(lease_path, "r", encoding="utf-8") as lease_file:
+                return json.load(lease_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _is_held_by_self(self, lease_path: Path) -> bool:
+        return self._read_lease_file(lease_path).get("token") == self._token
+
+    def _break_if_expired(self, lease_path: Path, now: float) -> bool:
+        """
+        Parameters
+        ----------
+        lease_path
+            Existing lease file
+        now
+            Current time according to the file server
+
+        Returns
+        -------
+        True if the lease no longer exists, either because it expired and was broken or its holder
+        released it
+        """
+        try:
+            if now - os.stat(lease_path).st_mtime < self._lease_timeout_sec:
+                return False
+        except FileNotFoundError:
+            return True
+
+        # Renaming is atomic, so only one worker breaks the expired lease
+        expired_lease_path = lease_path.with_name(f"{lease_path.name}.{uuid.uuid4().hex}.expired")
+        try:
+            os.rename(lease_path, expired_lease_path)
+        except FileNotFoundError:
+            return True
+
+        try:
+            # The holder renewed it between the stat and rename, put it back
+            if now - os.stat(expired_lease_path).st_mtime < self._lease_timeout_sec:
+                try:
+                    os.link(expired_lease_path, lease_path)
+                except FileExistsError:
+                    pass
+                return False
+
+            logger.info(
+                "Lease held by %s expired, claiming it",
+                self._read_lease_file(expired_lease_path).get("worker_id", "unknown worker"),
+            )
+            return True
+        finally:
+            os.remove(expired_lease_path)
+
+    def _try_acquire(self, key: str) -> bool:
+        lease_path = self._lease_path(key)
+        tmp_lease_path = self._write_lease_file(key)
+        try:
+            now = os.stat(tmp_lease_path).st_mtime
+            for _ in range(2):
+                try:
+                    os.link(tmp_lease_path, lease_path)
+                except FileExistsError:
+                    if self._break_if_expired(lease_path, now=now):
+                        continue
+
+                    logger.info(
+                        "Skipping %s, it is leased by %s",
+                        key,
+                        self._read_lease_file(lease_path).get("worker_id", "another worker"),
+                    )
+                    return False
+
+                with self._lock:
+                    self._held[lease_path] = key
+                return True
+            return False
+        finally:
+            os.remove(tmp_lease_path)
+
+    def _release(self, key: str) -> None:
+        lease_path = self._lease_path(key)
+        with self._lock:
+            self._held.pop(lease_path, None)
+
+        if self._is_held_by_self(lease_path):
+            try:
+                os.remove(lease_path)
+            except FileNotFoundError:
+                pass
+
+    def renew(self) -> None:
+        """
+        Renews every lease this worker holds
+        """
+        with self._lock:
+            held = dict(self._held)
+
+        for lease_path, key in held.items():
+            if not self._is_held_by_self(lease_path):
+                logger.warning("Lost the lease for %s to another worker", key)
+                with self._lock:
+                    self._held.pop(lease_path, None)
+                continue
+
+            try:
+                os.replace(self._write_lease_file(key), lease_path)
+            except OSError as os_error:
+                logger.warning("Failed to renew the lease for %s: %s", key, os_error)
+
+    @contextmanager
+    def claim(self, keys: List[str]) -> Iterator[bool]:
+        """
+        Claims all the leases, or none of them, and renews them until exiting the context
+
+        Parameters
+        ----------
+        keys
+            Keys of the leases to claim
+
+        Yields
+        ------
+        True if every lease was claimed. False if another worker holds one of them.
+
+        Raises
+        ------
+        OSError
+            If the lease directory can not be written to. Leases claimed so far are released.
+        """
+        claimed_keys: List[str] = []
+        try:
+            for key in keys:
+                if not self._try_acquire(key):
+                    break
+                claimed_keys.append(key)
+        except OSError:
+            for key in claimed_keys:
+                self._release(key)
+            raise
+
+        if len(claimed_keys) < len(keys):
+            for key in claimed_keys:
+                self._release(key)
+            yield False
+            return
+
+        stop_heartbeat = threading.Event()
+
+        def _heartbeat() -> None:
+            while not stop_heartbeat.wait(self._lease_timeout_sec / 3):
+                self.renew()
+
+        heartbeat = threading.Thread(target=_heartbeat, name="ytdl-sub-lease", daemon=True)
+        heartbeat.start()
+        try:
+            yield True
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+            for key in claimed_keys:
+                self._release(key)
@@ -125,6 +125,15 @@ class Logger:
         """
         cls._LOGGER_LEVEL = LoggerLevels.from_str(name=log_level_name)
 
+    @classmethod
+    def is_debug(cls) -> bool:
+        """
+        Returns
+        -------
+        True if the log level set via CLI arguments is debug
+        """
+        return cls._LOGGER_LEVEL.level >= LoggerLevels.DEBUG.level
+
     @classmethod
     def _get_formatter(cls) -> logging.Formatter:
         """
@@ -1,3 +1,4 @@
+import random
 from time import sleep
 from typing import Any
 from typing import Optional
@@ -9,7 +10,12 @@ from ytdl_sub.utils.logger import Logger
 logger = Logger.get()
 
 
-def retry(times: int, exceptions: Tuple[Type[Exception], ...], wait_sec: int = 5) -> Optional[Any]:
+def retry(
+    times: int,
+    exceptions: Tuple[Type[Exception], ...],
+    wait_sec: float = 5,
+    exponential_backoff: bool = False,
+) -> Optional[Any]:
     """
     Retry decorator
 
@@ -21,6 +27,9 @@ def retry(times: int, exceptions: Tuple[Type[Exception], ...], wait_sec: int = 5
         Type of exceptions to retry against
     wait_sec
         Number of seconds to wait inbetween retries
+    exponential_backoff
+        Optional. Double the wait after each attempt, with jitter so concurrent callers do not
+        retry in lockstep
 
     Returns
     -------
@@ -44,7 +53,10 @@ def retry(times: int, exceptions: Tuple[Type[Exception], ...], wait_sec: int = 5
                         str(exc),
                     )
                     attempt += 1
-                    sleep(wait_sec)
+                    if exponential_backoff:
+                        sleep(wait_sec * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+                    else:
+                        sleep(wait_sec)
             return None
 
         return newfn
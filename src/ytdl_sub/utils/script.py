@@ -1,24 +1,9 @@
 import json
 import re
 from typing import Any
-from typing import Dict
-
-from ytdl_sub.script.script import _is_function
 
 
 class ScriptUtils:
-    @classmethod
-    def add_sanitized_variables(cls, variables: Dict[str, str]) -> Dict[str, str]:
-        """
-        Helper to add sanitized variables to a Script
-        """
-        sanitized_variables = {
-            f"{name}_sanitized": f"{{%sanitize({name})}}"
-            for name in variables.keys()
-            if not _is_function(name)
-        }
-        return dict(variables, **sanitized_variables)
-
     @classmethod
     def to_script(cls, value: Any) -> str:
         """
@@ -16,9 +16,9 @@ from ytdl_sub.utils.exceptions import StringFormattingException
 from ytdl_sub.utils.script import ScriptUtils
 
 BASE_SCRIPT: Script = Script(
-    ScriptUtils.add_sanitized_variables(VARIABLE_SCRIPTS)
-    | ScriptUtils.add_sanitized_variables(REQUIRED_OVERRIDE_VARIABLE_DEFINITIONS)
-    | CUSTOM_FUNCTION_SCRIPTS
+    VARIABLE_SCRIPTS | REQUIRED_OVERRIDE_VARIABLE_DEFINITIONS | CUSTOM_FUNCTION_SCRIPTS,
+    # Every variable has a sanitized version, only added once it is used
+    virtual_variables={"_sanitized": "sanitize"},
 )
 
 
@@ -57,12 +57,23 @@ class Scriptable(ABC):
         assert self._unresolvable is not None, "Not initialized"
         return self._unresolvable
 
-    def update_script(self) -> None:
+    def update_script(self, variable_names: Optional[Set[str]] = None) -> None:
         """
         Updates any potential variables to a resolvable. This is done
         to avoid re-resolving the same variables over-and-over.
+
+        Parameters
+        ----------
+        variable_names
+            Optional. Names of variables that were just added. If given, only they and the
+            variables that depend on them are updated.
         """
-        self.script.resolve(unresolvable=self.unresolvable, update=True)
+        if variable_names is not None:
+            self.script.resolve_dependents(
+                variable_names=variable_names, unresolvable=self.unresolvable
+            )
+        else:
+            self.script.resolve(unresolvable=self.unresolvable, update=True)
 
     def add(self, values: Dict[str | Variable, Any]) -> None:
         """
@@ -74,16 +85,11 @@ class Scriptable(ABC):
         }
 
         self._unresolvable -= set(list(values_as_str.keys()))
-        self.script.add(
-            ScriptUtils.add_sanitized_variables(
-                {
-                    name: ScriptUtils.to_script(definition)
-                    for name, definition in values_as_str.items()
-                }
-            ),
-            unresolvable=self.unresolvable,
-        )
-        self.update_script()
+        variables_to_add = {
+            name: ScriptUtils.to_script(definition) for name, definition in values_as_str.items()
+        }
+        self.script.add(variables_to_add, unresolvable=self.unresolvable)
+        self.update_script(variable_names=set(variables_to_add.keys()))
 
         for name, definition in values_as_str.items():
             try:
@@ -1,13 +1,31 @@
+import hashlib
+import importlib.util
+import io
+import json
 import logging
 import os
+import shutil
 import tempfile
+import time
+from abc import ABC
+from abc import abstractmethod
+from dataclasses import dataclass
+from email.message import Message
+from http import HTTPStatus
+from pathlib import Path
 from subprocess import CalledProcessError
+from subprocess import TimeoutExpired
+from typing import BinaryIO
+from typing import Dict
 from typing import Optional
-from urllib.request import urlopen
+from typing import Type
+from urllib.error import HTTPError
 
 from ytdl_sub.entries.entry import Entry
 from ytdl_sub.utils.ffmpeg import FFMPEG
+from ytdl_sub.utils.file_handler import DirectoryFileIndex
 from ytdl_sub.utils.file_handler import FileHandler
+from ytdl_sub.utils.http_pool import HttpSessionPool
 from ytdl_sub.utils.logger import Logger
 from ytdl_sub.utils.retry import retry
 
@@ -18,6 +36,315 @@ class ThumbnailTypes:
 
 logger: logging.Logger = Logger.get("thumbnail")
 
+# Socket timeout when downloading url thumbnails
+_URL_THUMBNAIL_TIMEOUT_SEC: float = 1.0
+
+# Errors a backend can raise when a thumbnail is invalid or fails to convert
+THUMBNAIL_CONVERSION_ERRORS = (CalledProcessError, TimeoutExpired, OSError, ValueError)
+
+
+class ThumbnailConverterBackend(ABC):
+    """
+    Converts thumbnail images into jpg
+    """
+
+    # Chunk size used when streaming a thumbnail download
+    _STREAM_CHUNK_SIZE: int = 64 * 1024
+
+    @classmethod
+    @abstractmethod
+    def convert_file(cls, input_path: str, output_path: str) -> None:
+        """
+        Parameters
+        ----------
+        input_path
+            Path to the image to convert
+        output_path
+            Path to write the jpg to
+        """
+
+    @classmethod
+    def convert_stream(cls, stream: BinaryIO, output_path: str) -> None:
+        """
+        Parameters
+        ----------
+        stream
+            Readable image stream, i.e. an HTTP response
+        output_path
+            Path to write the jpg to
+        """
+        with tempfile.NamedTemporaryFile(delete=False) as input_file:
+            shutil.copyfileobj(stream, input_file, length=cls._STREAM_CHUNK_SIZE)
+
+        try:
+            cls.convert_file(input_path=input_file.name, output_path=output_path)
+        finally:
+            FileHandler.delete(input_file.name)
+
+
+class FFMPEGThumbnailConverter(ThumbnailConverterBackend):
+    """
+    Converts thumbnails by running an ffmpeg process per thumbnail
+    """
+
+    # In case ffmpeg hangs from a bad thumbnail
+    _TIMEOUT_SEC: float = 10.0
+
+    @classmethod
+    def convert_file(cls, input_path: str, output_path: str) -> None:
+        FFMPEG.run(["-y", "-bitexact", "-i", input_path, output_path], timeout=cls._TIMEOUT_SEC)
+
+
+class PillowThumbnailConverter(ThumbnailConverterBackend):
+    """
+    Converts thumbnails in-process using Pillow, when it is installed
+    """
+
+    _JPG_QUALITY: int = 95
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        Returns
+        -------
+        True if Pillow is installed. False otherwise.
+        """
+        return importlib.util.find_spec("PIL") is not None
+
+    @classmethod
+    def _save_as_jpg(cls, image, output_path: str) -> None:
+        # jpg does not support transparency or palettes
+        image.convert("RGB").save(output_path, format="JPEG", quality=cls._JPG_QUALITY)
+
+    @classmethod
+    def convert_file(cls, input_path: str, output_path: str) -> None:
+        # pylint: disable=import-outside-toplevel
+        from PIL import Image
+
+        # pylint: enable=import-outside-toplevel
+
+        with Image.open(input_path) as image:
+            cls._save_as_jpg(image=image, output_path=output_path)
+
+    @classmethod
+    def convert_stream(cls, stream: BinaryIO, output_path: str) -> None:
+        # pylint: disable=import-outside-toplevel
+        from PIL import ImageFile
+
+        # pylint: enable=import-outside-toplevel
+        # Feed the download into the decoder as it arrives
+        parser = ImageFile.Parser()
+        while chunk := stream.read(cls._STREAM_CHUNK_SIZE):
+            parser.feed(chunk)
+
+        with parser.close() as image:
+            cls._save_as_jpg(image=image, output_path=output_path)
+
+
+class ThumbnailConverter:
+    """
+    Converts thumbnails using the configured backend. Defaults to converting in-process with
+    Pillow if it is installed, otherwise falls back to ffmpeg.
+    """
+
+    _BACKEND: Optional[Type[ThumbnailConverterBackend]] = None
+
+    @classmethod
+    def set_backend(cls, backend: Optional[Type[ThumbnailConverterBackend]]) -> None:
+        """
+        Sets the conversion backend. None resets it to the default.
+        """
+        cls._BACKEND = backend
+
+    @classmethod
+    def backend(cls) -> Type[ThumbnailConverterBackend]:
+        """
+        Returns
+        -------
+        The backend used to convert thumbnails
+        """
+        if cls._BACKEND is None:
+            cls._BACKEND = (
+                PillowThumbnailConverter
+                if PillowThumbnailConverter.is_available()
+                else FFMPEGThumbnailConverter
+            )
+            logger.debug("Converting thumbnails using %s", cls._BACKEND.__name__)
+
+        return cls._BACKEND
+
+    @classmethod
+    def convert_file(cls, input_path: str, output_path: str) -> None:
+        """
+        Converts an image file into a jpg file
+        """
+        cls.backend().convert_file(input_path=input_path, output_path=output_path)
+        # Backends write the jpg directly, outside of FileHandler
+        DirectoryFileIndex.add(output_path)
+
+    @classmethod
+    def convert_stream(cls, stream: BinaryIO, output_path: str) -> None:
+        """
+        Converts an image stream into a jpg file
+        """
+        cls.backend().convert_stream(stream=stream, output_path=output_path)
+        DirectoryFileIndex.add(output_path)
+
+
+@dataclass
+class CachedThumbnail:
+    """
+    A converted url thumbnail stored in the ThumbnailCache
+    """
+
+    thumbnail_path: str
+    source_sha256: str
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Returns
+        -------
+        Request headers to only fetch the thumbnail if it changed since it was cached
+        """
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ThumbnailCache:
+    """
+    Persists converted url thumbnails (channel avatars, banners, playlist posters) across runs,
+    keyed by their url. Within the TTL, cached thumbnails are used without any request. After it,
+    they are revalidated with a conditional request and only reconverted if their content changed.
+    """
+
+    _DIRECTORY: Optional[str] = None
+    _TTL_SEC: float = 24 * 60 * 60
+
+    @classmethod
+    def set_directory(cls, directory: Optional[str]) -> None:
+        """
+        Sets the cache directory. An empty string or None disables the cache.
+        """
+        cls._DIRECTORY = directory or None
+
+    @classmethod
+    def _entry_path(cls, thumbnail_url: str, ext: str) -> Path:
+        url_hash = hashlib.sha256(thumbnail_url.encode("utf-8")).hexdigest()
+        return Path(cls._DIRECTORY) / f"{url_hash}.{ext}"
+
+    @classmethod
+    def get(cls, thumbnail_url: str) -> Optional[CachedThumbnail]:
+        """
+        Returns
+        -------
+        The cached thumbnail for the url. None if it is not cached or the cache is disabled.
+        """
+        if cls._DIRECTORY is None:
+            return None
+
+        thumbnail_path = cls._entry_path(thumbnail_url, ext="jpg")
+        try:
+            with open(cls._entry_path(thumbnail_url, ext="json"), "r", encoding="utf-8") as file:
+                metadata = json.load(file)
+            if not os.path.isfile(thumbnail_path):
+                return None
+            return CachedThumbnail(thumbnail_path=str(thumbnail_path), **metadata)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    @classmethod
+    def is_fresh(cls, cached: CachedThumbnail) -> bool:
+        """
+        Returns
+        -------
+        True if it was fetched within the TTL and can be used without revalidating.
+        """
+        return time.time() - cached.fetched_at < cls._TTL_SEC
+
+    @classmethod
+    def _write_metadata(cls, thumbnail_url: str, cached: CachedThumbnail) -> None:
+        metadata = {
+            "source_sha256": cached.source_sha256,
+            "fetched_at": cached.fetched_at,
+            "etag": cached.etag,
+            "last_modified": cached.last_modified,
+        }
+        metadata_path = cls._entry_path(thumbnail_url, ext="json")
+        tmp_metadata_path = f"{metadata_path}.{os.getpid()}.tmp"
+        with open(tmp_metadata_path, "w", encoding="utf-8") as file:
+            json.dump(metadata, file)
+        os.replace(tmp_metadata_path, metadata_path)
+
+    @classmethod
+    def store(
+        cls, thumbnail_url: str, thumbnail_path: str, source_sha256: str, headers: Message
+    ) -> None:
+        """
+        Stores a newly converted thumbnail along with the response's validators
+        """
+        if cls._DIRECTORY is None:
+            return
+
+        os.makedirs(cls._DIRECTORY, exist_ok=True)
+        cached_path = cls._entry_path(thumbnail_url, ext="jpg")
+        tmp_cached_path = f"{cached_path}.{os.getpid()}.tmp"
+        shutil.copyfile(thumbnail_path, tmp_cached_path)
+        os.replace(tmp_cached_path, cached_path)
+
+        cls._write_metadata(
+            thumbnail_url=thumbnail_url,
+            cached=CachedThumbnail(
+                thumbnail_path=str(cached_path),
+                source_sha256=source_sha256,
+                fetched_at=time.time(),
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+            ),
+        )
+
+    @classmethod
+    def refresh(cls, thumbnail_url: str, cached: CachedThumbnail, headers: Message) -> None:
+        """
+        Restarts a cached thumbnail's TTL after the server confirmed it is unchanged
+        """
+        cached.fetched_at = time.time()
+        cached.etag = headers.get("ETag", cached.etag)
+        cached.last_modified = headers.get("Last-Modified", cached.last_modified)
+        cls._write_metadata(thumbnail_url=thumbnail_url, cached=cached)
+
+
+class _HashingStream:
+    """
+    Wraps a readable stream to hash its contents as they are read
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Reads from the underlying stream and hashes what was read
+        """
+        data = self._stream.read(size)
+        self._sha256.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        """
+        Returns
+        -------
+        sha256 of everything read so far
+        """
+        return self._sha256.hexdigest()
+
 
 def try_convert_download_thumbnail(entry: Entry) -> None:
     """
@@ -42,16 +369,16 @@ def try_convert_download_thumbnail(entry: Entry) -> None:
 
     if not download_thumbnail_path == download_thumbnail_path_as_jpg:
         try:
-            FFMPEG.run(
-                ["-y", "-bitexact", "-i", download_thumbnail_path, download_thumbnail_path_as_jpg]
+            ThumbnailConverter.convert_file(
+                input_path=download_thumbnail_path, output_path=download_thumbnail_path_as_jpg
             )
-        except CalledProcessError:
+        except THUMBNAIL_CONVERSION_ERRORS:
             logger.warning("Failed to convert thumbnail for '%s' to jpg", entry.title)
         finally:
             FileHandler.delete(download_thumbnail_path)
 
 
-@retry(times=3, exceptions=(Exception,))
+@retry(times=3, exceptions=(Exception,), wait_sec=1, exponential_backoff=True)
 def download_and_convert_url_thumbnail(
     thumbnail_url: Optional[str], output_thumbnail_path: str
 ) -> Optional[bool]:
@@ -68,28 +395,61 @@ def download_and_convert_url_thumbnail(
     Returns
     -------
     True to indicate it converted the thumbnail from url. None if the retry failed.
+
+    Raises
+    ------
+    HTTPError
+        If the thumbnail request fails, other than a 304 for a cached thumbnail
     """
     if not thumbnail_url:
         return None
 
-    # timeout after 8 seconds
-    with urlopen(thumbnail_url, timeout=1.0) as file:
-        with tempfile.NamedTemporaryFile(delete=False) as thumbnail:
-            thumbnail.write(file.read())
+    os.makedirs(os.path.dirname(output_thumbnail_path), exist_ok=True)
+
+    cached = ThumbnailCache.get(thumbnail_url)
+    if cached is not None and ThumbnailCache.is_fresh(cached):
+        FileHandler.copy(cached.thumbnail_path, output_thumbnail_path)
+        return True
 
+    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp_output_file:
+        tmp_output_path = tmp_output_file.name
+
+    try:
         try:
-            os.makedirs(os.path.dirname(output_thumbnail_path), exist_ok=True)
+            with HttpSessionPool.open(
+                thumbnail_url,
+                headers=cached.conditional_headers() if cached else None,
+                timeout=_URL_THUMBNAIL_TIMEOUT_SEC,
+            ) as response:
+                headers = response.headers
+                stream = _HashingStream(response)
 
-            tmp_output_path = FFMPEG.tmp_file_path(
-                relative_file_path=thumbnail.name, extension="jpg"
-            )
-            # Add timeout of 1 second in case ffmpeg hangs from a bad thumbnail
-            FFMPEG.run(["-y", "-bitexact", "-i", thumbnail.name, tmp_output_path], timeout=1)
+                if cached is None:
+                    ThumbnailConverter.convert_stream(stream=stream, output_path=tmp_output_path)
+                # Server ignored the validators, only reconvert if the content changed
+                elif (data := stream.read()) and stream.hexdigest() != cached.source_sha256:
+                    ThumbnailConverter.convert_stream(
+                        stream=io.BytesIO(data), output_path=tmp_output_path
+                    )
+                    cached = None
+        except HTTPError as http_error:
+            if cached is None or http_error.code != HTTPStatus.NOT_MODIFIED:
+                raise
+            headers = http_error.headers
 
+        if cached is None:
+            ThumbnailCache.store(
+                thumbnail_url=thumbnail_url,
+                thumbnail_path=tmp_output_path,
+                source_sha256=stream.hexdigest(),
+                headers=headers,
+            )
             # Have FileHandler handle the move to a potential cross-device
             FileHandler.move(tmp_output_path, output_thumbnail_path)
-        finally:
-            FileHandler.delete(tmp_output_path)
-            FileHandler.delete(thumbnail.name)
+        else:
+            ThumbnailCache.refresh(thumbnail_url=thumbnail_url, cached=cached, headers=headers)
+            FileHandler.copy(cached.thumbnail_path, output_thumbnail_path)
+    finally:
+        FileHandler.delete(tmp_output_path)
 
     return True
@@ -12,6 +12,10 @@ from ytdl_sub.utils.logger import Logger
 
 logger = Logger.get(name="yaml")
 
+# Use libyaml's C implementation when PyYAML was built with it, it is many times faster
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def load_yaml(file_path: str | Path) -> Dict:
     """
@@ -36,7 +40,7 @@ def load_yaml(file_path: str | Path) -> Dict:
 
     try:
         with open(file_path, "r", encoding="utf-8") as file:
-            output = yaml.safe_load(file)
+            output = yaml.load(file, Loader=_SafeLoader)
     except YAMLError as yaml_exception:
         raise InvalidYamlException(
             f"'{file_path}' has invalid YAML:\n{yaml_exception}\n\n"
@@ -56,5 +60,5 @@ def dump_yaml(to_dump: Dict) -> str:
     dict converted to YAML
     """
     string_io = StringIO()
-    yaml.safe_dump(to_dump, string_io, indent=2, allow_unicode=True, sort_keys=True)
+    yaml.dump(to_dump, string_io, Dumper=_SafeDumper, indent=2, allow_unicode=True, sort_keys=True)
     return string_io.getvalue()
@@ -2,7 +2,8 @@ import os
 from pathlib import Path
 from typing import Any
 
-from ytdl_sub.script.script import Script
+from ytdl_sub.entries.script.custom_functions import CustomFunctions
+from ytdl_sub.script.types.resolvable import String
 from ytdl_sub.validators.string_formatter_validators import OverridesStringFormatterValidator
 from ytdl_sub.validators.string_formatter_validators import StringFormatterValidator
 from ytdl_sub.validators.validators import StringValidator
@@ -32,6 +33,16 @@ class FFprobeFileValidator(FFmpegFileValidator):
 
 
 # pylint: disable=line-too-long
+def _to_native_truncated_filepath(file_path: str) -> str:
+    """
+    Same as ``{%to_native_filepath(%truncate_filepath_if_too_long(file_path))}``, without parsing
+    and validating a script for every file path
+    """
+    return CustomFunctions.to_native_filepath(
+        CustomFunctions.truncate_filepath_if_too_long(String(file_path))
+    ).value
+
+
 class StringFormatterFileNameValidator(StringFormatterValidator):
     """
     Same as a
@@ -45,29 +56,11 @@ class StringFormatterFileNameValidator(StringFormatterValidator):
     _expected_value_type_name = "filepath"
 
     def post_process(self, resolved: str) -> str:
-        return (
-            Script(
-                {
-                    "tmp_var_1": resolved,
-                    "tmp_var_2": "{%to_native_filepath(%truncate_filepath_if_too_long(tmp_var_1))}",
-                }
-            )
-            .resolve()
-            .get_str("tmp_var_2")
-        )
+        return _to_native_truncated_filepath(resolved)
 
 
 class OverridesStringFormatterFilePathValidator(OverridesStringFormatterValidator):
     _expected_value_type_name = "static filepath"
 
     def post_process(self, resolved: str) -> str:
-        return (
-            Script(
-                {
-                    "tmp_var_1": resolved,
-                    "tmp_var_2": "{%to_native_filepath(%truncate_filepath_if_too_long(tmp_var_1))}",
-                }
-            )
-            .resolve()
-            .get_str("tmp_var_2")
-        )
+        return _to_native_truncated_filepath(resolved)
@@ -0,0 +1,48 @@
+from typing import Dict
+
+from ytdl_sub.utils.cron import Schedule
+from ytdl_sub.validators.validators import LiteralDictValidator
+from ytdl_sub.validators.validators import StringValidator
+
+
+class ScheduleValidator(StringValidator):
+    _expected_value_type_name = "schedule"
+
+    def __init__(self, name, value):
+        super().__init__(name, value)
+
+        try:
+            self._schedule = Schedule(self.value)
+        except ValueError as exc:
+            raise self._validation_exception(
+                error_message=f"invalid schedule '{self.value}', expected an interval like '6h' "
+                f"or a cron expression like '0 */6 * * *': {exc}"
+            ) from exc
+
+    @property
+    def schedule(self) -> Schedule:
+        """
+        Returns
+        -------
+        The parsed schedule
+        """
+        return self._schedule
+
+
+class ScheduleDictValidator(LiteralDictValidator):
+    """
+    A dict of subscription names to schedules
+    """
+
+    def __init__(self, name, value):
+        super().__init__(name, value)
+
+        self._schedules: Dict[str, Schedule] = {
+            key: self._validate_key(key=key, validator=ScheduleValidator).schedule
+            for key in self._keys
+        }
+
+    @property
+    def schedules(self) -> Dict[str, Schedule]:
+        """Returns dict of subscription names to their parsed schedule"""
+        return self._schedules
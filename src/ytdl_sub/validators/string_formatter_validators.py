@@ -49,7 +49,7 @@ class StringFormatterValidator(StringValidator):
     def __init__(self, name, value: str):
         super().__init__(name=name, value=value)
         try:
-            _ = parse(str(value))
+            self._parsed = parse(str(value))
         except UserException as exc:
             raise self._validation_exception(exc) from exc
 
@@ -63,6 +63,16 @@ class StringFormatterValidator(StringValidator):
         """
         return self._value
 
+    @property
+    @final
+    def parsed(self) -> SyntaxTree:
+        """
+        Returns
+        -------
+        The parsed format string, to evaluate without parsing it again
+        """
+        return self._parsed
+
     # pylint: disable=no-self-use
 
     def post_process(self, resolved: str) -> str:
@@ -150,13 +160,16 @@ class OverridesDictFormatterValidator(DictFormatterValidator):
 
 def to_variable_dependency_format_string(script: Script, parsed_format_string: SyntaxTree) -> str:
     """
-    Create a dummy format string that contains all variable deps as a string.
+    Create a dummy format string that contains all variable deps as a string. Variables are
+    sorted so the same deps always produce the same string.
     """
     dummy_format_string = ""
-    for var in parsed_format_string.variables:
+    for var in sorted(parsed_format_string.variables, key=lambda variable: variable.name):
         dummy_format_string += f"{{ {var.name} }}"
         # pylint: disable=protected-access
-        for variable_dependency in script._variables[var.name].variables:
+        for variable_dependency in sorted(
+            script._variables[var.name].variables, key=lambda variable: variable.name
+        ):
             dummy_format_string += f"{{ {variable_dependency.name} }}"
         # pylint: enable=protected-access
     return dummy_format_string
@@ -173,11 +186,10 @@ def _validate_formatter(
         is_static_formatter = True
         unresolvable = unresolved_variables.union({VARIABLES.entry_metadata.variable_name})
 
-    parsed = parse(
-        text=formatter_validator.format_string,
-    )
+    parsed = formatter_validator.parsed
     variable_names = {var.name for var in parsed.variables}
     custom_function_names = {f"%{func.name}" for func in parsed.custom_functions}
+    mock_script.add_virtual_variables(variable_names)
 
     if not variable_names.issubset(mock_script.variable_names):
         raise StringFormattingVariableNotFoundException(
@@ -194,6 +206,11 @@ def _validate_formatter(
             "contains the following variables that are unresolved when executing this "
             f"formatter: {', '.join(sorted(unresolved))}"
         )
+
+    # Formatters are evaluated without re-validating them, so validate function usage up-front
+    # pylint: disable=protected-access
+    mock_script.validate_function_usage(name=formatter_validator._name, tree=parsed)
+    # pylint: enable=protected-access
     try:
         mock_script.resolve_once(
             {
@@ -147,6 +147,38 @@ class DownloadArchive:
         ]
         return self
 
+    def to_set(self) -> Set[str]:
+        """
+        Returns
+        -------
+        The download archive's lines as a set, the preloaded archive format yt-dlp accepts in
+        place of a file path
+        """
+        return {line.strip() for line in self._download_archive_lines if line.strip()}
+
+
+class DownloadArchiveSnapshot(frozenset):
+    """
+    Download archive lines handed to yt-dlp in place of a file path. yt-dlp records downloads by
+    adding to it, which is ignored so every URL and entry starts from the same archive. Being
+    immutable, it is shared instead of copied along with the ytdl options, and only its size is
+    logged.
+    """
+
+    def add(self, _: str) -> None:
+        """
+        Ignores downloads recorded by yt-dlp
+        """
+
+    def __copy__(self) -> "DownloadArchiveSnapshot":
+        return self
+
+    def __deepcopy__(self, memo: Dict) -> "DownloadArchiveSnapshot":
+        return self
+
+    def __repr__(self) -> str:
+        return f"<download archive of {len(self)} entries>"
+
 
 class DownloadMappings:
     _strptime_format = "%Y-%m-%d"
@@ -352,11 +384,9 @@ class EnhancedDownloadArchive:
         a. self._load()
            Checks the output directory to see if an existing enhanced download archive file
            exists. If so, load it into the class. Otherwise, initialize an empty instance of one.
-        b. self._move_to_working_directory()
-           If the download archive was loaded successfully, create a ytdl download archive in the
-           working directory. This will let ytdl know which files are already downloaded.
-    2. ( Perform the ytdlp download using a download archive with the same name )
-        a. An existing archive should have been copied into the working directory for reuse
+        b. Snapshot the mapping as an in-memory ytdl download archive. This will let ytdl know
+           which files are already downloaded.
+    2. ( Perform the ytdlp download using the download archive snapshot )
     3. self.mapping.add_entry(entry, file_path)
         a. Should be called for any file created for the given entry that gets moved to the output
            directory
@@ -405,6 +435,7 @@ class EnhancedDownloadArchive:
             working_directory=working_directory, output_directory=output_directory, dry_run=dry_run
         )
         self._download_mapping = DownloadMappings()  # gets reinitialized
+        self._download_archive_snapshot = DownloadArchiveSnapshot()
         self._migrated_file_name = migrated_file_name
 
         self.num_entries_added: int = 0
@@ -443,6 +474,9 @@ class EnhancedDownloadArchive:
             mapping_file_path=self._output_file_path,
             migrated_mapping_file_path=self._migrated_file_path,
         )
+        self.num_entries_added = 0
+        self.num_entries_modified = 0
+        self.num_entries_removed = 0
         return self
 
     @property
@@ -528,23 +562,27 @@ class EnhancedDownloadArchive:
 
     def prepare_download_archive(self) -> "EnhancedDownloadArchive":
         """
-        If the mapping is not empty, create a download archive from it and save it into the
-        working directory. This will tell YTDL to not redownload already downloaded entries.
+        Snapshot the mapping as a ytdl download archive prior to any downloading. This will tell
+        YTDL to not redownload already downloaded entries.
 
         Returns
         -------
         self
         """
-        # If the download mapping is empty, do nothing since the ytdl downloader will create a new
-        # download archive file
-        if self.mapping.is_empty:
-            return self
-
-        # Otherwise, create a ytdl download archive file in the working directory.
-        self.mapping.to_download_archive().to_file(self.working_file_path)
-
+        self._download_archive_snapshot = DownloadArchiveSnapshot(
+            self.mapping.to_download_archive().to_set()
+        )
         return self
 
+    @property
+    def download_archive_snapshot(self) -> DownloadArchiveSnapshot:
+        """
+        Returns
+        -------
+        The ytdl download archive of the mapping, as it was prior to any downloading.
+        """
+        return self._download_archive_snapshot
+
     def _remove_entry(self, uid: str, mapping: DownloadMapping) -> None:
         for file_name in mapping.file_names:
             self._file_handler.delete_file_from_output_directory(file_name=file_name)
@@ -1,5 +1,7 @@
+import json
 import re
 import sys
+import weakref
 from pathlib import Path
 from typing import Callable
 from typing import List
@@ -7,10 +9,14 @@ from unittest.mock import patch
 
 import pytest
 
+from ytdl_sub.cli import entrypoint
 from ytdl_sub.cli.entrypoint import _download_subscriptions_from_yaml_files
 from ytdl_sub.cli.entrypoint import main
+from ytdl_sub.cli.output_summary import SubscriptionSummary
+from ytdl_sub.config.config_file import ConfigFile
 from ytdl_sub.subscriptions.subscription import Subscription
 from ytdl_sub.utils.exceptions import ExperimentalFeatureNotEnabled
+from ytdl_sub.utils.lease import LeaseDirectory
 
 ####################################################################################################
 # SHARED FIXTURES
@@ -120,3 +126,230 @@ def test_update_with_info_json_requires_experimental_flag(
         pytest.raises(ExperimentalFeatureNotEnabled),
     ):
         _ = main()
+
+
+def test_scheduled_skips_subscriptions_not_due(
+    working_directory: str,
+    tmp_path: Path,
+    mock_subscription_download_success,
+    music_video_subscription_path: Path,
+) -> None:
+    config = ConfigFile.from_dict(
+        {
+            "configuration": {
+                "working_directory": working_directory,
+                "cache_directory": str(tmp_path),
+            }
+        }
+    )
+
+    def _scheduled_run() -> List[Subscription]:
+        return _download_subscriptions_from_yaml_files(
+            config=config,
+            subscription_paths=[str(music_video_subscription_path)],
+            subscription_matches=[],
+            subscription_override_dict={},
+            update_with_info_json=False,
+            dry_run=False,
+            scheduled=True,
+        )
+
+    assert len(_scheduled_run()) == 3
+    assert (tmp_path / "schedule.json").is_file()
+
+    # Every subscription was just checked, none are due
+    assert len(_scheduled_run()) == 0
+
+
+def test_daemon_trigger_writes_trigger_file(working_directory: str, tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        json.dumps(
+            {
+                "configuration": {
+                    "working_directory": working_directory,
+                    "cache_directory": str(tmp_path / "cache"),
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    with patch.object(
+        sys,
+        "argv",
+        ["ytdl-sub", "--config", str(config_path), "daemon", "--trigger", "Rick Astley"],
+    ):
+        assert main() == []
+
+    trigger_paths = list((tmp_path / "cache" / "daemon" / "triggers").iterdir())
+    assert len(trigger_paths) == 1
+    assert trigger_paths[0].read_text(encoding="utf-8") == "Rick Astley"
+
+
+def test_validate_does_not_download(
+    working_directory: str, tmp_path: Path, music_video_subscription_path: Path
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        json.dumps({"configuration": {"working_directory": working_directory}}), encoding="utf-8"
+    )
+
+    with (
+        patch.object(
+            sys,
+            "argv",
+            [
+                "ytdl-sub",
+                "--config",
+                str(config_path),
+                "validate",
+                str(music_video_subscription_path),
+            ],
+        ),
+        patch.object(Subscription, "download") as mock_download,
+        patch.object(
+            Subscription, "from_file_paths", wraps=Subscription.from_file_paths
+        ) as mock_from_file_paths,
+    ):
+        assert main() == []
+
+    assert mock_from_file_paths.call_count == 1
+    assert mock_download.call_count == 0
+
+
+def test_distributed_skips_subscriptions_leased_by_other_workers(
+    working_directory: str,
+    tmp_path: Path,
+    mock_subscription_download_success,
+    music_video_subscription_path: Path,
+) -> None:
+    lease_directory = str(tmp_path / "leases")
+    config = ConfigFile.from_dict(
+        {
+            "configuration": {
+                "working_directory": working_directory,
+                "distributed": {"lease_directory": lease_directory},
+            }
+        }
+    )
+    other_worker = LeaseDirectory(
+        directory=lease_directory, lease_timeout_sec=600, worker_id="other"
+    )
+
+    with other_worker.claim(["subscription:Rick Astley"]):
+        subscriptions = _download_subscriptions_from_yaml_files(
+            config=config,
+            subscription_paths=[str(music_video_subscription_path)],
+            subscription_matches=[],
+            subscription_override_dict={},
+            update_with_info_json=False,
+            dry_run=False,
+        )
+
+    assert sorted(subscription.name for subscription in subscriptions) == [
+        "Eric Clapton",
+        "Michael Jackson",
+    ]
+    assert list(Path(lease_directory).iterdir()) == []
+
+
+@pytest.mark.parametrize("failure", ["output_directory", "claim"])
+def test_distributed_lease_failure_only_fails_its_subscription(
+    working_directory: str,
+    tmp_path: Path,
+    music_video_subscription_path: Path,
+    failure: str,
+) -> None:
+    lease_directory = str(tmp_path / "leases")
+    config = ConfigFile.from_dict(
+        {
+            "configuration": {
+                "working_directory": working_directory,
+                "distributed": {"lease_directory": lease_directory},
+            }
+        }
+    )
+    output_directory_property = Subscription.output_directory
+    claim = LeaseDirectory.claim
+    lease_directory_factory = entrypoint._lease_directory
+    is_running: List[bool] = []
+
+    def _lease_directory(config_file: ConfigFile) -> LeaseDirectory:
+        # Only fail once every subscription is built, and they start running
+        is_running.append(True)
+        return lease_directory_factory(config_file)
+
+    def _output_directory(subscription: Subscription) -> str:
+        if failure == "output_directory" and is_running and subscription.name == "Rick Astley":
+            raise ValueError("output directory does not resolve")
+        return output_directory_property.fget(subscription)
+
+    def _claim(leases: LeaseDirectory, keys: List[str]):
+        if failure == "claim" and "subscription:Rick Astley" in keys:
+            raise OSError("lease directory is unavailable")
+        return claim(leases, keys)
+
+    with (
+        patch.object(Subscription, "output_directory", new=property(_output_directory)),
+        patch.object(LeaseDirectory, "claim", new=_claim),
+        patch.object(entrypoint, "_lease_directory", new=_lease_directory),
+        patch.object(Subscription, "download") as mock_download,
+    ):
+        summaries = _download_subscriptions_from_yaml_files(
+            config=config,
+            subscription_paths=[str(music_video_subscription_path)],
+            subscription_matches=[],
+            subscription_override_dict={},
+            update_with_info_json=False,
+            dry_run=False,
+            suppress_transaction_log=True,
+        )
+
+    # The failed subscription does not run without its lease, the others still do
+    assert mock_download.call_count == 2
+    assert {summary.name: summary.exception is not None for summary in summaries} == {
+        "Rick Astley": True,
+        "Michael Jackson": False,
+        "Eric Clapton": False,
+    }
+    assert list(Path(lease_directory).iterdir()) == []
+
+
+def test_subscriptions_are_released_after_processing(
+    working_directory: str,
+    tmp_path: Path,
+    mock_subscription_download_success,
+    music_video_subscription_path: Path,
+) -> None:
+    config = ConfigFile.from_dict({"configuration": {"working_directory": working_directory}})
+    transaction_log_path = tmp_path / "transaction.log"
+    processed: List[weakref.ref] = []
+
+    def _mock_append_transaction_log(subscription: Subscription, transaction_log_file_path: str):
+        # Previously processed subscriptions are garbage collected before the next one runs
+        assert all(ref() is None for ref in processed)
+        processed.append(weakref.ref(subscription))
+        with open(transaction_log_file_path, "a", encoding="utf-8") as transaction_log_file:
+            transaction_log_file.write(f"{subscription.name}\n")
+
+    with patch("ytdl_sub.cli.entrypoint.append_transaction_log", new=_mock_append_transaction_log):
+        summaries = _download_subscriptions_from_yaml_files(
+            config=config,
+            subscription_paths=[str(music_video_subscription_path)],
+            subscription_matches=[],
+            subscription_override_dict={},
+            update_with_info_json=False,
+            dry_run=False,
+            transaction_log_file_path=str(transaction_log_path),
+        )
+
+    assert all(isinstance(summary, SubscriptionSummary) for summary in summaries)
+    assert [summary.name for summary in summaries] == [
+        "Rick Astley",
+        "Michael Jackson",
+        "Eric Clapton",
+    ]
+    assert transaction_log_path.read_text(encoding="utf-8").splitlines() == [
+        summary.name for summary in summaries
+    ]
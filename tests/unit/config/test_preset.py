@@ -1,8 +1,11 @@
 import re
+from typing import Dict
+from unittest.mock import patch
 
 import pytest
 
 from ytdl_sub.config.preset import Preset
+from ytdl_sub.config.validators.variable_validation import VariableValidation
 from ytdl_sub.plugins.nfo_tags import NfoTagsOptions
 from ytdl_sub.utils.exceptions import StringFormattingVariableNotFoundException
 from ytdl_sub.utils.exceptions import ValidationException
@@ -86,6 +89,33 @@ class TestPreset:
             "key-3": "this-preset",
         }
 
+    def test_preset_validation_is_shared(self, config_file, youtube_video):
+        def _preset(name: str, overrides: Dict) -> Preset:
+            return Preset(
+                config=config_file,
+                name=name,
+                value={
+                    "preset": "parent_preset_1",
+                    "download": youtube_video,
+                    "output_options": {"output_directory": "dir", "file_name": "{file_var}"},
+                    "overrides": overrides,
+                },
+            )
+
+        with patch.object(
+            VariableValidation,
+            "ensure_proper_usage",
+            autospec=True,
+            side_effect=VariableValidation.ensure_proper_usage,
+        ) as ensure_proper_usage:
+            _preset("sub_1", {"file_var": "file 1"})
+            _preset("sub_2", {"file_var": "file 2"})
+            assert ensure_proper_usage.call_count == 1
+
+            # Overrides that use different variables are validated again
+            _preset("sub_3", {"file_var": "{title}"})
+            assert ensure_proper_usage.call_count == 2
+
     def test_preset_datetime_with_override(self, config_file, youtube_video, output_options):
         preset = Preset(
             config=config_file,
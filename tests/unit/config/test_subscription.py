@@ -2,14 +2,19 @@ import re
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict
+from typing import List
+from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
+import yaml
 
 from ytdl_sub.config.config_file import ConfigFile
 from ytdl_sub.plugins.nfo_tags import NfoTagsOptions
 from ytdl_sub.subscriptions.subscription import Subscription
 from ytdl_sub.utils.exceptions import ValidationException
+from ytdl_sub.utils.ffmpeg import FFMPEGRemuxPlanner
+from ytdl_sub.ytdl_additions.enhanced_download_archive import DownloadMapping
 
 
 @contextmanager
@@ -505,9 +510,227 @@ def test_music_video_subscriptions(default_config: ConfigFile, music_video_subsc
     assert monk.get("subscription_indent_1").native == "Pop"
 
 
+def test_subscriptions_from_file_paths(config_file: ConfigFile, tv_show_subscriptions_path: Path):
+    subs = Subscription.from_file_paths(
+        config=config_file, subscription_paths=[str(tv_show_subscriptions_path)]
+    )
+    sequential_subs = Subscription.from_file_path(
+        config=config_file, subscription_path=tv_show_subscriptions_path
+    )
+
+    assert [sub.name for sub in subs] == [sub.name for sub in sequential_subs]
+    assert subs[3].overrides.script.get("subscription_indent_1").native == "Kids"
+
+
+def test_subscriptions_from_file_paths_reports_all_errors(
+    config_file: ConfigFile, tmp_path: Path, youtube_video: Dict, output_options: Dict
+):
+    subscription_paths: List[str] = []
+    for idx in range(2):
+        subscription_path = tmp_path / f"subscriptions_{idx}.yaml"
+        with open(subscription_path, "w", encoding="utf-8") as subscription_file:
+            yaml.safe_dump(
+                {
+                    f"valid_{idx}": {"download": youtube_video, "output_options": output_options},
+                    f"invalid_{idx}": {
+                        "download": youtube_video,
+                        "output_options": {"output_directory": "dir", "file_name": "{dne_var}"},
+                    },
+                },
+                subscription_file,
+            )
+        subscription_paths.append(str(subscription_path))
+
+    with pytest.raises(ValidationException) as exc_info:
+        Subscription.from_file_paths(config=config_file, subscription_paths=subscription_paths)
+
+    assert str(exc_info.value).startswith("2 validation error(s) in the subscriptions")
+    assert "Subscription 'invalid_0'" in str(exc_info.value)
+    assert "Subscription 'invalid_1'" in str(exc_info.value)
+    assert "valid_0" not in str(exc_info.value).replace("invalid_0", "")
+
+
 def test_default_docker_config_and_subscriptions():
     default_config = ConfigFile.from_file_path("docker/root/defaults/config.yaml")
     default_subs = Subscription.from_file_path(
         config=default_config, subscription_path=Path("docker/root/defaults/subscriptions.yaml")
     )
     assert len(default_subs) == 15
+
+
+def test_resume_working_directory(tmp_path: Path, youtube_video: Dict, output_options: Dict):
+    config = ConfigFile(
+        name="config",
+        value={
+            "configuration": {
+                "working_directory": str(tmp_path),
+                "resume_working_directory": True,
+            }
+        },
+    )
+
+    def _subscription(overrides: Dict) -> Subscription:
+        subscription = Subscription.from_dict(
+            config=config,
+            preset_name="resumable",
+            preset_dict={
+                "download": youtube_video,
+                "output_options": dict(output_options, output_directory=str(tmp_path / "output")),
+                "overrides": overrides,
+            },
+        )
+        subscription.download_archive.reinitialize(dry_run=False)
+        return subscription
+
+    subscription = _subscription(overrides={"key": "value"})
+    working_directory = Path(subscription.working_directory)
+
+    with pytest.raises(ValueError, match="interrupted"):
+        with subscription._prepare_working_directory():
+            (working_directory / "abc.mp4.part").touch()
+            (working_directory / "abc.info.json").touch()
+            raise ValueError("interrupted")
+
+    # Same options, resumes partial downloads but not the stale metadata
+    with subscription._prepare_working_directory():
+        assert (working_directory / "abc.mp4.part").is_file()
+        assert not (working_directory / "abc.info.json").is_file()
+
+    # Cleaned up after a successful run
+    assert not working_directory.exists()
+
+    with pytest.raises(ValueError, match="interrupted"):
+        with subscription._prepare_working_directory():
+            (working_directory / "abc.mp4.part").touch()
+            raise ValueError("interrupted")
+
+    # Different options, starts over
+    with _subscription(overrides={"key": "changed"})._prepare_working_directory():
+        assert not (working_directory / "abc.mp4.part").is_file()
+
+
+@pytest.mark.parametrize("remove_all_empty_directories", [True, False])
+def test_remove_empty_directories(
+    tmp_path: Path, youtube_video: Dict, output_options: Dict, remove_all_empty_directories: bool
+):
+    config = ConfigFile(
+        name="config",
+        value={
+            "configuration": {
+                "working_directory": str(tmp_path / "working"),
+                "remove_all_empty_directories": remove_all_empty_directories,
+            }
+        },
+    )
+    output_directory = tmp_path / "output"
+    subscription = Subscription.from_dict(
+        config=config,
+        preset_name="cleanup",
+        preset_dict={
+            "download": youtube_video,
+            "output_options": dict(output_options, output_directory=str(output_directory)),
+        },
+    )
+    subscription.download_archive.reinitialize(dry_run=False)
+    subscription.download_archive.mapping._entry_mappings["renamed"] = DownloadMapping(
+        upload_date="20240101", extractor="youtube", file_names={"Old Name/Season 1/renamed.mp4"}
+    )
+
+    for file_name in [
+        "Removed/Season 1/removed.mp4",
+        "Old Name/Season 1/renamed.mp4",
+        "Kept/kept.mp4",
+    ]:
+        (output_directory / file_name).parent.mkdir(parents=True)
+        (output_directory / file_name).touch()
+    (output_directory / "Untouched Empty").mkdir()
+
+    with subscription._remove_empty_directories_in_output_directory():
+        subscription.download_archive.delete_file_from_output_directory(
+            "Removed/Season 1/removed.mp4"
+        )
+        # The entry's file is moved to a new name, so it is only gone from the mapping
+        mapping = subscription.download_archive.mapping._entry_mappings["renamed"]
+        mapping.file_names = {"New Name/Season 1/renamed.mp4"}
+        (output_directory / "New Name" / "Season 1").mkdir(parents=True)
+        (output_directory / "Old Name/Season 1/renamed.mp4").rename(
+            output_directory / "New Name/Season 1/renamed.mp4"
+        )
+
+    assert not (output_directory / "Removed").exists()
+    assert not (output_directory / "Old Name").exists()
+    assert (output_directory / "New Name" / "Season 1" / "renamed.mp4").is_file()
+    assert (output_directory / "Kept" / "kept.mp4").is_file()
+
+    # Only the full sweep finds empty directories that were not touched in this session
+    assert (output_directory / "Untouched Empty").exists() != remove_all_empty_directories
+
+
+def test_remove_directories_emptied_by_keep_max_files(
+    tmp_path: Path, youtube_video: Dict, output_options: Dict
+):
+    output_directory = tmp_path / "output"
+    subscription = Subscription.from_dict(
+        config=ConfigFile(
+            name="config", value={"configuration": {"working_directory": str(tmp_path / "working")}}
+        ),
+        preset_name="keep_max_files",
+        preset_dict={
+            "download": youtube_video,
+            "output_options": dict(
+                output_options,
+                output_directory=str(output_directory),
+                maintain_download_archive=True,
+                keep_max_files=1,
+            ),
+        },
+    )
+    subscription.download_archive.reinitialize(dry_run=False)
+    for uid, upload_date, file_name in [
+        ("old", "20230101", "Season 2023/old.mp4"),
+        ("new", "20240101", "Season 2024/new.mp4"),
+    ]:
+        subscription.download_archive.mapping._entry_mappings[uid] = DownloadMapping(
+            upload_date=upload_date, extractor="youtube", file_names={file_name}
+        )
+        (output_directory / file_name).parent.mkdir(parents=True)
+        (output_directory / file_name).touch()
+
+    with subscription._subscription_download_context_managers():
+        pass
+
+    assert not (output_directory / "Season 2023").exists()
+    assert (output_directory / "Season 2024" / "new.mp4").is_file()
+
+
+def test_failed_entry_does_not_leave_remux_plans(
+    tmp_path: Path, youtube_video: Dict, output_options: Dict
+):
+    config = ConfigFile(
+        name="config", value={"configuration": {"working_directory": str(tmp_path / "working")}}
+    )
+    subscription = Subscription.from_dict(
+        config=config,
+        preset_name="failing",
+        preset_dict={
+            "download": youtube_video,
+            "output_options": dict(output_options, output_directory=str(tmp_path / "output")),
+        },
+    )
+    subscription.download_archive.reinitialize(dry_run=False)
+
+    downloader = Mock()
+    downloader.download_metadata.return_value = [Mock()]
+    downloader.download.side_effect = lambda entry: entry
+
+    def _failing_plugin(**_):
+        FFMPEGRemuxPlanner.add_metadata_key_values(file_path="entry.mp4", key_values={"a": "1"})
+        raise ValueError("plugin failed")
+
+    with (
+        patch.object(Subscription, "_process_entry", side_effect=_failing_plugin),
+        pytest.raises(ValueError, match="plugin failed"),
+    ):
+        subscription._process_subscription(plugins=[], downloader=downloader, dry_run=False)
+
+    assert FFMPEGRemuxPlanner._PLANS == {}
@@ -0,0 +1,107 @@
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.config.config_file import ConfigFile
+from ytdl_sub.subscriptions.subscription import Subscription
+from ytdl_sub.subscriptions.subscription_daemon import SubscriptionDaemon
+from ytdl_sub.utils.exceptions import ValidationException
+
+
+@pytest.fixture
+def daemon_config(working_directory: str, tmp_path: Path) -> ConfigFile:
+    return ConfigFile.from_dict(
+        {
+            "configuration": {
+                "working_directory": working_directory,
+                "cache_directory": str(tmp_path / "cache"),
+                "daemon": {
+                    "schedule": "1d",
+                    "subscription_schedules": {"Rick Astley": "0 0 1 1 *"},
+                },
+            }
+        }
+    )
+
+
+@pytest.fixture
+def subscription_path(tmp_path: Path, music_video_subscription_path: Path) -> str:
+    path = tmp_path / "subscriptions.yaml"
+    shutil.copy(music_video_subscription_path, path)
+    return str(path)
+
+
+@pytest.fixture
+def daemon(daemon_config: ConfigFile, subscription_path: str) -> SubscriptionDaemon:
+    return SubscriptionDaemon(
+        config=daemon_config,
+        config_path=None,
+        subscription_paths=[subscription_path],
+        subscription_matches=[],
+    )
+
+
+def _names(subscriptions) -> list:
+    return sorted(subscription.name for subscription in subscriptions)
+
+
+class TestSubscriptionDaemon:
+    def test_schedules(self, daemon: SubscriptionDaemon):
+        # Intervals run on startup, the yearly cron expression waits
+        due = daemon.due_subscriptions()
+        assert _names(due) == ["Eric Clapton", "Michael Jackson"]
+
+        for subscription in due:
+            daemon.mark_run(subscription=subscription, dry_run=False)
+        assert daemon.due_subscriptions() == []
+
+    def test_failed_subscriptions_are_retried_later(self, daemon: SubscriptionDaemon):
+        subscription = daemon.due_subscriptions()[0]
+        with subscription.exception_handling():
+            raise ValueError("error")
+
+        daemon.mark_run(subscription=subscription, dry_run=False)
+        assert subscription.name not in _names(daemon.due_subscriptions())
+
+    def test_trigger(self, daemon: SubscriptionDaemon, daemon_config: ConfigFile):
+        for subscription in daemon.due_subscriptions():
+            daemon.mark_run(subscription=subscription, dry_run=False)
+
+        SubscriptionDaemon.trigger(config=daemon_config, subscription_name="Rick Astley")
+        SubscriptionDaemon.trigger(config=daemon_config, subscription_name="Does Not Exist")
+
+        assert _names(daemon.due_subscriptions()) == ["Rick Astley"]
+        assert list(SubscriptionDaemon.trigger_directory(daemon_config).iterdir()) == []
+        assert daemon.due_subscriptions() == []
+
+    def test_reload_only_changed_files(self, daemon: SubscriptionDaemon, subscription_path: str):
+        subscriptions = daemon.subscriptions
+
+        with patch.object(
+            Subscription, "from_file_path", wraps=Subscription.from_file_path
+        ) as mock_from_file_path:
+            daemon.reload()
+            assert mock_from_file_path.call_count == 0
+            assert daemon.subscriptions == subscriptions
+
+            # Invalid change keeps the previous subscriptions
+            with open(subscription_path, "a", encoding="utf-8") as subscription_file:
+                subscription_file.write("\nnot_a_preset:\n  preset: does_not_exist\n")
+            os.utime(subscription_path, (0, 0))
+            daemon.reload()
+            assert mock_from_file_path.call_count == 1
+            assert daemon.subscriptions == subscriptions
+
+    def test_startup_fails_on_invalid_subscriptions(
+        self, daemon_config: ConfigFile, tmp_path: Path
+    ):
+        with pytest.raises(ValidationException):
+            SubscriptionDaemon(
+                config=daemon_config,
+                config_path=None,
+                subscription_paths=[str(tmp_path / "does_not_exist.yaml")],
+                subscription_matches=[],
+            )
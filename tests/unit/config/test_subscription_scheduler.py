@@ -0,0 +1,58 @@
+from datetime import date
+from pathlib import Path
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from ytdl_sub.subscriptions.subscription_scheduler import SubscriptionScheduler
+from ytdl_sub.ytdl_additions.enhanced_download_archive import DownloadMappings
+
+TODAY = date(2024, 6, 30)
+
+
+def _mapping(upload_dates: List[str]) -> DownloadMappings:
+    mapping = DownloadMappings()
+    for idx, upload_date in enumerate(upload_dates):
+        mapping.entry_mappings[str(idx)] = Mock(upload_date=upload_date)
+    return mapping
+
+
+class TestSubscriptionScheduler:
+    @pytest.mark.parametrize(
+        "upload_dates, expected_interval_hours",
+        [
+            # No history
+            ([], 0.5),
+            # Daily uploader
+            (["2024-06-29", "2024-06-28", "2024-06-27", "2024-06-26"], 1),
+            # Weekly uploader, last upload 3 days ago
+            (["2024-06-27", "2024-06-20", "2024-06-13"], 7),
+            # Weekly uploader that went dormant
+            (["2023-06-27", "2023-06-20", "2023-06-13"], 24),
+        ],
+    )
+    def test_check_interval(self, upload_dates: List[str], expected_interval_hours: float):
+        interval_sec = SubscriptionScheduler.check_interval_sec(_mapping(upload_dates), today=TODAY)
+        assert interval_sec == pytest.approx(expected_interval_hours * 60 * 60)
+
+    def test_persists_last_checked(self, tmp_path: Path):
+        state_file_path = str(tmp_path / "schedule.json")
+        mapping = _mapping(["2024-06-29", "2024-06-28"])
+
+        scheduler = SubscriptionScheduler(state_file_path=state_file_path)
+        assert scheduler.seconds_until_due("sub", mapping) <= 0
+
+        scheduler.mark_checked("sub")
+
+        # Next run reads the schedule back
+        scheduler = SubscriptionScheduler(state_file_path=state_file_path)
+        assert scheduler.seconds_until_due("sub", mapping) > 0
+        assert scheduler.seconds_until_due("other_sub", mapping) <= 0
+
+    def test_unreadable_schedule_checks_everything(self, tmp_path: Path):
+        state_file_path = tmp_path / "schedule.json"
+        state_file_path.write_text("not json")
+
+        scheduler = SubscriptionScheduler(state_file_path=str(state_file_path))
+        assert scheduler.seconds_until_due("sub", _mapping([])) <= 0
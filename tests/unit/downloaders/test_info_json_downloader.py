@@ -0,0 +1,107 @@
+import json
+from pathlib import Path
+from typing import List
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.downloaders.info_json.info_json_downloader import InfoJsonDownloader
+from ytdl_sub.utils.exceptions import ValidationException
+
+
+@pytest.fixture
+def info_json_downloader(tmp_path: Path) -> InfoJsonDownloader:
+    enhanced_download_archive = Mock()
+    enhanced_download_archive.mapping.entry_mappings = {}
+    enhanced_download_archive.working_directory = str(tmp_path)
+    return InfoJsonDownloader(
+        options=Mock(),
+        enhanced_download_archive=enhanced_download_archive,
+        download_ytdl_options=Mock(),
+        metadata_ytdl_options=Mock(),
+        overrides=Mock(),
+    )
+
+
+def _write_info_jsons(tmp_path: Path, download_indices: List[int]) -> List[Path]:
+    info_json_paths: List[Path] = []
+    for idx, download_index in enumerate(download_indices):
+        info_json_path = tmp_path / f"entry_{idx}.info.json"
+        info_json_path.write_text(
+            json.dumps(
+                {
+                    "id": f"entry_{idx}",
+                    "ytdl_sub_entry_variables": {"download_index": download_index},
+                }
+            ),
+            encoding="utf-8",
+        )
+        info_json_paths.append(info_json_path)
+    return info_json_paths
+
+
+class TestInfoJsonDownloader:
+    def test_iterates_in_download_index_order(
+        self, info_json_downloader: InfoJsonDownloader, tmp_path: Path
+    ):
+        # More entries than are prefetched, with ties that keep their mapping order
+        download_indices = [5, 3, 20, 1, 3, 12, 7, 18, 2, 9, 11, 4, 16, 3, 14, 6, 10, 8, 13, 15]
+        info_json_paths = _write_info_jsons(tmp_path, download_indices)
+
+        with patch.object(
+            InfoJsonDownloader, "_load_info_json", wraps=info_json_downloader._load_info_json
+        ) as mock_load:
+            sorted_paths, loaded_info_jsons = info_json_downloader._sorted_info_jsons(
+                info_json_paths
+            )
+            entries = [
+                entry
+                for entry, _ in info_json_downloader._iterate_info_jsons(
+                    sorted_paths, loaded_info_jsons
+                )
+            ]
+
+        expected_order = sorted(range(len(download_indices)), key=lambda idx: download_indices[idx])
+        assert [entry.uid for entry in entries] == [f"entry_{idx}" for idx in expected_order]
+
+        # The first entries are reused from reading the download indices
+        assert mock_load.call_count == (
+            2 * len(info_json_paths) - InfoJsonDownloader._NUM_PREFETCHED_INFO_JSONS
+        )
+
+    def test_prior_variables_are_kept_for_reused_entries(
+        self, info_json_downloader: InfoJsonDownloader, tmp_path: Path
+    ):
+        info_json_paths = _write_info_jsons(tmp_path, [2, 1])
+
+        sorted_paths, loaded_info_jsons = info_json_downloader._sorted_info_jsons(info_json_paths)
+        prior_variables = [
+            prior_variables
+            for _, prior_variables in info_json_downloader._iterate_info_jsons(
+                sorted_paths, loaded_info_jsons
+            )
+        ]
+
+        assert prior_variables == [{"download_index": 1}, {"download_index": 2}]
+
+    def test_invalid_prefetched_info_json(
+        self, info_json_downloader: InfoJsonDownloader, tmp_path: Path
+    ):
+        info_json_paths = _write_info_jsons(tmp_path, list(range(1, 21)))
+        sorted_paths, loaded_info_jsons = info_json_downloader._sorted_info_jsons(info_json_paths)
+
+        # Becomes invalid after the download indices were read, so fails when it is prefetched
+        info_json_paths[15].write_text("{not json", encoding="utf-8")
+        uids: List[str] = []
+        with pytest.raises(ValidationException, match="info.json file cannot be loaded"):
+            for entry, _ in info_json_downloader._iterate_info_jsons(
+                sorted_paths, loaded_info_jsons
+            ):
+                uids.append(entry.uid)
+
+        assert uids == [f"entry_{idx}" for idx in range(15)]
+
+        # Invalid files are also found before any entry is processed
+        with pytest.raises(ValidationException, match="info.json file cannot be loaded"):
+            info_json_downloader._sorted_info_jsons(info_json_paths)
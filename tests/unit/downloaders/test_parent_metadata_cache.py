@@ -0,0 +1,76 @@
+from pathlib import Path
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.downloaders.parent_metadata_cache import ParentMetadataCache
+
+UPLOADER_URL = "https://www.youtube.com/@channel"
+
+
+@pytest.fixture
+def parent_metadata_cache(tmp_path: Path):
+    ParentMetadataCache.set_directory(str(tmp_path))
+    ParentMetadataCache._IN_MEMORY.clear()
+    yield
+    ParentMetadataCache.set_directory(None)
+    ParentMetadataCache._IN_MEMORY.clear()
+
+
+class TestParentMetadataCache:
+    def test_fetches_once_across_runs(self, parent_metadata_cache):
+        fetch = Mock(return_value={"id": "UC123", "_type": "playlist", "entries": []})
+
+        first = ParentMetadataCache.get_or_fetch(uploader_url=UPLOADER_URL, fetch=fetch)
+        # Shared across subscriptions in the same run
+        assert ParentMetadataCache.get_or_fetch(uploader_url=UPLOADER_URL, fetch=fetch) == first
+
+        # Next run, only the on-disk cache remains
+        ParentMetadataCache._IN_MEMORY.clear()
+        assert ParentMetadataCache.get_or_fetch(uploader_url=UPLOADER_URL, fetch=fetch) == first
+
+        assert first["id"] == "UC123"
+        assert fetch.call_count == 1
+
+    def test_refetches_after_ttl(self, parent_metadata_cache):
+        fetch = Mock(return_value={"id": "UC123"})
+        ParentMetadataCache.get_or_fetch(uploader_url=UPLOADER_URL, fetch=fetch)
+        ParentMetadataCache._IN_MEMORY.clear()
+
+        with patch.object(ParentMetadataCache, "_TTL_SEC", 0):
+            ParentMetadataCache.get_or_fetch(uploader_url=UPLOADER_URL, fetch=fetch)
+
+        assert fetch.call_count == 2
+
+    def test_failed_lookup_only_cached_in_run(self, parent_metadata_cache):
+        fetch = Mock(return_value=None)
+
+        assert ParentMetadataCache.get_or_fetch(uploader_url=UPLOADER_URL, fetch=fetch) is None
+        assert ParentMetadataCache.get_or_fetch(uploader_url=UPLOADER_URL, fetch=fetch) is None
+        assert fetch.call_count == 1
+
+        ParentMetadataCache._IN_MEMORY.clear()
+        ParentMetadataCache.get_or_fetch(uploader_url=UPLOADER_URL, fetch=fetch)
+        assert fetch.call_count == 2
+
+    def test_keyed_on_options(self, parent_metadata_cache):
+        fetch = Mock(return_value={"id": "UC123"})
+        extractor_args = {"youtube": {"lang": ["de"]}}
+
+        ParentMetadataCache.get_or_fetch(uploader_url=UPLOADER_URL, fetch=fetch)
+        ParentMetadataCache.get_or_fetch(
+            uploader_url=UPLOADER_URL, fetch=fetch, ytdl_options={"cookiefile": "cookies.txt"}
+        )
+        ParentMetadataCache.get_or_fetch(
+            uploader_url=UPLOADER_URL, fetch=fetch, ytdl_options={"extractor_args": extractor_args}
+        )
+        assert fetch.call_count == 3
+
+        # Options that do not change the metadata still share the lookup
+        ParentMetadataCache.get_or_fetch(
+            uploader_url=UPLOADER_URL,
+            fetch=fetch,
+            ytdl_options={"extractor_args": extractor_args, "format": "best"},
+        )
+        assert fetch.call_count == 3
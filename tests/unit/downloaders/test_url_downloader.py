@@ -0,0 +1,122 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+from unittest.mock import PropertyMock
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.config.config_file import ConfigFile
+from ytdl_sub.downloaders.ytdlp import YTDLP
+from ytdl_sub.subscriptions.subscription import Subscription
+from ytdl_sub.ytdl_additions.enhanced_download_archive import DownloadArchiveSnapshot
+from ytdl_sub.ytdl_additions.enhanced_download_archive import EnhancedDownloadArchive
+
+
+@pytest.fixture
+def probed_subscription(config: ConfigFile, subscription_name: str, output_directory: str):
+    return Subscription.from_dict(
+        config=config,
+        preset_name=subscription_name,
+        preset_dict={
+            "download": {
+                "url": "https://www.youtube.com/@channel/videos",
+                "probe_items": "3",
+                "ytdl_options": {"break_on_existing": True},
+            },
+            "output_options": {"output_directory": output_directory, "file_name": "{uid}"},
+        },
+    )
+
+
+def _probe_result(entry_ids: List[str], upload_dates: Optional[List[str]] = None) -> Dict:
+    entries = [{"id": entry_id, "ie_key": "Youtube"} for entry_id in entry_ids]
+    for entry, upload_date in zip(entries, upload_dates or []):
+        entry["upload_date"] = upload_date
+    return {"entries": entries}
+
+
+class TestProbeUrl:
+    @pytest.mark.parametrize(
+        "probed_ids, expected_playlistend",
+        [
+            (["old1", "old2", "old3"], None),
+            (["new1", "old1", "old2"], 1),
+            (["new1", "new2", "new3"], "unbounded"),
+        ],
+    )
+    def test_probe(self, probed_subscription: Subscription, probed_ids, expected_playlistend):
+        with (
+            patch.object(
+                EnhancedDownloadArchive,
+                "download_archive_snapshot",
+                new_callable=PropertyMock,
+                return_value={"youtube old1", "youtube old2", "youtube old3"},
+            ),
+            patch.object(YTDLP, "extract_info", return_value=_probe_result(probed_ids)),
+            patch.object(YTDLP, "extract_info_via_info_json", return_value=[]) as mock_crawl,
+        ):
+            probed_subscription.download(dry_run=True)
+
+        if expected_playlistend is None:
+            assert mock_crawl.call_count == 0
+            return
+
+        assert mock_crawl.call_count == 1
+        ytdl_options = mock_crawl.call_args.kwargs["ytdl_options_overrides"]
+        if expected_playlistend == "unbounded":
+            assert "playlistend" not in ytdl_options
+        else:
+            assert ytdl_options["playlistend"] == expected_playlistend
+
+    @pytest.mark.parametrize(
+        "upload_dates, expected_crawls",
+        [
+            # Newest-first channel, nothing new
+            (["20240103", "20240102", "20240101"], 0),
+            # Playlist that appends new videos at the end, the new ones are past the probe
+            (["20240101", "20240102", "20240103"], 1),
+        ],
+    )
+    def test_probe_append_at_end_playlist(
+        self, probed_subscription: Subscription, upload_dates: List[str], expected_crawls: int
+    ):
+        with (
+            patch.object(
+                EnhancedDownloadArchive,
+                "download_archive_snapshot",
+                new_callable=PropertyMock,
+                return_value={"youtube old1", "youtube old2", "youtube old3"},
+            ),
+            patch.object(
+                YTDLP,
+                "extract_info",
+                return_value=_probe_result(["old1", "old2", "old3"], upload_dates=upload_dates),
+            ),
+            patch.object(YTDLP, "extract_info_via_info_json", return_value=[]) as mock_crawl,
+        ):
+            probed_subscription.download(dry_run=True)
+
+        assert mock_crawl.call_count == expected_crawls
+        if expected_crawls:
+            assert "playlistend" not in mock_crawl.call_args.kwargs["ytdl_options_overrides"]
+
+
+class TestDownloadArchiveSnapshot:
+    def test_shared_with_ytdlp_without_copying(self):
+        snapshot = DownloadArchiveSnapshot({"youtube old1", "youtube old2"})
+
+        with (
+            patch("ytdl_sub.downloaders.ytdlp.ytdl.YoutubeDL") as mock_youtube_dl,
+            patch.object(YTDLP.logger, "debug") as mock_debug,
+        ):
+            with YTDLP.ytdlp_downloader({"download_archive": snapshot}):
+                pass
+
+        assert mock_youtube_dl.call_args.args[0]["download_archive"] is snapshot
+        assert "youtube old1" not in str(mock_debug.call_args.args)
+        assert "download archive of 2 entries" in str(mock_debug.call_args.args)
+
+        # Downloads recorded by yt-dlp do not leak into the next URL
+        snapshot.add("youtube new1")
+        assert "youtube new1" not in snapshot
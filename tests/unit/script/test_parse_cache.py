@@ -0,0 +1,66 @@
+import pytest
+
+from ytdl_sub.script.parser import _ParseCache
+from ytdl_sub.script.parser import parse
+from ytdl_sub.script.utils.exceptions import FunctionDoesNotExist
+from ytdl_sub.script.utils.exceptions import VariableDoesNotExist
+from ytdl_sub.utils.script import ScriptUtils
+
+OVERRIDE_TEXT = "Season {upload_year}/{%concat(title_sanitized, ' - ', upload_date_standardized)}"
+OVERRIDE_VARIABLE_NAMES = {"upload_year", "title_sanitized", "upload_date_standardized"}
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    _ParseCache.clear()
+    yield
+    _ParseCache.clear()
+
+
+@pytest.fixture
+def entry_metadata_script() -> str:
+    return ScriptUtils.to_script(
+        {
+            "title": "The title",
+            "description": "A long description. " * 2000,
+            "tags": [f"tag_{idx}" for idx in range(500)],
+            "formats": [
+                {"format_id": str(idx), "url": f"https://example.com/{'a' * 200}", "height": idx}
+                for idx in range(200)
+            ],
+        }
+    )
+
+
+class TestParseCache:
+    def test_cache_hit_returns_identical_tree(self):
+        tree = parse(OVERRIDE_TEXT, variable_names=OVERRIDE_VARIABLE_NAMES)
+        assert parse(OVERRIDE_TEXT, variable_names=OVERRIDE_VARIABLE_NAMES) is tree
+
+        # Known names are a superset, the cached tree is still valid
+        assert parse(OVERRIDE_TEXT, variable_names=OVERRIDE_VARIABLE_NAMES | {"title"}) is tree
+
+    def test_cache_keyed_on_name(self):
+        tree = parse(OVERRIDE_TEXT, variable_names=OVERRIDE_VARIABLE_NAMES)
+        assert (
+            parse(OVERRIDE_TEXT, name="other", variable_names=OVERRIDE_VARIABLE_NAMES) is not tree
+        )
+
+    def test_unknown_variable_misses(self):
+        parse(OVERRIDE_TEXT, variable_names=OVERRIDE_VARIABLE_NAMES)
+
+        with pytest.raises(VariableDoesNotExist):
+            parse(OVERRIDE_TEXT, variable_names={"upload_year", "title_sanitized"})
+
+    def test_unknown_custom_function_misses(self):
+        text = "{%custom_func(title)}"
+        parse(text, custom_function_names={"custom_func"}, variable_names={"title"})
+
+        with pytest.raises(FunctionDoesNotExist):
+            parse(text, custom_function_names=set(), variable_names={"title"})
+
+    def test_long_text_not_cached(self, entry_metadata_script: str):
+        tree = parse(entry_metadata_script)
+
+        assert tree.ast[0].name == "from_json"
+        assert parse(entry_metadata_script) is not tree
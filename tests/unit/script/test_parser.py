@@ -18,7 +18,9 @@ from ytdl_sub.script.types.resolvable import Lambda
 from ytdl_sub.script.types.resolvable import String
 from ytdl_sub.script.types.syntax_tree import SyntaxTree
 from ytdl_sub.script.types.variable import Variable
+from ytdl_sub.script.utils.exceptions import FunctionDoesNotExist
 from ytdl_sub.script.utils.exceptions import InvalidSyntaxException
+from ytdl_sub.script.utils.exceptions import VariableDoesNotExist
 
 
 class TestParser:
@@ -202,6 +204,24 @@ class TestParser:
             ]
         )
 
+    def test_parse_cache(self):
+        text = "{%upper(title)} - {%custom_wrap(title)} - \\{escaped\\}"
+        parsed = parse(
+            text, custom_function_names={"custom_wrap"}, variable_names={"title", "other"}
+        )
+        assert parse(text, custom_function_names={"custom_wrap"}, variable_names={"title"}) is (
+            parsed
+        )
+
+        # Cached trees are only returned if the names they use are known
+        with pytest.raises(VariableDoesNotExist):
+            parse(text, custom_function_names={"custom_wrap"}, variable_names={"other"})
+        with pytest.raises(FunctionDoesNotExist):
+            parse(text, custom_function_names=set(), variable_names={"title"})
+
+        # Names change how custom function arguments are parsed
+        assert parse("{%upper($0)}", name="first") != parse("{%upper($0)}", name="second")
+
 
 class TestParserBracketFailures:
     def test_bracket_open(self):
@@ -1,7 +1,19 @@
+import copy
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.script.parser import parse
 from ytdl_sub.script.script import Script
 from ytdl_sub.script.script_output import ScriptOutput
 from ytdl_sub.script.types.map import Map
 from ytdl_sub.script.types.resolvable import String
+from ytdl_sub.script.types.syntax_tree import SyntaxTree
+from ytdl_sub.script.utils.exceptions import RuntimeException
+from ytdl_sub.script.utils.exceptions import ScriptVariableNotResolved
+from ytdl_sub.script.utils.exceptions import UserThrownRuntimeError
+from ytdl_sub.script.utils.exceptions import VariableDoesNotExist
 
 
 class TestScript:
@@ -86,3 +98,146 @@ class TestScript:
         assert (
             script.resolve_once({"url": "{ %bilateral_url_wrap('nope') }"})["url"].native == "nope"
         )
+
+    def test_resolve_dependents(self):
+        script = Script(
+            {
+                "title": "the title",
+                "upper_title": "{%upper(title)}",
+                "index": "{%int(0)}",
+                "indexed_title": "{index} - {upper_title}",
+                "wrapped_index": "{%concat('[', indexed_title, ']')}",
+                "other_index": "{%int(0)}",
+                "other_indexed_title": "{other_index} - {title}",
+            }
+        )
+        script.resolve(unresolvable={"index", "other_index"}, update=True)
+        fully_resolved_script = copy.deepcopy(script)
+
+        evaluated: List[SyntaxTree] = []
+        resolve = SyntaxTree.resolve
+
+        def _counting_resolve(tree: SyntaxTree, *args, **kwargs):
+            evaluated.append(tree)
+            return resolve(tree, *args, **kwargs)
+
+        script.add({"index": "{%int(1)}"})
+        with patch.object(SyntaxTree, "resolve", _counting_resolve):
+            script.resolve_dependents(variable_names={"index"}, unresolvable={"other_index"})
+
+        # Only evaluates the added variable and the variables that depend on it
+        assert len(evaluated) == 3
+        assert script.get("wrapped_index") == String("[1 - THE TITLE]")
+        with pytest.raises(RuntimeException):
+            script.get("other_indexed_title")
+
+        # Same as updating the entire script
+        fully_resolved_script.add({"index": "{%int(1)}"})
+        fully_resolved_script.resolve(unresolvable={"other_index"}, update=True)
+        assert script.resolve(unresolvable={"other_index"}) == fully_resolved_script.resolve(
+            unresolvable={"other_index"}
+        )
+
+    def test_partially_resolve(self):
+        script = Script(
+            {
+                "directory": "music",
+                "artist": "the artist",
+                "entry_title": "{%string('unresolved')}",
+                "file_path": "{directory}/{%upper(artist)} - {entry_title}",
+                "thrown": "{%if(%bool(entry_title), %throw('error'), %upper(artist))}",
+            }
+        )
+        script.resolve(unresolvable={"entry_title"}, update=True)
+        script.partially_resolve(variable_names={"directory", "artist"})
+
+        # Only the variable that cannot be resolved remains
+        assert {var.name for var in script._variables["file_path"].variables} == {"entry_title"}
+        assert script._variables["file_path"].built_in_functions == []
+
+        script.add({"entry_title": "the title"})
+        output = script.resolve(unresolvable={"thrown"}).output
+        assert output["file_path"] == String("music/THE ARTIST - the title")
+
+        # Errors are raised when resolving, not when inlining
+        with pytest.raises(UserThrownRuntimeError):
+            script.resolve()
+
+    def test_virtual_variables(self):
+        script = Script(
+            {"title": "a/b", "upper_title": "{%upper(title_sanitized)}", "other": "c/d"},
+            virtual_variables={"_sanitized": "sanitize"},
+        )
+        script.resolve(update=True)
+
+        # Only virtual variables that are used are added
+        assert script.variable_names == {"title", "title_sanitized", "upper_title", "other"}
+        assert script.get("upper_title") == String("A⧸B")
+        assert script.get("other_sanitized") == String("c⧸d")
+        assert "other_sanitized" in script.variable_names
+
+        # Re-adding the variable updates its virtual variables
+        script.add({"title": "e/f"})
+        script.resolve_dependents(variable_names={"title"})
+        assert script.get("title_sanitized") == String("e⧸f")
+
+        # Virtual variables can be output without adding them
+        assert script.resolve(include_virtual=True).get("upper_title_sanitized") == String("A⧸B")
+        assert "upper_title_sanitized" not in script.variable_names
+
+    def test_evaluate(self):
+        script = Script(
+            {
+                "%wrap": "{%concat('[', $0, ']')}",
+                "title": "the title",
+                "upper_title": "{%upper(title)}",
+                "unresolved_title": "{%lower(upper_title)}",
+            }
+        )
+        script.resolve(unresolvable={"unresolved_title"}, update=True)
+        num_variables = len(script.variable_names)
+
+        # Only uses resolved variables
+        assert script.evaluate(parse("{upper_title} - {title}")) == String("THE TITLE - the title")
+        # Depends on an unresolved variable and custom function
+        assert script.evaluate(parse("{%wrap(unresolved_title)}")) == String("[the title]")
+        assert script.evaluate(parse("{%upper(lang)}"), extra={"lang": "en"}) == String("EN")
+        assert script.evaluate(parse("{title}"), extra={"title": "override"}) == String("override")
+
+        # Does not modify the script
+        assert len(script.variable_names) == num_variables
+        assert script.get("title") == String("the title")
+
+    def test_evaluate_many(self):
+        script = Script(
+            {
+                "%wrap": "{%concat('[', $0, ']')}",
+                "title": "the title",
+                "upper_title": "{%upper(title)}",
+                "unresolved_title": "{%lower(upper_title)}",
+            }
+        )
+        script.resolve(unresolvable={"unresolved_title"}, update=True)
+
+        # Mixes trees that only use resolved variables with ones that need resolving
+        assert script.evaluate_many(
+            {
+                "direct": parse("{upper_title}"),
+                "wrapped": parse("{%wrap(unresolved_title)}"),
+                ("tuple", 0): parse("{unresolved_title} - {title}"),
+            }
+        ) == {
+            "direct": String("THE TITLE"),
+            "wrapped": String("[the title]"),
+            ("tuple", 0): String("the title - the title"),
+        }
+        assert script.evaluate_many({}) == {}
+
+    def test_evaluate_unresolvable(self):
+        script = Script({"title": "the title", "upper_title": "{%upper(title)}"})
+
+        with pytest.raises(ScriptVariableNotResolved):
+            script.evaluate(parse("{upper_title}"), unresolvable={"title"})
+
+        with pytest.raises(VariableDoesNotExist):
+            script.evaluate(parse("{does_not_exist}"))
@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pytest
+
+from ytdl_sub.utils.cron import CronExpression
+from ytdl_sub.utils.cron import Schedule
+
+
+class TestCronExpression:
+    @pytest.mark.parametrize(
+        "expression, after, expected",
+        [
+            ("*/15 * * * *", datetime(2024, 1, 1, 10, 7), datetime(2024, 1, 1, 10, 15)),
+            ("0 */6 * * *", datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 12, 0)),
+            ("30 2 * * *", datetime(2024, 1, 1, 2, 30), datetime(2024, 1, 2, 2, 30)),
+            # 2024-01-01 is a Monday, 0 and 7 are Sunday
+            ("0 9 * * 0", datetime(2024, 1, 1), datetime(2024, 1, 7, 9, 0)),
+            ("0 9 * * 7", datetime(2024, 1, 1), datetime(2024, 1, 7, 9, 0)),
+            ("0 9 * * 1-5", datetime(2024, 1, 5, 10, 0), datetime(2024, 1, 8, 9, 0)),
+            ("0 0 1,15 * *", datetime(2024, 1, 2), datetime(2024, 1, 15, 0, 0)),
+            ("0 0 29 2 *", datetime(2024, 3, 1), datetime(2028, 2, 29, 0, 0)),
+            # Both day fields restricted matches either
+            ("0 0 13 * 5", datetime(2024, 1, 1), datetime(2024, 1, 5, 0, 0)),
+            ("@daily", datetime(2024, 1, 1, 0, 0, 30), datetime(2024, 1, 2, 0, 0)),
+        ],
+    )
+    def test_next_after(self, expression: str, after: datetime, expected: datetime):
+        cron = CronExpression(expression)
+        assert cron.next_after(after) == expected
+        assert cron.matches(expected)
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "* * * *",
+            "60 * * * *",
+            "* 24 * * *",
+            "* * 0 * *",
+            "*/0 * * * *",
+            "a * * * *",
+            "5-1 * * * *",
+        ],
+    )
+    def test_invalid(self, expression: str):
+        with pytest.raises(ValueError):
+            CronExpression(expression)
+
+    def test_never_matches(self):
+        with pytest.raises(ValueError, match="never matches"):
+            CronExpression("0 0 31 2 *").next_after(datetime(2024, 1, 1))
+
+
+class TestSchedule:
+    def test_interval(self):
+        schedule = Schedule("6h")
+        assert schedule.next_run_time(last_run=None, started_at=100.0) == 100.0
+        assert schedule.next_run_time(last_run=1000.0, started_at=100.0) == 1000.0 + 6 * 60 * 60
+
+    def test_cron(self):
+        schedule = Schedule("0 * * * *")
+        last_run = datetime(2024, 1, 1, 10, 30).timestamp()
+        assert schedule.next_run_time(last_run=last_run, started_at=0.0) == (
+            datetime(2024, 1, 1, 11, 0).timestamp()
+        )
+
+    @pytest.mark.parametrize("schedule", ["0m", "6x", "0 0 31 2 *"])
+    def test_invalid(self, schedule: str):
+        with pytest.raises(ValueError):
+            Schedule(schedule)
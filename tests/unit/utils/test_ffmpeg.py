@@ -0,0 +1,90 @@
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.config.defaults import DEFAULT_FFMPEG_PATH
+from ytdl_sub.config.defaults import DEFAULT_FFPROBE_PATH
+from ytdl_sub.utils.chapters import Chapters
+from ytdl_sub.utils.ffmpeg import FFMPEG
+from ytdl_sub.utils.ffmpeg import FFMPEGRemuxPlanner
+from ytdl_sub.utils.file_handler import FileHandler
+
+
+class TestFFMPEG:
+    def test_probes_once_and_records_timings(self):
+        FFMPEG.set_paths(ffmpeg_path=DEFAULT_FFMPEG_PATH, ffprobe_path=DEFAULT_FFPROBE_PATH)
+        num_timings = len(FFMPEG.run_timings())
+
+        with patch.object(subprocess, "check_output", wraps=subprocess.check_output) as mock_probe:
+            FFMPEG.run(["-version"])
+            FFMPEG.run(["-version"])
+
+        assert mock_probe.call_count <= 1
+        assert len(FFMPEG.run_timings()) == num_timings + 2
+        assert FFMPEG.run_timings()[-1].wall_time_sec > 0
+
+    def test_failed_run_includes_stderr(self):
+        FFMPEG.set_paths(ffmpeg_path=DEFAULT_FFMPEG_PATH, ffprobe_path=DEFAULT_FFPROBE_PATH)
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            FFMPEG.run(["-i", "/does/not/exist.mp4", "/does/not/exist.mkv"])
+
+        assert "/does/not/exist.mp4" in exc_info.value.stderr
+
+
+class TestFFMPEGRemuxPlanner:
+    def test_fuses_into_single_run(self):
+        file_path = "/tmp/video.mp4"
+        FFMPEGRemuxPlanner.set_chapters(
+            file_path=file_path,
+            chapters=Chapters.from_string("0:00 intro\n0:10 outro"),
+            file_duration_sec=20,
+        )
+        FFMPEGRemuxPlanner.add_metadata_key_values(file_path=file_path, key_values={"a": "1"})
+        FFMPEGRemuxPlanner.add_metadata_key_values(file_path=file_path, key_values={"b": "2"})
+        FFMPEGRemuxPlanner.set_attached_picture(file_path=file_path, picture_path="/tmp/thumb.jpg")
+
+        with (
+            patch.object(FFMPEG, "run") as mock_run,
+            patch.object(FileHandler, "move") as mock_move,
+        ):
+            FFMPEGRemuxPlanner.run(file_path)
+            # Nothing left to run
+            FFMPEGRemuxPlanner.run(file_path)
+
+        assert mock_run.call_count == 1
+        mock_move.assert_called_once_with(f"{file_path}.out.mp4", file_path)
+
+        ffmpeg_args = mock_run.call_args.args[0]
+        assert ffmpeg_args[:4] == ["-i", file_path, "-i", "/tmp/thumb.jpg"]
+        assert ffmpeg_args[6:] == [
+            "-map",
+            "1",
+            "-map",
+            "0",
+            "-dn",
+            "-map_chapters",
+            "2",
+            "-metadata",
+            "a=1",
+            "-metadata",
+            "b=2",
+            "-codec",
+            "copy",
+            "-bitexact",
+            "-disposition:0",
+            "attached_pic",
+            f"{file_path}.out.mp4",
+        ]
+
+    def test_discard(self):
+        FFMPEGRemuxPlanner.add_metadata_key_values(
+            file_path="/tmp/dropped.mp4", key_values={"a": "1"}
+        )
+        FFMPEGRemuxPlanner.discard("/tmp/dropped.mp4")
+
+        with patch.object(FFMPEG, "run") as mock_run:
+            FFMPEGRemuxPlanner.run("/tmp/dropped.mp4")
+
+        assert mock_run.call_count == 0
@@ -0,0 +1,85 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.utils.file_handler import DirectoryFileIndex
+from ytdl_sub.utils.file_handler import FileHandler
+
+
+@pytest.fixture
+def indexed_directory(tmp_path: Path) -> Path:
+    DirectoryFileIndex.invalidate()
+    for file_name in ["abc.mp4", "abc.info.json", "abc.en.srt", "xyz.webp"]:
+        (tmp_path / file_name).touch()
+    yield tmp_path
+    DirectoryFileIndex.invalidate()
+
+
+class TestDirectoryFileIndex:
+    def test_scans_directory_once(self, indexed_directory: Path):
+        with patch.object(os, "scandir", wraps=os.scandir) as mock_scandir:
+            assert DirectoryFileIndex.is_file(indexed_directory / "abc.mp4")
+            assert DirectoryFileIndex.is_file(indexed_directory / "xyz.webp")
+            assert not DirectoryFileIndex.is_file(indexed_directory / "abc.mkv")
+            assert not DirectoryFileIndex.is_file(indexed_directory / "missing.jpg")
+
+        assert mock_scandir.call_count == 1
+
+    def test_file_names(self, indexed_directory: Path):
+        assert DirectoryFileIndex.file_names(directory=indexed_directory, prefix="abc") == [
+            "abc.en.srt",
+            "abc.info.json",
+            "abc.mp4",
+        ]
+        assert DirectoryFileIndex.file_names(directory=indexed_directory) == [
+            "abc.en.srt",
+            "abc.info.json",
+            "abc.mp4",
+            "xyz.webp",
+        ]
+
+    def test_file_handler_updates_index(self, indexed_directory: Path):
+        assert not DirectoryFileIndex.is_file(indexed_directory / "abc.jpg")
+
+        FileHandler.move(indexed_directory / "xyz.webp", indexed_directory / "abc.jpg")
+        assert DirectoryFileIndex.is_file(indexed_directory / "abc.jpg")
+        assert not DirectoryFileIndex.is_file(indexed_directory / "xyz.webp")
+
+        FileHandler.copy(indexed_directory / "abc.jpg", indexed_directory / "xyz.jpg")
+        assert DirectoryFileIndex.is_file(indexed_directory / "xyz.jpg")
+
+        FileHandler.delete(indexed_directory / "abc.mp4")
+        assert not DirectoryFileIndex.is_file(indexed_directory / "abc.mp4")
+
+    def test_invalidate_rescans(self, indexed_directory: Path):
+        assert not DirectoryFileIndex.is_file(indexed_directory / "abc.mkv")
+
+        # Written outside of FileHandler, i.e. by yt-dlp
+        (indexed_directory / "abc.mkv").touch()
+        assert not DirectoryFileIndex.is_file(indexed_directory / "abc.mkv")
+
+        DirectoryFileIndex.invalidate()
+        assert DirectoryFileIndex.is_file(indexed_directory / "abc.mkv")
+
+    def test_concurrent_updates(self, indexed_directory: Path):
+        def _update(thread_idx: int) -> None:
+            for idx in range(200):
+                file_path = indexed_directory / f"abc.{thread_idx}.{idx}.jpg"
+                DirectoryFileIndex.add(file_path)
+                DirectoryFileIndex.file_names(directory=indexed_directory)
+                DirectoryFileIndex.remove(file_path)
+                if idx % 50 == 0:
+                    DirectoryFileIndex.invalidate()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Raises if any thread failed
+            list(executor.map(_update, range(8)))
+
+        assert DirectoryFileIndex.file_names(directory=indexed_directory, prefix="abc") == [
+            "abc.en.srt",
+            "abc.info.json",
+            "abc.mp4",
+        ]
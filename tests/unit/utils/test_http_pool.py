@@ -0,0 +1,79 @@
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Set
+from urllib.error import HTTPError
+
+import pytest
+
+from ytdl_sub.utils.http_pool import HttpSessionPool
+
+
+@pytest.fixture
+def keep_alive_server():
+    """
+    Local HTTP/1.1 server that records which client connections it served
+    """
+    client_ports: Set[int] = set()
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            client_ports.add(self.client_address[1])
+            if self.path == "/redirect":
+                self.send_response(302)
+                self.send_header("Location", "/image.jpg")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            status, body = (200, b"image") if self.path == "/image.jpg" else (404, b"missing")
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", client_ports
+    finally:
+        HttpSessionPool.close()
+        server.shutdown()
+        server.server_close()
+
+
+class TestHttpSessionPool:
+    def test_reuses_connection(self, keep_alive_server):
+        base_url, client_ports = keep_alive_server
+
+        for _ in range(3):
+            with HttpSessionPool.open(f"{base_url}/image.jpg") as response:
+                assert response.read() == b"image"
+
+        assert len(client_ports) == 1
+
+    def test_follows_redirect(self, keep_alive_server):
+        base_url, _ = keep_alive_server
+
+        with HttpSessionPool.open(f"{base_url}/redirect") as response:
+            assert response.read() == b"image"
+
+    def test_raises_http_error(self, keep_alive_server):
+        base_url, client_ports = keep_alive_server
+
+        with pytest.raises(HTTPError) as exc_info:
+            with HttpSessionPool.open(f"{base_url}/missing.jpg"):
+                pass
+
+        assert exc_info.value.code == 404
+
+        # Connection is still reused after an error response
+        with HttpSessionPool.open(f"{base_url}/image.jpg") as response:
+            assert response.read() == b"image"
+        assert len(client_ports) == 1
@@ -0,0 +1,86 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.utils.lease import LeaseDirectory
+
+
+@pytest.fixture
+def lease_directory(tmp_path: Path) -> str:
+    return str(tmp_path / "leases")
+
+
+def _worker(lease_directory: str, worker_id: str, lease_timeout_sec: float = 60) -> LeaseDirectory:
+    return LeaseDirectory(
+        directory=lease_directory, lease_timeout_sec=lease_timeout_sec, worker_id=worker_id
+    )
+
+
+def _lease_files(lease_directory: str):
+    return sorted(Path(lease_directory).iterdir())
+
+
+class TestLeaseDirectory:
+    def test_claim_excludes_other_workers(self, lease_directory: str):
+        worker_a = _worker(lease_directory, "a")
+        worker_b = _worker(lease_directory, "b")
+
+        with worker_a.claim(["sub:1", "out:1"]) as is_claimed:
+            assert is_claimed
+            assert len(_lease_files(lease_directory)) == 2
+
+            # Claims are all or none
+            with worker_b.claim(["sub:2", "out:1"]) as is_claimed_b:
+                assert not is_claimed_b
+            assert len(_lease_files(lease_directory)) == 2
+
+        assert _lease_files(lease_directory) == []
+        with worker_b.claim(["sub:2", "out:1"]) as is_claimed_b:
+            assert is_claimed_b
+
+    def test_claim_releases_on_error(self, lease_directory: str):
+        worker = _worker(lease_directory, "a")
+        try_acquire = worker._try_acquire
+
+        def _try_acquire(key: str) -> bool:
+            if key == "out:1":
+                raise OSError("lease directory is unavailable")
+            return try_acquire(key)
+
+        with patch.object(worker, "_try_acquire", new=_try_acquire):
+            with pytest.raises(OSError, match="unavailable"):
+                with worker.claim(["sub:1", "out:1"]):
+                    pass
+
+        assert _lease_files(lease_directory) == []
+
+    def test_expired_lease_is_claimed(self, lease_directory: str):
+        worker_a = _worker(lease_directory, "a")
+        worker_b = _worker(lease_directory, "b")
+
+        with worker_a.claim(["sub:1"]):
+            # Worker a stopped renewing an hour ago
+            (lease_path,) = _lease_files(lease_directory)
+            os.utime(lease_path, (0, os.stat(lease_path).st_mtime - 60 * 60))
+
+            with worker_b.claim(["sub:1"]) as is_claimed:
+                assert is_claimed
+
+                # Worker a notices it lost the lease, and does not release worker b's
+                worker_a.renew()
+
+            assert _lease_files(lease_directory) == []
+
+    def test_renew_keeps_lease(self, lease_directory: str):
+        worker_a = _worker(lease_directory, "a")
+        worker_b = _worker(lease_directory, "b")
+
+        with worker_a.claim(["sub:1"]):
+            (lease_path,) = _lease_files(lease_directory)
+            os.utime(lease_path, (0, os.stat(lease_path).st_mtime - 60 * 60))
+            worker_a.renew()
+
+            with worker_b.claim(["sub:1"]) as is_claimed:
+                assert not is_claimed
@@ -0,0 +1,171 @@
+import io
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.config.defaults import DEFAULT_FFMPEG_PATH
+from ytdl_sub.config.defaults import DEFAULT_FFPROBE_PATH
+from ytdl_sub.entries.entry import Entry
+from ytdl_sub.utils.ffmpeg import FFMPEG
+from ytdl_sub.utils.file_handler import DirectoryFileIndex
+from ytdl_sub.utils.thumbnail import FFMPEGThumbnailConverter
+from ytdl_sub.utils.thumbnail import PillowThumbnailConverter
+from ytdl_sub.utils.thumbnail import ThumbnailCache
+from ytdl_sub.utils.thumbnail import ThumbnailConverter
+from ytdl_sub.utils.thumbnail import download_and_convert_url_thumbnail
+from ytdl_sub.utils.thumbnail import try_convert_download_thumbnail
+
+Image = pytest.importorskip("PIL.Image")
+
+
+@pytest.fixture
+def webp_thumbnail(tmp_path: Path) -> Path:
+    thumbnail_path = tmp_path / "thumbnail.webp"
+    Image.new("RGBA", (16, 9), color=(255, 0, 0, 128)).save(thumbnail_path, format="WEBP")
+    return thumbnail_path
+
+
+@pytest.fixture
+def thumbnail_backend():
+    FFMPEG.set_paths(ffmpeg_path=DEFAULT_FFMPEG_PATH, ffprobe_path=DEFAULT_FFPROBE_PATH)
+    yield
+    ThumbnailConverter.set_backend(None)
+
+
+def _assert_is_jpg(path: Path) -> None:
+    with Image.open(path) as image:
+        assert image.format == "JPEG"
+        assert image.size == (16, 9)
+
+
+class TestThumbnailConverter:
+    def test_defaults_to_pillow(self, thumbnail_backend):
+        ThumbnailConverter.set_backend(None)
+        assert ThumbnailConverter.backend() is PillowThumbnailConverter
+
+    @pytest.mark.parametrize("backend", [PillowThumbnailConverter, FFMPEGThumbnailConverter])
+    def test_convert_file(self, thumbnail_backend, backend, webp_thumbnail: Path, tmp_path: Path):
+        ThumbnailConverter.set_backend(backend)
+        output_path = tmp_path / "thumbnail.jpg"
+
+        ThumbnailConverter.convert_file(
+            input_path=str(webp_thumbnail), output_path=str(output_path)
+        )
+        _assert_is_jpg(output_path)
+
+    @pytest.mark.parametrize("backend", [PillowThumbnailConverter, FFMPEGThumbnailConverter])
+    def test_convert_stream(self, thumbnail_backend, backend, webp_thumbnail: Path, tmp_path: Path):
+        ThumbnailConverter.set_backend(backend)
+        output_path = tmp_path / "thumbnail.jpg"
+
+        with open(webp_thumbnail, "rb") as thumbnail_file:
+            stream = io.BytesIO(thumbnail_file.read())
+
+        ThumbnailConverter.convert_stream(stream=stream, output_path=str(output_path))
+        _assert_is_jpg(output_path)
+
+
+@pytest.fixture
+def thumbnail_server(webp_thumbnail: Path):
+    """
+    Local stand-in for a thumbnail host that supports ETag revalidation
+    """
+    content = webp_thumbnail.read_bytes()
+    requests: List[int] = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # pylint: disable=invalid-name
+            if self.headers.get("If-None-Match") == '"v1"':
+                requests.append(304)
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            requests.append(200)
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/avatar.webp", requests
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestThumbnailCache:
+    def test_conditional_refresh(self, thumbnail_backend, thumbnail_server, tmp_path: Path):
+        thumbnail_url, requests = thumbnail_server
+        ThumbnailCache.set_directory(str(tmp_path / "cache"))
+        output_path = tmp_path / "output" / "poster.jpg"
+
+        try:
+            with patch.object(
+                ThumbnailConverter, "convert_stream", wraps=ThumbnailConverter.convert_stream
+            ) as mock_convert:
+                assert download_and_convert_url_thumbnail(thumbnail_url, str(output_path))
+                assert requests == [200]
+                _assert_is_jpg(output_path)
+                output_path.unlink()
+
+                # Within the TTL, no request is made at all
+                assert download_and_convert_url_thumbnail(thumbnail_url, str(output_path))
+                assert requests == [200]
+                _assert_is_jpg(output_path)
+
+                # After the TTL, revalidate and reuse the cached conversion
+                with patch.object(ThumbnailCache, "_TTL_SEC", 0):
+                    assert download_and_convert_url_thumbnail(thumbnail_url, str(output_path))
+                assert requests == [200, 304]
+                _assert_is_jpg(output_path)
+
+            assert mock_convert.call_count == 1
+        finally:
+            ThumbnailCache.set_directory(None)
+
+
+class TestTryConvertDownloadThumbnail:
+    @pytest.mark.parametrize("backend", [PillowThumbnailConverter, FFMPEGThumbnailConverter])
+    def test_converted_thumbnail_is_indexed(
+        self, thumbnail_backend, backend, webp_thumbnail: Path, tmp_path: Path
+    ):
+        ThumbnailConverter.set_backend(backend)
+        DirectoryFileIndex.invalidate()
+
+        entry = Entry(
+            entry_dict={
+                "id": "abc",
+                "epoch": 1596878400,
+                "extractor": "xyz",
+                "extractor_key": "xyz",
+                "title": "Title",
+                "ext": "mp4",
+                "upload_date": "20200808",
+                "thumbnail": "https://example.com/thumb.webp",
+                "webpage_url": "https://example.com/abc",
+            },
+            working_directory=str(tmp_path),
+        ).initialize_script()
+        webp_thumbnail.rename(tmp_path / "abc.webp")
+
+        # Index the working directory before converting, like during a download
+        assert not entry.is_thumbnail_downloaded()
+        try_convert_download_thumbnail(entry)
+
+        assert entry.is_thumbnail_downloaded()
+        assert not (tmp_path / "abc.webp").exists()
+        _assert_is_jpg(tmp_path / "abc.jpg")
+        DirectoryFileIndex.invalidate()
@@ -1,15 +1,50 @@
 import os
 import re
 import tempfile
+from pathlib import Path
+from typing import Dict
+from unittest.mock import patch
 
 import pytest
+import yaml
 
+from ytdl_sub.utils import yaml as ytdl_sub_yaml
 from ytdl_sub.utils.exceptions import FileNotFoundException
 from ytdl_sub.utils.exceptions import InvalidYamlException
 from ytdl_sub.utils.file_handler import FileHandler
+from ytdl_sub.utils.yaml import dump_yaml
 from ytdl_sub.utils.yaml import load_yaml
 
 
+def _subscriptions_dict() -> Dict:
+    return {
+        "__preset__": {
+            "overrides": {"tv_show_directory": "/tv_shows", "music_directory": "/music"}
+        },
+        "Jellyfin TV Show by Date": {
+            "= Documentaries": {
+                f"Channel {idx}": {
+                    "url": f"https://www.youtube.com/@channel_{idx}",
+                    "overrides": {
+                        "tv_show_name": f"Channel {idx}",
+                        "only_recent_date_range": f"{idx % 12 + 1}months",
+                        "download_index": idx,
+                        "enabled": idx % 2 == 0,
+                    },
+                }
+                for idx in range(100)
+            }
+        },
+    }
+
+
+@pytest.fixture
+def subscriptions_file_path(tmp_path: Path) -> Path:
+    file_path = tmp_path / "subscriptions.yaml"
+    file_path.write_text(dump_yaml(_subscriptions_dict()), encoding="utf-8")
+    return file_path
+
+
 @pytest.fixture
 def bad_yaml() -> str:
     return """
@@ -88,3 +123,18 @@ def test_empty_yaml_only_int(single_int_file_path: str):
         match=re.escape(f"'{single_int_file_path}' was specified but does not contain any YAML."),
     ):
         load_yaml(file_path=single_int_file_path)
+
+
+def test_uses_libyaml_when_available():
+    if not yaml.__with_libyaml__:
+        pytest.skip("PyYAML was built without libyaml")
+
+    assert ytdl_sub_yaml._SafeLoader is yaml.CSafeLoader
+    assert ytdl_sub_yaml._SafeDumper is yaml.CSafeDumper
+
+
+def test_load_subscriptions(subscriptions_file_path: Path):
+    assert load_yaml(file_path=subscriptions_file_path) == _subscriptions_dict()
+
+    with patch.object(ytdl_sub_yaml, "_SafeLoader", yaml.SafeLoader):
+        assert load_yaml(file_path=subscriptions_file_path) == _subscriptions_dict()